@@ -20,7 +20,8 @@ __description__ = "Sistema de Consulta de Lengua de Señas Ecuatoriano"
 
 # Importaciones principales para facilitar el uso del paquete
 from .database.signs_database import SignsDatabase, SignEntry
-from .core.sign_processor import SignProcessor, get_processor
+from .core.sign_processor import SignProcessor, create_session_processor, get_processor
+from .core.async_processor import AsyncSignProcessor
 from .audio.speech_engine import get_speech_engine, get_voice_recognition
 from .utils.config_utils import get_runtime_config, SystemConfig
 
@@ -28,7 +29,9 @@ __all__ = [
     'SignsDatabase',
     'SignEntry', 
     'SignProcessor',
+    'AsyncSignProcessor',
     'get_processor',
+    'create_session_processor',
     'get_speech_engine',
     'get_voice_recognition',
     'get_runtime_config',
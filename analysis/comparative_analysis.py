@@ -26,7 +26,8 @@ from plotly.subplots import make_subplots
 import warnings
 warnings.filterwarnings('ignore')
 
-from database.signs_database import SignsDatabase, SignEntry
+from database.signs_database import SignEntry
+from database.storage import SignsBackend
 
 
 class ComparativeAnalyzer:
@@ -37,7 +38,7 @@ class ComparativeAnalyzer:
     de similitudes entre diferentes lenguajes de señas.
     """
     
-    def __init__(self, database: SignsDatabase):
+    def __init__(self, database: SignsBackend):
         """
         Inicializa el analizador comparativo.
         
@@ -46,7 +47,7 @@ class ComparativeAnalyzer:
         """
         self.database = database
         self.common_words = self.database.get_common_words()
-        self.languages = list(self.database.signs.keys())
+        self.languages = self.database.get_languages()
         
         # Configurar estilo de matplotlib
         plt.style.use('seaborn-v0_8')
@@ -61,17 +62,16 @@ class ComparativeAnalyzer:
         """
         data = []
         
-        for word in self.common_words:
-            for language in self.languages:
-                sign_entry = self.database.search_exact(word, language)
-                if sign_entry:
-                    data.append({
-                        'palabra': word,
-                        'idioma': language,
-                        'descripcion': sign_entry.instructions,
-                        'longitud': len(sign_entry.instructions),
-                        'categoria': sign_entry.category
-                    })
+        # Una sola búsqueda en bloque para toda la tabla palabra × idioma
+        lookup = self.database.search_many(self.common_words, self.languages)
+        for word, language, sign_entry in lookup.iter_hits():
+            data.append({
+                'palabra': word,
+                'idioma': language,
+                'descripcion': sign_entry.instructions,
+                'longitud': len(sign_entry.instructions),
+                'categoria': sign_entry.category
+            })
         
         return pd.DataFrame(data)
     
@@ -569,7 +569,7 @@ class ComparativeAnalyzer:
         return report
 
 
-def get_comparative_analyzer(database: SignsDatabase) -> ComparativeAnalyzer:
+def get_comparative_analyzer(database: SignsBackend) -> ComparativeAnalyzer:
     """
     Función de utilidad para obtener una instancia del analizador comparativo.
     
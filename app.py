@@ -6,7 +6,6 @@ Desarrollado con Streamlit para una interfaz moderna y accesible.
 Autor: Signify Team
 Versión: 2.0.0"""
 
-import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -17,7 +16,10 @@ import streamlit as st
 # Importar módulos del proyecto
 from analysis.comparative_analysis import get_comparative_analyzer
 from audio.speech_engine import get_speech_engine, get_voice_recognition
-from core.sign_processor import SearchResult, get_processor
+from audio.speech_queue import PRIORITY_HIGH
+from audio.utterances import build_instruction_text, get_country
+from core.sign_processor import SearchResult, create_session_processor
+from database.normalization import fold_key
 from database.signs_database import SignEntry, SignsDatabase
 from webcam_integration import SignLanguagePredictor
 import cv2
@@ -645,11 +647,11 @@ def initialize_session_state() -> None:
     if 'current_results' not in st.session_state:
         st.session_state.current_results = []
     
-    # Inicializar el procesador de forma segura
+    # Inicializar el procesador de la sesión (los recursos pesados son compartidos)
     if 'processor' not in st.session_state:
         try:
             with st.spinner("Inicializando sistema de señas..."):
-                st.session_state.processor = get_processor()
+                st.session_state.processor = create_session_processor()
         except Exception as e:
             st.error(f"Error al inicializar el sistema: {e}")
             st.session_state.processor = None
@@ -672,7 +674,7 @@ def perform_search(query: str, search_type: str = "exact", language: str = "ecua
     
     Args:
         query: Término de búsqueda
-        search_type: Tipo de búsqueda ('exact', 'fuzzy', 'auto')
+        search_type: Tipo de búsqueda ('exact', 'fuzzy', 'auto', 'voice')
         language: Idioma en el que buscar
     
     Returns:
@@ -683,47 +685,19 @@ def perform_search(query: str, search_type: str = "exact", language: str = "ecua
     
     processor = st.session_state.processor
     
-    # Verificar si es una palabra con versiones Costa/Sierra
-    dual_version_words = ["mayo", "octubre", "noviembre"]
-    query_lower = query.lower().strip()
-    
-    if query_lower in dual_version_words and language == "ecuatoriano":
-        # Buscar ambas versiones (Costa y Sierra)
-        costa_query = f"{query} (Costa)"
-        sierra_query = f"{query} (Sierra)"
-        
-        costa_result = processor.search_sign(costa_query, include_similar=False, language=language)
-        sierra_result = processor.search_sign(sierra_query, include_similar=False, language=language)
-        
-        # Crear un resultado combinado
-        combined_result = SearchResult(query=query, found=False)
-        
-        if costa_result.found or sierra_result.found:
-            combined_result.found = True
-            # Agregar ambas versiones como coincidencias similares para mostrarlas
-            if costa_result.found:
-                combined_result.similar_matches.append((costa_result.exact_match, 1.0))
-            if sierra_result.found:
-                combined_result.similar_matches.append((sierra_result.exact_match, 1.0))
-            
-            # Usar la primera versión encontrada como coincidencia exacta
-            if costa_result.found:
-                combined_result.exact_match = costa_result.exact_match
-            elif sierra_result.found:
-                combined_result.exact_match = sierra_result.exact_match
-        
-        results = combined_result
+    # Las variantes regionales (Costa/Sierra) llegan en results.variants
+    if search_type == "exact":
+        # Búsqueda exacta solamente
+        results = processor.search_sign(query, include_similar=False, language=language)
+    elif search_type == "fuzzy":
+        # Búsqueda con similares
+        results = processor.search_sign(query, include_similar=True, language=language)
+    elif search_type == "voice":
+        # Transcripción: una frase completa se traduce a su secuencia de señas
+        results = processor.search_transcript(query, language=language)
     else:
-        # Búsqueda normal
-        if search_type == "exact":
-            # Búsqueda exacta solamente
-            results = processor.search_sign(query, include_similar=False, language=language)
-        elif search_type == "fuzzy":
-            # Búsqueda con similares
-            results = processor.search_sign(query, include_similar=True, language=language)
-        else:
-            # Búsqueda automática: incluye similares por defecto
-            results = processor.search_sign(query, include_similar=True, language=language)
+        # Búsqueda automática: incluye similares por defecto
+        results = processor.search_sign(query, include_similar=True, language=language)
     
     # Actualizar historial si es una nueva búsqueda
     if query not in st.session_state.search_history:
@@ -946,6 +920,12 @@ def _render_exact_search_tab() -> None:
             key="language_selector"
         )
     
+    # Sugerencias de autocompletado para lo que se ha escrito
+    if query and st.session_state.processor:
+        suggestions = st.session_state.processor.autocomplete(query, language)
+        if suggestions:
+            st.caption("Sugerencias: " + ", ".join(suggestions))
+    
     col3, col4, col5, col6 = st.columns([1, 1, 1, 1])
     with col3:
         if st.button("🔍 Buscar", key="exact_btn"):
@@ -1067,16 +1047,16 @@ def _handle_voice_search(language: str = "ecuatoriano") -> None:
                 cleaned_text = recognized_text.strip()
                 st.success(f"Reconocido: {recognized_text}")
                 
-                # Intentar primero búsqueda exacta
-                results = perform_search(cleaned_text, "exact", language)
-                if not results.found:
-                    # Si no se encuentra exacta, intentar con fuzzy para obtener sugerencias
-                    results = perform_search(cleaned_text, "fuzzy", language)
-                    if results.found:
-                        st.info(f"Búsqueda aproximada encontrada para: {cleaned_text}")
-                    else:
-                        # Asegurar que se incluyan sugerencias incluso si no hay coincidencias exactas
-                        st.info(f"No se encontraron coincidencias exactas para: {cleaned_text}")
+                # Palabra o frase completa (traducida a su secuencia de señas)
+                results = perform_search(cleaned_text, "voice", language)
+                if results.phrase:
+                    found_count = sum(segment.found for segment in results.phrase)
+                    st.info(f"Frase traducida: {found_count} de {len(results.phrase)} partes con seña")
+                elif results.rewrites:
+                    st.info(f"Búsqueda aproximada encontrada para: {cleaned_text}")
+                elif not results.found:
+                    # Las sugerencias similares se muestran con el resultado
+                    st.info(f"No se encontraron coincidencias exactas para: {cleaned_text}")
                 
                 # Actualizar los resultados en la sesión para mostrar sugerencias
                 st.session_state.current_results = results
@@ -1089,7 +1069,9 @@ def _handle_voice_search(language: str = "ecuatoriano") -> None:
 
 def _play_search_results_audio(results: SearchResult, language: str = "ecuatoriano") -> None:
     """
-    Reproduce audio de los resultados de búsqueda en segundo plano.
+    Encola el audio de los resultados de búsqueda en la cola de voz.
+    
+    El enunciado reemplaza la voz pendiente o en curso de búsquedas anteriores.
     
     Args:
         results: Resultado de búsqueda (SearchResult)
@@ -1106,60 +1088,36 @@ def _play_search_results_audio(results: SearchResult, language: str = "ecuatoria
         st.error("Procesador no inicializado")
         return
     
-    # Obtener referencia al speech_engine ANTES del threading
     speech_engine = st.session_state.processor.speech_engine
     
     try:
         if results.found and results.exact_match:
             # Reproducir resultado exacto
-            def play_audio():
-                try:
-                    speech_engine.speak_sign_instruction(
-                        results.exact_match.word, 
-                        results.exact_match.instructions,
-                        language
-                    )
-                except Exception as e:
-                    print(f"Error reproduciendo audio: {e}")
+            speech_engine.speak_sign_instruction(
+                results.exact_match.word, 
+                results.exact_match.instructions,
+                language
+            )
             
-            threading.Thread(target=play_audio, daemon=True).start()
+        elif any(segment.found for segment in results.phrase):
+            # Reproducir en orden las señas de la frase
+            st.session_state.processor.speak_phrase(results.phrase)
             
         elif results.similar_matches:
             # Reproducir mejor coincidencia similar
             best_match, similarity = results.similar_matches[0]
             
-            def play_similar_audio():
-                try:
-                    # Mapeo de idiomas a países
-                    language_country_map = {
-                        "ecuatoriano": "Ecuador",
-                        "chileno": "Chile", 
-                        "mexicano": "México"
-                    }
-                    
-                    country = language_country_map.get(language, "Ecuador")
-                    
-                    suggestion_text = (
-                        f"No encontré exactamente '{results.query}' en lengua de señas de {country}, "
-                        f"pero encontré '{best_match.word}' que es similar. "
-                        f"La palabra '{best_match.word}' en lengua de señas de {country} se hace así: {best_match.instructions}"
-                    )
-                    speech_engine.speak_text(suggestion_text)
-                except Exception as e:
-                    print(f"Error reproduciendo audio similar: {e}")
-            
-            threading.Thread(target=play_similar_audio, daemon=True).start()
+            suggestion_text = (
+                f"No encontré exactamente '{results.query}' en lengua de señas de {get_country(language)}, "
+                f"pero encontré '{best_match.word}' que es similar. "
+                f"{build_instruction_text(best_match.word, best_match.instructions, language)}"
+            )
+            speech_engine.speak_text(suggestion_text, priority=PRIORITY_HIGH, interrupt=True)
             
         else:
             # No se encontraron resultados
-            def play_no_results():
-                try:
-                    no_results_text = f"No se encontraron resultados para '{results.query}'"
-                    speech_engine.speak_text(no_results_text)
-                except Exception as e:
-                    print(f"Error reproduciendo mensaje de no resultados: {e}")
-            
-            threading.Thread(target=play_no_results, daemon=True).start()
+            no_results_text = f"No se encontraron resultados para '{results.query}'"
+            speech_engine.speak_text(no_results_text, priority=PRIORITY_HIGH, interrupt=True)
             
     except Exception as e:
         st.error(f"Error en reproducción de audio: {str(e)}")
@@ -1182,6 +1140,72 @@ def render_results() -> None:
     _render_single_result(result, 0)
 
 
+def _render_phrase_result(result: SearchResult, index: int) -> None:
+    """
+    Renderiza una frase traducida como secuencia ordenada de señas.
+    
+    Args:
+        result: Resultado de búsqueda con los segmentos de la frase
+        index: Índice del resultado
+    """
+    st.markdown(f"""
+    <div class="search-result fade-in-up">
+        <div style="background: linear-gradient(45deg, var(--primary-color), var(--secondary-color)); 
+                    color: white; padding: 1rem; border-radius: var(--border-radius); 
+                    margin-bottom: 1rem; text-align: center; box-shadow: var(--shadow-soft);">
+            <h2 style="margin: 0; font-size: 2rem; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">
+                🗣️ {result.query} - Secuencia de Señas
+            </h2>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    for position, segment in enumerate(result.phrase, start=1):
+        if segment.sign is None:
+            message = f"{position}. Sin seña para '{segment.text}'"
+            if segment.suggestion is not None:
+                message += f" (¿quisiste decir '{segment.suggestion.word}'?)"
+            st.warning(message)
+            continue
+        
+        segment_html = f"""
+        <div class="search-result" style="margin: 1rem 0; border-left: 4px solid var(--accent-color);">
+            <h3 style="margin: 0 0 0.5rem 0; color: var(--primary-color);">
+                {position}. 🤟 {segment.sign.word}
+            </h3>
+            <div class="instructions-box">
+                <strong>Instrucciones:</strong> {segment.sign.instructions}
+            </div>
+            <div style="margin: 1rem 0;">
+                <span class="category-badge">Categoría: {segment.sign.category}</span>
+            </div>
+        </div>
+        """
+        st.markdown(segment_html, unsafe_allow_html=True)
+        if segment.rewrite is not None:
+            st.caption(f"🔄 Mostrando '{segment.sign.word}' para '{segment.text}' (por {segment.rewrite.kind})")
+    
+    if st.session_state.voice_enabled and any(segment.found for segment in result.phrase):
+        col1, col2, col3 = st.columns([1, 1, 4])
+        with col1:
+            if st.button("🔊 Reproducir frase", key=f"speak_phrase_{index}"):
+                if hasattr(st.session_state, 'processor') and st.session_state.processor:
+                    try:
+                        st.session_state.processor.speak_phrase(result.phrase)
+                    except Exception as e:
+                        print(f"Error reproduciendo frase: {e}")
+                    st.success("Reproduciendo...")
+        
+        with col2:
+            if st.button("⏹️ Detener", key=f"stop_phrase_{index}"):
+                if hasattr(st.session_state, 'processor') and st.session_state.processor:
+                    try:
+                        st.session_state.processor.speech_engine.stop_speech()
+                        st.info("Audio detenido")
+                    except Exception as e:
+                        print(f"Error deteniendo audio: {e}")
+
+
 def _render_single_result(result: SearchResult, index: int) -> None:
     """
     Renderiza un resultado individual de búsqueda.
@@ -1190,6 +1214,10 @@ def _render_single_result(result: SearchResult, index: int) -> None:
         result: Resultado de búsqueda
         index: Índice del resultado
     """
+    if result.phrase:
+        _render_phrase_result(result, index)
+        return
+    
     if not result.found:
         # Mostrar mensaje de no encontrado
         st.warning(f"No se encontraron resultados para '{result.query}'")
@@ -1244,11 +1272,8 @@ def _render_single_result(result: SearchResult, index: int) -> None:
         
         return
     
-    # Verificar si es una búsqueda de versiones duales (Costa y Sierra)
-    dual_version_words = ["mayo", "octubre", "noviembre"]
-    query_lower = result.query.lower().strip()
-    
-    if query_lower in dual_version_words and len(result.similar_matches) >= 2:
+    # Verificar si la seña tiene versiones regionales (Costa y Sierra)
+    if len(result.variants) >= 2:
         # Mostrar ambas versiones (Costa y Sierra) de manera especial
         st.markdown(f"""
         <div class="search-result fade-in-up">
@@ -1263,10 +1288,11 @@ def _render_single_result(result: SearchResult, index: int) -> None:
         """, unsafe_allow_html=True)
         
         # Mostrar cada versión en su propia tarjeta
-        for i, (version_sign, similarity) in enumerate(result.similar_matches):
+        for i, version_sign in enumerate(result.variants):
             # Determinar si es Costa o Sierra
-            region = "🏖️ Costa" if "(Costa)" in version_sign.word else "🏔️ Sierra"
-            region_color = "#2E86AB" if "Costa" in version_sign.word else "#A23B72"
+            is_costa = fold_key(version_sign.word)[1] == "costa"
+            region = "🏖️ Costa" if is_costa else "🏔️ Sierra"
+            region_color = "#2E86AB" if is_costa else "#A23B72"
             
             version_html = f"""
             <div class="search-result" style="margin: 1rem 0; border-left: 4px solid {region_color};">
@@ -1294,18 +1320,12 @@ def _render_single_result(result: SearchResult, index: int) -> None:
                     if st.button(f"🔊 Reproducir {region}", key=f"speak_version_{index}_{i}"):
                         # Verificar que el processor esté inicializado
                         if hasattr(st.session_state, 'processor') and st.session_state.processor:
-                            # Obtener referencia al speech_engine ANTES del threading
-                            speech_engine = st.session_state.processor.speech_engine
-                            
-                            def play_version_instruction():
-                                try:
-                                    speech_engine.speak_sign_instruction(
-                                        version_sign.word, version_sign.instructions
-                                    )
-                                except Exception as e:
-                                    print(f"Error reproduciendo instrucción: {e}")
-                            
-                            threading.Thread(target=play_version_instruction, daemon=True).start()
+                            try:
+                                st.session_state.processor.speech_engine.speak_sign_instruction(
+                                    version_sign.word, version_sign.instructions, version_sign.language
+                                )
+                            except Exception as e:
+                                print(f"Error reproduciendo instrucción: {e}")
                             st.success(f"Reproduciendo versión {region}...")
                 
                 with col2:
@@ -1349,6 +1369,10 @@ def _render_single_result(result: SearchResult, index: int) -> None:
     """
     st.markdown(result_html, unsafe_allow_html=True)
     
+    if result.rewrites:
+        applied = ", ".join(rewrite.kind for rewrite in result.rewrites)
+        st.caption(f"🔄 Mostrando '{best_match.word}' para '{result.query}' (por {applied})")
+    
     # Botones para reproducir y detener audio
     if st.session_state.voice_enabled:
         col1, col2, col3 = st.columns([1, 1, 4])
@@ -1356,18 +1380,12 @@ def _render_single_result(result: SearchResult, index: int) -> None:
             if st.button(f"🔊 Reproducir", key=f"speak_{index}"):
                 # Verificar que el processor esté inicializado
                 if hasattr(st.session_state, 'processor') and st.session_state.processor:
-                    # Obtener referencia al speech_engine ANTES del threading
-                    speech_engine = st.session_state.processor.speech_engine
-                    
-                    def play_instruction():
-                        try:
-                            speech_engine.speak_sign_instruction(
-                                best_match.word, best_match.instructions
-                            )
-                        except Exception as e:
-                            print(f"Error reproduciendo instrucción: {e}")
-                    
-                    threading.Thread(target=play_instruction, daemon=True).start()
+                    try:
+                        st.session_state.processor.speech_engine.speak_sign_instruction(
+                            best_match.word, best_match.instructions, best_match.language
+                        )
+                    except Exception as e:
+                        print(f"Error reproduciendo instrucción: {e}")
                     st.success("Reproduciendo...")
         
         with col2:
@@ -1425,18 +1443,12 @@ def _show_random_sign() -> None:
         st.markdown(result_html, unsafe_allow_html=True)
         
         if st.session_state.voice_enabled:
-            # Obtener referencia al speech_engine ANTES del threading
-            speech_engine = st.session_state.processor.speech_engine
-            
-            def play_random_sign():
-                try:
-                    speech_engine.speak_sign_instruction(
-                        sign.word, sign.instructions
-                    )
-                except Exception as e:
-                    print(f"Error reproduciendo seña aleatoria: {e}")
-            
-            threading.Thread(target=play_random_sign, daemon=True).start()
+            try:
+                st.session_state.processor.speech_engine.speak_sign_instruction(
+                    sign.word, sign.instructions, sign.language
+                )
+            except Exception as e:
+                print(f"Error reproduciendo seña aleatoria: {e}")
 
 
 def _show_multiple_random_signs() -> None:
@@ -0,0 +1,175 @@
+"""
+Paquete de Audio Prerenderizado
+
+Un paquete de audio son dos archivos en el directorio de datos:
+``signs_audio.pack`` con el audio de todos los enunciados concatenado y
+``signs_audio.index.json`` con, para cada clave de caché (ver
+``audio.tts_cache.make_cache_key``), su desplazamiento y longitud dentro del
+paquete. Lo genera ``python -m audio.prerender`` y lo consulta el motor de
+voz antes de sintetizar.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+PACK_FORMAT_VERSION = 1
+AUDIO_PACK_NAME = "signs_audio"
+PACK_EXTENSION = ".pack"
+INDEX_EXTENSION = ".index.json"
+
+
+def get_default_pack_directory() -> Path:
+    """
+    Obtiene el directorio por defecto del paquete de audio.
+
+    Returns:
+        Directorio de datos del proyecto
+    """
+    from utils.file_utils import get_data_directory
+
+    return get_data_directory()
+
+
+def get_pack_paths(directory: Optional[Union[str, Path]] = None) -> Tuple[Path, Path]:
+    """
+    Obtiene las rutas del paquete y de su índice.
+
+    Args:
+        directory: Directorio del paquete (por defecto, el directorio de datos)
+
+    Returns:
+        Tupla (ruta del paquete, ruta del índice)
+    """
+    directory = Path(directory) if directory is not None else get_default_pack_directory()
+    return (directory / f"{AUDIO_PACK_NAME}{PACK_EXTENSION}",
+            directory / f"{AUDIO_PACK_NAME}{INDEX_EXTENSION}")
+
+
+class AudioPack:
+    """
+    Lector de un paquete de audio prerenderizado. Es seguro entre hilos.
+
+    Mantiene abierto el archivo del paquete, de modo que reemplazarlo con un
+    paquete nuevo no afecta a las lecturas del proceso en curso.
+    """
+
+    def __init__(self, pack_path: Union[str, Path], index: Dict[str, Any]) -> None:
+        """
+        Inicializa el lector.
+
+        Args:
+            pack_path: Ruta del archivo del paquete
+            index: Índice ya leído del paquete
+        """
+        self.pack_path = Path(pack_path)
+        self.engine = index.get("engine")
+        self.entries: Dict[str, Dict[str, Any]] = index.get("entries", {})
+        self._file = open(self.pack_path, "rb")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, directory: Optional[Union[str, Path]] = None) -> Optional["AudioPack"]:
+        """
+        Abre el paquete de un directorio si existe y es coherente con su índice.
+
+        Args:
+            directory: Directorio del paquete (por defecto, el directorio de datos)
+
+        Returns:
+            AudioPack o None si no hay paquete o está incompleto
+        """
+        pack_path, index_path = get_pack_paths(directory)
+        if not pack_path.exists() or not index_path.exists():
+            return None
+
+        try:
+            with open(index_path, "r", encoding="utf-8") as file:
+                index = json.load(file)
+            if index.get("version") != PACK_FORMAT_VERSION or index.get("pack_size") != pack_path.stat().st_size:
+                print("⚠️ El paquete de audio no coincide con su índice; se ignorará")
+                return None
+            return cls(pack_path, index)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ No se pudo abrir el paquete de audio: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Obtiene el audio de un enunciado.
+
+        Args:
+            key: Clave de caché del enunciado
+
+        Returns:
+            Bytes del audio o None si el enunciado no está en el paquete
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        with self._lock:
+            self._file.seek(entry["offset"])
+            return self._file.read(entry["length"])
+
+    def close(self) -> None:
+        """Cierra el archivo del paquete."""
+        with self._lock:
+            self._file.close()
+
+    def __contains__(self, key: object) -> bool:
+        """Indica si el paquete contiene una clave."""
+        return key in self.entries
+
+    def __len__(self) -> int:
+        """Retorna el número de enunciados del paquete."""
+        return len(self.entries)
+
+
+def write_audio_pack(items: Iterable[Tuple[str, Dict[str, Any], bytes]], engine: str,
+                     directory: Optional[Union[str, Path]] = None) -> Tuple[Path, int]:
+    """
+    Escribe un paquete de audio y su índice de forma atómica.
+
+    Args:
+        items: Tuplas (clave, metadatos del enunciado, bytes del audio)
+        engine: Motor y versión con que se sintetizó el audio
+        directory: Directorio del paquete (por defecto, el directorio de datos)
+
+    Returns:
+        Tupla (ruta del paquete, número de enunciados)
+    """
+    pack_path, index_path = get_pack_paths(directory)
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    temp_index: Optional[str] = None
+    file_descriptor, temp_pack = tempfile.mkstemp(dir=str(pack_path.parent), suffix=".tmp")
+    try:
+        offset = 0
+        with os.fdopen(file_descriptor, "wb") as file:
+            for key, metadata, data in items:
+                if key in entries:
+                    continue
+                file.write(data)
+                entries[key] = {**metadata, "offset": offset, "length": len(data)}
+                offset += len(data)
+
+        index = {"version": PACK_FORMAT_VERSION, "engine": engine, "pack_size": offset, "entries": entries}
+        file_descriptor, temp_index = tempfile.mkstemp(dir=str(pack_path.parent), suffix=".tmp")
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump(index, file, ensure_ascii=False, separators=(",", ":"))
+
+        os.replace(temp_pack, pack_path)
+        os.replace(temp_index, index_path)
+    finally:
+        for temp_path in (temp_pack, temp_index):
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    return pack_path, len(entries)
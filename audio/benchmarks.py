@@ -0,0 +1,111 @@
+"""
+Pruebas de Rendimiento de los Backends de Síntesis de Voz.
+
+Mide la latencia de ``synthesize`` de cada backend sobre los enunciados
+reales de instrucciones de señas (los mismos que reproduce
+``SpeechEngine.speak_sign_instruction``). Los backends cuya dependencia no
+está instalada, o que fallan (gTTS sin red), se omiten.
+
+Uso:
+    python -m audio.benchmarks [--backends gtts stub] [--utterances N]
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import argparse
+import random
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Any, Dict, List, Optional, Sequence
+
+from audio.prerender import collect_utterances
+from audio.tts_backends import TTS_BACKENDS, StubBackend, create_tts_backend
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Percentil por el método del rango más cercano sobre valores ordenados."""
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def benchmark_tts_backends(backends: Sequence[str] = tuple(TTS_BACKENDS),
+                           num_utterances: int = 50, seed: int = 7,
+                           database: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """
+    Compara la latencia de síntesis de los backends con el corpus real.
+
+    Todos los backends sintetizan la misma muestra de enunciados, en el
+    mismo orden y sin caché.
+
+    Args:
+        backends: Nombres de los backends a comparar
+        num_utterances: Enunciados de la muestra (0 para todos)
+        seed: Semilla de la muestra
+        database: SignsDatabase en memoria (por defecto, una nueva desde los CSV)
+
+    Returns:
+        Lista de diccionarios con los resultados por backend
+    """
+    if database is None:
+        from database.signs_database import SignsDatabase
+
+        with redirect_stdout(StringIO()):
+            database = SignsDatabase()
+
+    texts = [utterance.text for utterance in collect_utterances(database, StubBackend())]
+    if 0 < num_utterances < len(texts):
+        texts = random.Random(seed).sample(texts, num_utterances)
+    print(f"📊 {len(texts)} enunciados, {sum(len(text) for text in texts) / len(texts):.0f} caracteres de media")
+
+    results = []
+    for name in backends:
+        start = time.perf_counter()
+        try:
+            backend = create_tts_backend(name)
+        except ImportError as e:
+            print(f"⚠️ {name}: dependencia no instalada ({e}); se omite")
+            continue
+        init_ms = (time.perf_counter() - start) * 1000
+
+        latencies = []
+        total_bytes = 0
+        try:
+            for text in texts:
+                start = time.perf_counter()
+                total_bytes += len(backend.synthesize(text))
+                latencies.append((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            print(f"⚠️ {name}: error de síntesis ({e}); se omite")
+            continue
+
+        latencies.sort()
+        row = {
+            "backend": name,
+            "version": backend.version,
+            "utterances": len(latencies),
+            "init_ms": init_ms,
+            "mean_ms": sum(latencies) / len(latencies),
+            "p50_ms": _percentile(latencies, 0.50),
+            "p95_ms": _percentile(latencies, 0.95),
+            "max_ms": latencies[-1],
+            "mean_kb": total_bytes / len(latencies) / 1024,
+        }
+        results.append(row)
+        print(
+            f"📊 {name:>8}: media {row['mean_ms']:8.2f} ms | p50 {row['p50_ms']:8.2f} ms | "
+            f"p95 {row['p95_ms']:8.2f} ms | máx {row['max_ms']:8.2f} ms | "
+            f"inicio {row['init_ms']:7.1f} ms | {row['mean_kb']:6.1f} KB/enunciado"
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara la latencia de los backends de síntesis")
+    parser.add_argument("--backends", nargs="+", choices=list(TTS_BACKENDS), default=list(TTS_BACKENDS),
+                        help="Backends a comparar (por defecto, todos)")
+    parser.add_argument("--utterances", type=int, default=50, help="Enunciados de la muestra (0 para todos)")
+    arguments = parser.parse_args()
+    benchmark_tts_backends(arguments.backends, arguments.utterances)
@@ -0,0 +1,190 @@
+"""
+Prerenderizado del Audio de las Instrucciones de Señas
+
+Los enunciados de ``SpeechEngine.speak_sign_instruction`` dependen solo de
+las filas de los CSV y del mapa de países, así que pueden sintetizarse por
+adelantado. Este comando recorre todas las señas de todos los idiomas,
+sintetiza en paralelo los enunciados que falten y escribe un paquete de
+audio con su índice (ver ``audio.audio_pack``), de modo que la reproducción
+en producción nunca espera a la síntesis.
+
+Es reanudable: cada enunciado sintetizado se guarda de inmediato en un
+directorio de preparación bajo ``get_cache_directory()``, y los enunciados
+que ya están en el paquete actual o en la preparación no se vuelven a
+sintetizar. Los enunciados obsoletos (instrucciones editadas o eliminadas)
+no pasan al paquete nuevo.
+
+Uso:
+    python -m audio.prerender [--workers N] [--output DIRECTORIO] [--backend NOMBRE]
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from audio.audio_pack import AudioPack, write_audio_pack
+from audio.tts_backends import TTS_BACKENDS, TTSBackend, create_tts_backend
+from audio.tts_cache import TTSCache, make_cache_key
+from audio.utterances import build_instruction_text
+
+# Subdirectorio de preparación dentro del directorio de caché del proyecto
+STAGING_DIRNAME = "prerender"
+
+# Síntesis simultáneas (gTTS espera sobre todo a la red)
+DEFAULT_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class Utterance:
+    """
+    Enunciado a prerenderizar.
+
+    Attributes:
+        key: Clave de caché del audio
+        text: Texto a sintetizar
+        language: Idioma de la seña
+        word: Palabra de la seña
+    """
+    key: str
+    text: str
+    language: str
+    word: str
+
+    def metadata(self) -> Dict[str, Any]:
+        """Metadatos guardados en el índice del paquete."""
+        return {"language": self.language, "word": self.word}
+
+
+def collect_utterances(database: Any, backend: TTSBackend) -> List[Utterance]:
+    """
+    Calcula los enunciados de instrucciones de todas las señas.
+
+    Args:
+        database: SignsDatabase en memoria con todos los idiomas cargados
+        backend: Backend de síntesis (su idioma, voz y versión forman la clave)
+
+    Returns:
+        Enunciados únicos en orden de idioma y de carga
+    """
+    utterances: Dict[str, Utterance] = {}
+    for language in database.get_languages():
+        for sign_entry in database.signs[language].values():
+            text = build_instruction_text(sign_entry.word, sign_entry.instructions, language)
+            key = make_cache_key(text, backend.language, backend.voice, backend.version)
+            if key not in utterances:
+                utterances[key] = Utterance(key=key, text=text, language=language, word=sign_entry.word)
+    return list(utterances.values())
+
+
+def prerender(database: Optional[Any] = None, output_dir: Optional[Union[str, Path]] = None,
+              workers: int = DEFAULT_WORKERS,
+              backend: Optional[TTSBackend] = None,
+              staging_dir: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Prerenderiza los enunciados que falten y escribe el paquete de audio.
+
+    Args:
+        database: SignsDatabase en memoria (por defecto, una nueva desde los CSV)
+        output_dir: Directorio del paquete (por defecto, el directorio de datos)
+        workers: Síntesis simultáneas
+        backend: Backend de síntesis (por defecto, ``AudioConfig.tts_backend``)
+        staging_dir: Directorio de preparación (por defecto, bajo el directorio de caché)
+
+    Returns:
+        Diccionario con enunciados totales, reutilizados, sintetizados, fallidos y tiempo
+    """
+    if database is None:
+        from database.signs_database import SignsDatabase
+
+        database = SignsDatabase()
+    if backend is None:
+        backend = create_tts_backend()
+
+    if staging_dir is None:
+        from utils.file_utils import get_cache_directory
+
+        staging_dir = get_cache_directory() / STAGING_DIRNAME
+    # Sin expulsión: la preparación solo se vacía al escribir el paquete
+    staging = TTSCache(staging_dir, max_bytes=1 << 62, max_age=0)
+
+    start_time = time.perf_counter()
+    utterances = collect_utterances(database, backend)
+    current_pack = AudioPack.open(output_dir)
+    if current_pack is not None and current_pack.engine != backend.version:
+        current_pack.close()
+        current_pack = None
+
+    pending = [
+        utterance for utterance in utterances
+        if (current_pack is None or utterance.key not in current_pack)
+        and not staging.path_for(utterance.key).exists()
+    ]
+    print(f"🔄 {len(utterances)} enunciados: {len(utterances) - len(pending)} vigentes, "
+          f"{len(pending)} por sintetizar con {backend.version} y {workers} hilos")
+
+    failures: List[Tuple[Utterance, str]] = []
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = {executor.submit(backend.synthesize, utterance.text): utterance for utterance in pending}
+        for done, future in enumerate(as_completed(futures), start=1):
+            utterance = futures[future]
+            try:
+                staging.put(utterance.key, future.result())
+            except Exception as e:
+                failures.append((utterance, str(e)))
+            if done % 25 == 0 or done == len(pending):
+                print(f"📊 {done}/{len(pending)} sintetizados")
+
+    def iter_audio() -> Iterator[Tuple[str, Dict[str, Any], bytes]]:
+        for utterance in utterances:
+            data = staging.get(utterance.key)
+            if data is None and current_pack is not None:
+                data = current_pack.get(utterance.key)
+            if data is not None:
+                yield utterance.key, utterance.metadata(), data
+
+    up_to_date = (
+        current_pack is not None and not pending
+        and set(current_pack.entries) == {utterance.key for utterance in utterances}
+    )
+    try:
+        if up_to_date:
+            pack_path, packed = current_pack.pack_path, len(current_pack)
+        else:
+            pack_path, packed = write_audio_pack(iter_audio(), backend.version, output_dir)
+    finally:
+        if current_pack is not None:
+            current_pack.close()
+
+    if not failures:
+        staging.clear()
+    for utterance, error in failures[:10]:
+        print(f"❌ {utterance.language}/{utterance.word}: {error}")
+
+    elapsed = time.perf_counter() - start_time
+    print(f"✅ Paquete de audio escrito en {pack_path}: {packed}/{len(utterances)} enunciados "
+          f"({len(failures)} fallidos, {elapsed:.1f}s)")
+    return {
+        "total": len(utterances),
+        "reused": len(utterances) - len(pending),
+        "synthesized": len(pending) - len(failures),
+        "failed": len(failures),
+        "packed": packed,
+        "elapsed": elapsed,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prerenderiza el audio de las instrucciones de señas")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Síntesis simultáneas")
+    parser.add_argument("--output", default=None, help="Directorio del paquete (por defecto, data/)")
+    parser.add_argument("--backend", choices=list(TTS_BACKENDS), default=None,
+                        help="Backend de síntesis (por defecto, el de AudioConfig)")
+    arguments = parser.parse_args()
+    prerender(output_dir=arguments.output, workers=arguments.workers,
+              backend=create_tts_backend(arguments.backend))
@@ -1,57 +1,58 @@
 """
 Motor de Síntesis de Voz para Señas Ecuatorianas
 
-Integra funcionalidades de texto a voz y reconocimiento de voz usando
-gTTS para síntesis y Whisper para reconocimiento de voz.
+Integra funcionalidades de texto a voz y reconocimiento de voz usando un
+backend de síntesis intercambiable (ver ``audio.tts_backends``) y Whisper
+para reconocimiento de voz.
 
 Autor: Signify Team
 Versión: 2.0.0
 """
 
-import os
-import shutil
-import tempfile
-import threading
+import io
 from typing import Optional
 
 import numpy as np
 import pygame
 import sounddevice as sd
 import whisper
-from gtts import gTTS
+
+from audio.audio_pack import AudioPack
+from audio.speech_queue import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, SpeechRequest, create_speech_queue
+from audio.tts_backends import TTSBackend, create_tts_backend
+from audio.tts_cache import TTSCache, create_tts_cache, make_cache_key
+from audio.utterances import build_instruction_text, get_country
 
 
 class SpeechEngine:
     """
-    Motor de síntesis de voz usando gTTS y pygame.
+    Motor de síntesis de voz usando un backend de síntesis y pygame.
     
     Proporciona funcionalidades para convertir texto a voz y reproducir
-    audio de forma síncrona o asíncrona.
+    audio de forma síncrona o asíncrona. Toda la reproducción pasa por una
+    única ``SpeechQueue``, cuyo hilo es el único que usa el mezclador.
     """
     
-    def __init__(self, language: str = "es") -> None:
+    def __init__(self, language: str = "es", tts_cache: Optional[TTSCache] = None,
+                 audio_pack: Optional[AudioPack] = None,
+                 backend: Optional[TTSBackend] = None) -> None:
         """
         Inicializa el motor de voz.
         
         Args:
             language: Código de idioma para TTS (por defecto español)
+            tts_cache: Caché persistente del audio sintetizado (None para no guardar)
+            audio_pack: Paquete de audio prerenderizado (None si no hay)
+            backend: Backend de síntesis (por defecto, ``AudioConfig.tts_backend``)
         """
         self.language = language
-        self.temp_dir = self._create_temp_directory()
+        self.backend = backend or create_tts_backend(language=language)
+        self.tts_cache = tts_cache
+        self.audio_pack = audio_pack
         self._init_pygame()
+        self.speech_queue = create_speech_queue(self._speak_sync, self._stop_playback)
         self._is_initialized = True
     
-    def _create_temp_directory(self) -> str:
-        """
-        Crea directorio temporal para archivos de audio.
-        
-        Returns:
-            Ruta del directorio temporal creado
-        """
-        temp_dir = os.path.join(tempfile.gettempdir(), "signs_audio")
-        os.makedirs(temp_dir, exist_ok=True)
-        return temp_dir
-    
     def _init_pygame(self) -> None:
         """
         Inicializa pygame mixer para reproducción de audio.
@@ -67,63 +68,65 @@ class SpeechEngine:
             print(error_msg)
             raise RuntimeError(error_msg) from e
     
-    def speak_text(self, text: str, async_mode: bool = True) -> None:
+    def speak_text(self, text: str, async_mode: bool = True, priority: int = PRIORITY_NORMAL,
+                   interrupt: bool = False, timeout: Optional[float] = None) -> Optional[SpeechRequest]:
         """
-        Convierte texto a voz y lo reproduce.
+        Convierte texto a voz y lo encola para reproducirlo.
+        
+        Con la cola llena espera sitio hasta ``timeout`` segundos; la fachada
+        asíncrona hace esta llamada en su grupo de hilos de audio para no
+        bloquear el bucle de eventos durante esa espera.
         
         Args:
             text: Texto a convertir a voz
-            async_mode: Si True, reproduce en segundo plano
+            async_mode: Si True, retorna sin esperar a que termine la reproducción
+            priority: Prioridad en la cola (PRIORITY_HIGH, PRIORITY_NORMAL o PRIORITY_LOW)
+            interrupt: Si descartar los enunciados pendientes y detener el que suena
+            timeout: Segundos de espera con la cola llena (por defecto,
+                ``AudioConfig.speech_queue_timeout``)
+            
+        Returns:
+            SpeechRequest encolado o None si no se encoló
         """
         if not text or not text.strip():
-            return
+            return None
         
         if not self._is_initialized:
             print("❌ Motor de voz no inicializado")
-            return
+            return None
         
-        if async_mode:
-            thread = threading.Thread(
-                target=self._speak_sync, 
-                args=(text,),
-                daemon=True
-            )
-            thread.start()
-        else:
-            self._speak_sync(text)
+        request = self.speech_queue.submit(text, priority, interrupt, timeout)
+        if request is not None and not async_mode:
+            request.wait()
+        return request
     
-    def _speak_sync(self, text: str) -> None:
+    def _speak_sync(self, request: SpeechRequest) -> None:
         """
-        Función interna para síntesis de voz síncrona.
+        Sintetiza y reproduce un enunciado (solo desde el hilo de la cola).
+        
+        El audio nunca pasa por archivos temporales: se obtiene en memoria y
+        se entrega al mezclador como objeto de archivo, con el formato del
+        backend como pista de tipo.
         
         Args:
-            text: Texto a sintetizar y reproducir
+            request: Enunciado a sintetizar y reproducir
         """
-        temp_file = None
         try:
-            # Crear archivo temporal único
-            temp_file = os.path.join(
-                self.temp_dir, 
-                f"audio_{os.getpid()}_{threading.get_ident()}.mp3"
-            )
-            
-            # Generar audio con gTTS
-            tts = gTTS(text=text, lang=self.language, slow=False)
-            tts.save(temp_file)
-            
-            # Verificar que el archivo se creó correctamente
-            if not os.path.exists(temp_file):
-                print(f"❌ Error: No se pudo crear el archivo de audio temporal")
+            audio_buffer = io.BytesIO(self._get_audio(request.text))
+            if request.cancelled:
                 return
             
-            # Reproducir con pygame
-            pygame.mixer.music.load(temp_file)
+            # Reproducir con pygame desde memoria
+            pygame.mixer.music.load(audio_buffer, self.backend.audio_format)
             pygame.mixer.music.play()
             
             # Esperar a que termine la reproducción con timeout
             timeout_counter = 0
             max_timeout = 300  # 30 segundos máximo
             while pygame.mixer.music.get_busy() and timeout_counter < max_timeout:
+                if request.cancelled:
+                    pygame.mixer.music.stop()
+                    return
                 pygame.time.wait(100)
                 timeout_counter += 1
             
@@ -139,25 +142,51 @@ class SpeechEngine:
                 pygame.mixer.music.stop()
             except:
                 pass
-        finally:
-            # Limpiar archivo temporal
-            if temp_file:
-                self._cleanup_temp_file(temp_file)
     
-    def _cleanup_temp_file(self, file_path: str) -> None:
+    def _get_audio(self, text: str) -> bytes:
         """
-        Limpia archivos temporales de audio.
+        Obtiene el audio de un texto en memoria.
+        
+        Busca primero en el paquete prerenderizado y después en la caché
+        persistente; en un fallo sintetiza el texto y lo guarda en la caché.
         
         Args:
-            file_path: Ruta del archivo temporal a eliminar
+            text: Texto a reproducir
+            
+        Returns:
+            Bytes del audio en el formato del backend
         """
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except OSError as e:
-            print(f"⚠️ No se pudo eliminar archivo temporal: {e}")
+        key = make_cache_key(text, self.backend.language, self.backend.voice, self.backend.version)
+        
+        if self.audio_pack is not None:
+            packed_audio = self.audio_pack.get(key)
+            if packed_audio is not None:
+                return packed_audio
+        
+        if self.tts_cache is not None:
+            cached_audio = self.tts_cache.get(key)
+            if cached_audio is not None:
+                return cached_audio
+        
+        audio = self.backend.synthesize(text)
+        if self.tts_cache is not None:
+            try:
+                self.tts_cache.put(key, audio)
+            except OSError as e:
+                print(f"⚠️ No se pudo guardar el audio en caché: {e}")
+        return audio
     
-    def speak_sign_instruction(self, word: str, instructions: str, language: str = "ecuatoriano") -> None:
+    def get_cache_stats(self) -> Optional[dict]:
+        """
+        Obtiene los contadores de la caché de audio.
+        
+        Returns:
+            Diccionario de estadísticas o None si la caché está desactivada
+        """
+        return self.tts_cache.get_stats() if self.tts_cache is not None else None
+    
+    def speak_sign_instruction(self, word: str, instructions: str, language: str = "ecuatoriano",
+                               interrupt: bool = True) -> None:
         """
         Reproduce instrucciones de señas de forma estructurada con anuncio del idioma.
         
@@ -165,26 +194,17 @@ class SpeechEngine:
             word: Palabra de la seña
             instructions: Instrucciones de cómo hacer la seña
             language: Idioma de la seña (ecuatoriano, chileno, mexicano)
+            interrupt: Si reemplazar la voz pendiente o en curso
         """
         if not word or not instructions:
             return
         
-        # Mapeo de idiomas a países
-        language_country_map = {
-            "ecuatoriano": "Ecuador",
-            "chileno": "Chile", 
-            "mexicano": "México"
-        }
-        
-        country = language_country_map.get(language, "Ecuador")
-        
-        instruction_text = (
-            f"La palabra '{word}' en lengua de señas de {country} se hace así: {instructions}"
-        )
-        self.speak_text(instruction_text)
+        self.speak_text(build_instruction_text(word, instructions, language),
+                        priority=PRIORITY_HIGH, interrupt=interrupt)
     
     def speak_search_result(self, word: str, found: bool, 
-                           instructions: Optional[str] = None, language: str = "ecuatoriano") -> None:
+                           instructions: Optional[str] = None, language: str = "ecuatoriano",
+                           interrupt: bool = True) -> None:
         """
         Reproduce resultados de búsqueda con información del idioma.
         
@@ -193,25 +213,19 @@ class SpeechEngine:
             found: Si se encontró la seña
             instructions: Instrucciones de la seña (si se encontró)
             language: Idioma de la búsqueda
+            interrupt: Si reemplazar la voz pendiente o en curso
         """
         if not word:
             return
         
-        # Mapeo de idiomas a países
-        language_country_map = {
-            "ecuatoriano": "Ecuador",
-            "chileno": "Chile", 
-            "mexicano": "México"
-        }
-        
-        country = language_country_map.get(language, "Ecuador")
+        country = get_country(language)
         
         if found and instructions:
             result_text = f"Encontré la seña para '{word}' en lengua de señas de {country}: {instructions}"
         else:
             result_text = f"No encontré la seña para '{word}' en lengua de señas de {country}. Intenta con otra palabra."
         
-        self.speak_text(result_text)
+        self.speak_text(result_text, priority=PRIORITY_HIGH, interrupt=interrupt)
     
     def speak_welcome_message(self) -> None:
         """Reproduce mensaje de bienvenida."""
@@ -219,7 +233,7 @@ class SpeechEngine:
             "Bienvenido al Sistema de Señas Ecuatorianas. "
             "Puedes buscar cualquier palabra para aprender su seña correspondiente."
         )
-        self.speak_text(welcome_text)
+        self.speak_text(welcome_text, priority=PRIORITY_LOW)
     
     def speak_help_message(self) -> None:
         """Reproduce mensaje de ayuda."""
@@ -227,7 +241,7 @@ class SpeechEngine:
             "Escribe una palabra en el campo de búsqueda para encontrar su seña. "
             "También puedes usar el reconocimiento de voz para buscar palabras habladas."
         )
-        self.speak_text(help_text)
+        self.speak_text(help_text, priority=PRIORITY_LOW)
     
     def speak_category_info(self, category: str, count: int) -> None:
         """
@@ -258,7 +272,11 @@ class SpeechEngine:
         self.speak_text(random_text)
     
     def stop_speech(self) -> None:
-        """Detiene la reproducción de voz actual."""
+        """Detiene la reproducción de voz actual y descarta los enunciados pendientes."""
+        self.speech_queue.stop()
+    
+    def _stop_playback(self) -> None:
+        """Detiene el mezclador (la cola lo llama al interrumpir)."""
         try:
             pygame.mixer.music.stop()
         except pygame.error as e:
@@ -266,16 +284,27 @@ class SpeechEngine:
     
     def is_playing(self) -> bool:
         """
-        Verifica si hay audio reproduciéndose.
+        Verifica si hay audio reproduciéndose o pendiente de reproducirse.
         
         Returns:
-            True si hay audio reproduciéndose, False en caso contrario
+            True si hay audio reproduciéndose o en cola, False en caso contrario
         """
+        if self.speech_queue.is_busy():
+            return True
         try:
             return pygame.mixer.music.get_busy()
         except pygame.error:
             return False
     
+    def get_queue_stats(self) -> dict:
+        """
+        Obtiene los contadores de la cola de reproducción.
+        
+        Returns:
+            Diccionario de estadísticas de la cola
+        """
+        return self.speech_queue.get_stats()
+    
     def set_volume(self, volume: float) -> None:
         """
         Establece el volumen de reproducción.
@@ -293,19 +322,15 @@ class SpeechEngine:
     
     def cleanup(self) -> None:
         """Limpia recursos del motor de voz."""
-        self.stop_speech()
+        self.speech_queue.close()
         
         try:
             pygame.mixer.quit()
         except pygame.error:
             pass
         
-        # Limpiar directorio temporal
-        try:
-            if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-        except Exception as e:
-            print(f"⚠️ Error al limpiar directorio temporal: {e}")
+        if self.audio_pack is not None:
+            self.audio_pack.close()
         
         self._is_initialized = False
 
@@ -514,7 +539,7 @@ def get_speech_engine(language: str = "es") -> SpeechEngine:
     """
     global _speech_engine
     if _speech_engine is None:
-        _speech_engine = SpeechEngine(language)
+        _speech_engine = SpeechEngine(language, create_tts_cache(), AudioPack.open())
     return _speech_engine
 
 
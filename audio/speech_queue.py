@@ -0,0 +1,401 @@
+"""
+Cola de Reproducción de Voz
+
+Un único hilo de reproducción de larga duración consume una cola de
+enunciados ordenada por prioridad, de modo que los enunciados nunca compiten
+por el canal global ``pygame.mixer.music`` y se reproducen en un orden
+determinista (prioridad y, a igual prioridad, orden de llegada).
+
+- Interrupción: un enunciado enviado con ``interrupt=True`` descarta los
+  pendientes y detiene el que suena (una búsqueda nueva deja obsoleta la voz
+  de la anterior).
+- Deduplicación: un texto que ya está pendiente no se vuelve a encolar.
+- Contrapresión: la cola admite como máximo ``max_pending`` enunciados;
+  ``submit`` espera a que haya sitio hasta ``AudioConfig.speech_queue_timeout``
+  segundos y, si no lo hay, desplaza al pendiente menos urgente o rechaza el
+  enunciado nuevo.
+
+El mezclador se detiene siempre fuera del candado de la cola, y quien espera
+un enunciado puede registrar una función con ``add_done_callback`` en lugar
+de bloquear un hilo en ``wait``.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# Prioridades (menor valor, más urgente)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# Enunciados pendientes como máximo (sin contar el que suena)
+DEFAULT_MAX_PENDING = 8
+
+# Segundos de espera de ``submit`` con la cola llena (coincide con AudioConfig)
+DEFAULT_SUBMIT_TIMEOUT = 1.0
+
+
+@dataclass(order=True)
+class SpeechRequest:
+    """
+    Enunciado encolado.
+
+    Attributes:
+        priority: Prioridad (menor valor, más urgente)
+        sequence: Orden de llegada (desempata a igual prioridad)
+        text: Texto a reproducir
+        cancelled: Si se descartó o se detuvo su reproducción
+        done: Evento que se activa al terminar, descartarse o detenerse
+    """
+    priority: int
+    sequence: int
+    text: str = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+    done: threading.Event = field(default_factory=threading.Event, compare=False, repr=False)
+    _callbacks: List[Callable[["SpeechRequest"], None]] = field(
+        default_factory=list, compare=False, repr=False
+    )
+    _callbacks_lock: threading.Lock = field(default_factory=threading.Lock, compare=False, repr=False)
+
+    def add_done_callback(self, callback: Callable[["SpeechRequest"], None]) -> None:
+        """
+        Registra una función a llamar cuando el enunciado termine, se descarte o se detenga.
+
+        La función se llama desde el hilo que completa el enunciado (o de
+        inmediato si ya terminó), así que debe ser breve y no bloquear.
+
+        Args:
+            callback: Función que recibe el enunciado
+        """
+        with self._callbacks_lock:
+            if not self.done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _finish(self) -> None:
+        """Marca el enunciado como terminado y llama a las funciones registradas."""
+        with self._callbacks_lock:
+            if self.done.is_set():
+                return
+            self.done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"⚠️ Error en la notificación de fin de voz: {e}")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que el enunciado termine, se descarte o se detenga.
+
+        Args:
+            timeout: Segundos máximos de espera (None sin límite)
+
+        Returns:
+            True si terminó dentro del tiempo de espera
+        """
+        return self.done.wait(timeout)
+
+
+class SpeechQueue:
+    """
+    Cola de prioridad de enunciados con un único hilo de reproducción.
+
+    El hilo se crea al encolar el primer enunciado y vive hasta ``close``.
+    Es segura entre hilos.
+    """
+
+    def __init__(self, play: Callable[[SpeechRequest], None], stop_playback: Callable[[], None],
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 submit_timeout: float = DEFAULT_SUBMIT_TIMEOUT) -> None:
+        """
+        Inicializa la cola.
+
+        Args:
+            play: Reproduce un enunciado y retorna al terminar (o al cancelarse)
+            stop_playback: Detiene de inmediato la reproducción en curso (se
+                llama sin el candado de la cola)
+            max_pending: Enunciados pendientes como máximo
+            submit_timeout: Segundos de espera de ``submit`` con la cola llena
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending debe ser mayor a 0")
+        if submit_timeout < 0:
+            raise ValueError("submit_timeout no puede ser negativo")
+
+        self._play = play
+        self._stop_playback = stop_playback
+        self.max_pending = max_pending
+        self.submit_timeout = submit_timeout
+        self._heap: List[SpeechRequest] = []
+        self._pending: Dict[str, SpeechRequest] = {}
+        self._current: Optional[SpeechRequest] = None
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._playback_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self.played = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.interrupted = 0
+
+    def submit(self, text: str, priority: int = PRIORITY_NORMAL, interrupt: bool = False,
+               timeout: Optional[float] = None) -> Optional[SpeechRequest]:
+        """
+        Encola un enunciado.
+
+        Args:
+            text: Texto a reproducir
+            priority: Prioridad del enunciado (menor valor, más urgente)
+            interrupt: Si descartar los pendientes y detener el que suena
+            timeout: Segundos máximos de espera si la cola está llena (por
+                defecto, ``submit_timeout``)
+
+        Returns:
+            SpeechRequest encolado (o el pendiente idéntico), o None si se rechazó
+        """
+        if timeout is None:
+            timeout = self.submit_timeout
+
+        interrupted = None
+        with self._condition:
+            if self._closed:
+                return None
+
+            if interrupt:
+                interrupted = self._interrupt_locked()
+            else:
+                existing = self._pending.get(text)
+                if existing is not None and existing.priority <= priority:
+                    self.deduplicated += 1
+                    return existing
+                if existing is not None:
+                    # Más urgente que el pendiente idéntico: se reemplaza
+                    self._discard_locked(existing)
+
+            request = self._enqueue_locked(text, priority, timeout)
+
+        self._stop_if_current(interrupted)
+        return request
+
+    def _enqueue_locked(self, text: str, priority: int, timeout: float) -> Optional[SpeechRequest]:
+        """Espera sitio en la cola y encola el enunciado (None si se rechaza)."""
+        deadline = time.monotonic() + timeout
+        while len(self._pending) >= self.max_pending and not self._closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._condition.wait(remaining)
+
+        if self._closed:
+            return None
+
+        if len(self._pending) >= self.max_pending:
+            least_urgent = max(self._pending.values())
+            if least_urgent.priority <= priority:
+                self.dropped += 1
+                print("⚠️ Cola de voz llena: enunciado descartado")
+                return None
+            self._discard_locked(least_urgent)
+            self.dropped += 1
+
+        request = SpeechRequest(priority, next(self._sequence), text)
+        heapq.heappush(self._heap, request)
+        self._pending[text] = request
+        self._ensure_worker_locked()
+        self._condition.notify_all()
+        return request
+
+    def _discard_locked(self, request: SpeechRequest) -> None:
+        """Descarta un enunciado pendiente (se retira del montículo al extraerlo)."""
+        request.cancelled = True
+        request._finish()
+        if self._pending.get(request.text) is request:
+            del self._pending[request.text]
+
+    def _interrupt_locked(self) -> Optional[SpeechRequest]:
+        """
+        Descarta los pendientes y marca como cancelado el enunciado que suena.
+
+        Returns:
+            Enunciado a detener con ``_stop_if_current`` (None si no suena ninguno)
+        """
+        for request in list(self._pending.values()):
+            self._discard_locked(request)
+        self._heap.clear()
+        self._condition.notify_all()
+        return self._cancel_current_locked(self._current)
+
+    def _cancel_current_locked(self, request: Optional[SpeechRequest]) -> Optional[SpeechRequest]:
+        """Marca como cancelado el enunciado si es el que suena y lo retorna (None si no)."""
+        if request is None or request is not self._current or request.cancelled:
+            return None
+        request.cancelled = True
+        self.interrupted += 1
+        return request
+
+    def _stop_if_current(self, request: Optional[SpeechRequest]) -> None:
+        """
+        Detiene el mezclador si el enunciado sigue sonando.
+
+        Se llama sin el candado de la cola; ``_playback_lock`` impide que el
+        hilo empiece el enunciado siguiente mientras se detiene el anterior.
+        """
+        if request is None:
+            return
+        with self._playback_lock:
+            if self._current is request:
+                self._stop_playback()
+
+    def _ensure_worker_locked(self) -> None:
+        """Arranca el hilo de reproducción si no está vivo."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="signify-speech", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Bucle del hilo de reproducción."""
+        while True:
+            with self._condition:
+                while not self._heap and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                request = heapq.heappop(self._heap)
+                if request.cancelled:
+                    continue
+                del self._pending[request.text]
+                self._current = request
+                self._condition.notify_all()
+
+            # Espera a que termine la detención en curso del enunciado anterior
+            with self._playback_lock:
+                pass
+            try:
+                self._play(request)
+            except Exception as e:
+                print(f"❌ Error en la reproducción de voz: {e}")
+            finally:
+                with self._condition:
+                    if not request.cancelled:
+                        self.played += 1
+                    self._current = None
+                    request._finish()
+                    self._condition.notify_all()
+
+    def cancel(self, request: SpeechRequest) -> None:
+        """
+        Descarta un enunciado pendiente o detiene su reproducción.
+
+        Args:
+            request: Enunciado retornado por ``submit``
+        """
+        with self._condition:
+            playing = self._cancel_current_locked(request)
+            if request is not self._current and not request.done.is_set():
+                self._discard_locked(request)
+            self._condition.notify_all()
+        self._stop_if_current(playing)
+
+    def stop(self) -> None:
+        """Descarta los pendientes y detiene el enunciado que suena."""
+        with self._condition:
+            playing = self._interrupt_locked()
+        self._stop_if_current(playing)
+
+    def is_busy(self) -> bool:
+        """
+        Indica si hay un enunciado sonando o pendiente.
+
+        Returns:
+            True si la cola no está vacía
+        """
+        with self._condition:
+            return self._current is not None or bool(self._pending)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que la cola se vacíe.
+
+        Args:
+            timeout: Segundos máximos de espera (None sin límite)
+
+        Returns:
+            True si la cola quedó vacía dentro del tiempo de espera
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._current is None and not self._pending, timeout
+            )
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Detiene la reproducción y termina el hilo.
+
+        Args:
+            timeout: Segundos máximos de espera al hilo
+        """
+        with self._condition:
+            playing = self._interrupt_locked()
+            self._closed = True
+            self._condition.notify_all()
+            worker = self._worker
+        self._stop_if_current(playing)
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout)
+
+    def __len__(self) -> int:
+        """Retorna el número de enunciados pendientes."""
+        with self._condition:
+            return len(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene los contadores de la cola.
+
+        Returns:
+            Diccionario con pendientes, reproducidos, deduplicados, descartados e interrumpidos
+        """
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "max_pending": self.max_pending,
+                "playing": self._current is not None,
+                "played": self.played,
+                "deduplicated": self.deduplicated,
+                "dropped": self.dropped,
+                "interrupted": self.interrupted,
+            }
+
+
+def create_speech_queue(play: Callable[[SpeechRequest], None],
+                        stop_playback: Callable[[], None]) -> SpeechQueue:
+    """
+    Crea la cola de voz con la espera configurada.
+
+    Args:
+        play: Reproduce un enunciado y retorna al terminar (o al cancelarse)
+        stop_playback: Detiene de inmediato la reproducción en curso
+
+    Returns:
+        SpeechQueue cuyo ``submit`` espera ``AudioConfig.speech_queue_timeout``
+        segundos con la cola llena
+    """
+    submit_timeout = DEFAULT_SUBMIT_TIMEOUT
+    try:
+        from utils.config_utils import get_global_config
+
+        submit_timeout = get_global_config().audio.speech_queue_timeout
+    except Exception as e:
+        print(f"⚠️ No se pudo leer la espera configurada de la cola de voz: {e}")
+    return SpeechQueue(play, stop_playback, submit_timeout=submit_timeout)
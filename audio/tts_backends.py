@@ -0,0 +1,294 @@
+"""
+Backends de Síntesis de Voz
+
+Interfaz común ``synthesize(texto) -> bytes`` para los motores de texto a
+voz, de modo que ``SpeechEngine``, la caché de audio y el prerenderizado no
+dependan de gTTS:
+
+- ``gtts``: Google Text-to-Speech (MP3, requiere red).
+- ``pyttsx3``: motor local del sistema operativo (WAV, sin red; dependencia
+  opcional).
+- ``stub``: sintetizador determinista sin dependencias (WAV con un tono por
+  texto), pensado para pruebas y entornos sin audio.
+
+El backend se elige con ``AudioConfig.tts_backend``. Cada backend expone una
+``version`` que forma parte de la clave de caché, por lo que cambiar de
+backend nunca reproduce audio de otro motor.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+import wave
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Type
+
+import numpy as np
+
+# Backends disponibles para AudioConfig.tts_backend
+BACKEND_GTTS = "gtts"
+BACKEND_PYTTSX3 = "pyttsx3"
+BACKEND_STUB = "stub"
+
+# Formatos de audio producidos (sirven de pista de tipo al reproductor)
+FORMAT_MP3 = "mp3"
+FORMAT_WAV = "wav"
+
+# Dominio de Google por defecto (determina el acento de gTTS)
+DEFAULT_TTS_VOICE = "com"
+
+# Velocidad (palabras por minuto) y volumen del motor local (coinciden con AudioConfig)
+DEFAULT_PYTTSX3_RATE = 150
+DEFAULT_PYTTSX3_VOLUME = 0.9
+
+
+class TTSBackend(ABC):
+    """
+    Interfaz de un motor de texto a voz.
+
+    Attributes:
+        name: Nombre del backend en ``AudioConfig.tts_backend``
+        audio_format: Formato del audio producido ("mp3" o "wav")
+        language: Código de idioma de la síntesis
+        voice: Voz o variante del motor
+    """
+
+    name = ""
+    audio_format = FORMAT_MP3
+
+    def __init__(self, language: str = "es", voice: str = DEFAULT_TTS_VOICE) -> None:
+        """
+        Inicializa el backend.
+
+        Args:
+            language: Código de idioma de la síntesis
+            voice: Voz o variante del motor
+        """
+        self.language = language
+        self.voice = voice
+
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """Motor y versión que generan el audio (forma parte de la clave de caché)."""
+
+    @abstractmethod
+    def synthesize(self, text: str) -> bytes:
+        """
+        Sintetiza un texto.
+
+        Args:
+            text: Texto a sintetizar
+
+        Returns:
+            Bytes del audio en ``audio_format``
+        """
+
+
+class GTTSBackend(TTSBackend):
+    """Síntesis con Google Text-to-Speech (una petición de red por enunciado)."""
+
+    name = BACKEND_GTTS
+    audio_format = FORMAT_MP3
+
+    def __init__(self, language: str = "es", voice: str = DEFAULT_TTS_VOICE) -> None:
+        """
+        Inicializa el backend.
+
+        Args:
+            language: Código de idioma de la síntesis
+            voice: Dominio de Google que determina el acento
+
+        Raises:
+            ImportError: Si gTTS no está instalado
+        """
+        super().__init__(language, voice)
+        from gtts import gTTS
+        from gtts.version import __version__ as gtts_version
+
+        self._gtts = gTTS
+        self._version = f"gtts-{gtts_version}"
+
+    @property
+    def version(self) -> str:
+        """Versión de gTTS."""
+        return self._version
+
+    def synthesize(self, text: str) -> bytes:
+        """Sintetiza un texto a MP3 en memoria."""
+        buffer = io.BytesIO()
+        self._gtts(text=text, lang=self.language, tld=self.voice, slow=False).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class Pyttsx3Backend(TTSBackend):
+    """
+    Síntesis local con pyttsx3 (SAPI5, NSSpeechSynthesizer o eSpeak).
+
+    pyttsx3 solo sabe escribir a archivo y no es seguro entre hilos, así que
+    cada síntesis se serializa y pasa por un archivo temporal que se elimina
+    al leerlo.
+    """
+
+    name = BACKEND_PYTTSX3
+    audio_format = FORMAT_WAV
+
+    def __init__(self, language: str = "es", voice: str = DEFAULT_TTS_VOICE,
+                 rate: int = DEFAULT_PYTTSX3_RATE, volume: float = DEFAULT_PYTTSX3_VOLUME) -> None:
+        """
+        Inicializa el backend.
+
+        Args:
+            language: Código de idioma; se elige la primera voz del sistema que lo habla
+            voice: Identificador de una voz del sistema ("com" para elegirla por idioma)
+            rate: Palabras por minuto
+            volume: Volumen entre 0.0 y 1.0
+
+        Raises:
+            ImportError: Si pyttsx3 no está instalado
+        """
+        super().__init__(language, voice)
+        import pyttsx3
+
+        self._engine = pyttsx3.init()
+        self._engine.setProperty("rate", rate)
+        self._engine.setProperty("volume", volume)
+        self._select_voice()
+        self._lock = threading.Lock()
+        self._version = f"pyttsx3-{getattr(pyttsx3, '__version__', '0')}-{self.voice}-{rate}"
+
+    def _select_voice(self) -> None:
+        """Selecciona la voz pedida o la primera del sistema que habla el idioma."""
+        system_voices = list(self._engine.getProperty("voices"))
+        selected = next((voice for voice in system_voices if voice.id == self.voice), None)
+        if selected is None:
+            selected = next((voice for voice in system_voices if self._speaks_language(voice)), None)
+        if selected is not None:
+            self._engine.setProperty("voice", selected.id)
+            self.voice = selected.id
+
+    def _speaks_language(self, system_voice: object) -> bool:
+        """
+        Indica si una voz del sistema habla el idioma del backend.
+
+        Compara etiquetas de idioma por prefijo ("es" acepta "es_EC" y
+        "es-MX", pero no "en_US") y, si la voz no declara idiomas, busca la
+        etiqueta como fragmento de su identificador (SAPI5:
+        "...\\Tokens\\TTS_MS_ES-ES_HELENA_11.0"), nunca como subcadena.
+        """
+        languages = getattr(system_voice, "languages", None) or []
+        for code in languages:
+            if isinstance(code, bytes):
+                # eSpeak antepone un byte de prioridad: b"\x05es"
+                code = code.decode("utf-8", "ignore")
+            tag = "".join(char for char in str(code) if char.isprintable()).lower().replace("-", "_")
+            if tag == self.language or tag.startswith(f"{self.language}_"):
+                return True
+        if languages:
+            return False
+        fragments = re.split(r"[\\/\s._-]+", str(getattr(system_voice, "id", "")).lower())
+        return self.language in fragments
+
+    @property
+    def version(self) -> str:
+        """Versión de pyttsx3, voz y velocidad."""
+        return self._version
+
+    def synthesize(self, text: str) -> bytes:
+        """Sintetiza un texto a WAV."""
+        file_descriptor, temp_path = tempfile.mkstemp(suffix=".wav")
+        os.close(file_descriptor)
+        try:
+            with self._lock:
+                self._engine.save_to_file(text, temp_path)
+                self._engine.runAndWait()
+            with open(temp_path, "rb") as file:
+                return file.read()
+        finally:
+            os.remove(temp_path)
+
+
+class StubBackend(TTSBackend):
+    """
+    Sintetizador determinista sin dependencias ni red.
+
+    Produce un WAV mono de 16 bits con un tono cuya frecuencia depende del
+    hash del texto y cuya duración es proporcional a su longitud, de modo
+    que el mismo texto da siempre los mismos bytes.
+    """
+
+    name = BACKEND_STUB
+    audio_format = FORMAT_WAV
+
+    SAMPLE_RATE = 16000
+    SECONDS_PER_CHARACTER = 0.03
+    MAX_SECONDS = 10.0
+
+    @property
+    def version(self) -> str:
+        """Versión del formato del tono."""
+        return "stub-1"
+
+    def synthesize(self, text: str) -> bytes:
+        """Genera el tono WAV de un texto."""
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        frequency = 220 + digest[0] * 2
+        seconds = min(max(len(text), 1) * self.SECONDS_PER_CHARACTER, self.MAX_SECONDS)
+        samples = int(self.SAMPLE_RATE * seconds)
+        tone = 8000 * np.sin(2 * np.pi * frequency * np.arange(samples) / self.SAMPLE_RATE)
+        frames = tone.astype("<i2").tobytes()
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(self.SAMPLE_RATE)
+            wav_file.writeframes(frames)
+        return buffer.getvalue()
+
+
+TTS_BACKENDS: Dict[str, Type[TTSBackend]] = {
+    BACKEND_GTTS: GTTSBackend,
+    BACKEND_PYTTSX3: Pyttsx3Backend,
+    BACKEND_STUB: StubBackend,
+}
+
+
+def create_tts_backend(name: Optional[str] = None, language: str = "es") -> TTSBackend:
+    """
+    Crea un backend de síntesis.
+
+    Args:
+        name: Nombre del backend (por defecto, ``AudioConfig.tts_backend``); el
+            motor local usa además ``tts_rate`` y ``tts_volume``
+        language: Código de idioma de la síntesis
+
+    Returns:
+        Backend configurado
+
+    Raises:
+        ValueError: Si el backend no existe
+        ImportError: Si falta la dependencia del backend
+    """
+    configured_name, rate, volume = BACKEND_GTTS, DEFAULT_PYTTSX3_RATE, DEFAULT_PYTTSX3_VOLUME
+    try:
+        from utils.config_utils import get_global_config
+
+        audio_config = get_global_config().audio
+        configured_name, rate, volume = audio_config.tts_backend, audio_config.tts_rate, audio_config.tts_volume
+    except Exception as e:
+        print(f"⚠️ No se pudo leer el backend de síntesis configurado: {e}")
+    name = name or configured_name
+
+    backend_class = TTS_BACKENDS.get(name)
+    if backend_class is None:
+        raise ValueError(f"Backend de síntesis desconocido: {name}. Opciones: {list(TTS_BACKENDS)}")
+    if backend_class is Pyttsx3Backend:
+        return Pyttsx3Backend(language, rate=rate, volume=volume)
+    return backend_class(language)
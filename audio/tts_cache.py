@@ -0,0 +1,314 @@
+"""
+Caché Persistente de Audio Sintetizado
+
+Guarda en disco el audio de cada enunciado sintetizado, direccionado por el
+hash de (texto, idioma, voz, versión del motor), de modo que repetir una
+frase (instrucciones de señas, "No encontré la seña...") no vuelve a pagar
+la latencia de síntesis. Vive en ``utils.file_utils.get_cache_directory()``
+y expulsa entradas por antigüedad y por tamaño total (las menos usadas
+primero, según su fecha de último acceso).
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+# Subdirectorio de la caché de audio dentro del directorio de caché del proyecto
+TTS_CACHE_DIRNAME = "tts"
+
+# Extensión de los archivos de audio guardados: neutra, porque el formato
+# (MP3 o WAV) depende del backend y ya forma parte de la clave
+AUDIO_EXTENSION = ".audio"
+
+# Sufijo de los archivos temporales de ``put`` y segundos tras los que uno
+# se considera abandonado (un cierre abrupto durante la escritura) y se poda
+TEMP_SUFFIX = ".tmp"
+STALE_TEMP_SECONDS = 3600
+
+# Valores por defecto (coinciden con AudioConfig)
+DEFAULT_TTS_CACHE_MAX_MB = 200
+DEFAULT_TTS_CACHE_MAX_AGE_DAYS = 30
+
+
+def make_cache_key(text: str, language: str, voice: str, engine_version: str) -> str:
+    """
+    Calcula la clave de un enunciado.
+
+    Args:
+        text: Texto sintetizado
+        language: Código de idioma de la síntesis
+        voice: Voz o variante del motor
+        engine_version: Motor y versión que generan el audio
+
+    Returns:
+        Hash SHA-256 hexadecimal de los cuatro campos
+    """
+    payload = "\x1f".join((engine_version, language, voice, text))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """
+    Caché de audio en disco direccionada por contenido.
+
+    Cada entrada es un archivo ``<clave>.audio`` escrito de forma atómica; su
+    fecha de modificación se actualiza en cada acierto y sirve como fecha de
+    último acceso. Es segura entre hilos y entre procesos (la escritura con
+    ``os.replace`` nunca deja archivos a medias).
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None,
+                 max_bytes: int = DEFAULT_TTS_CACHE_MAX_MB * 1024 * 1024,
+                 max_age: float = DEFAULT_TTS_CACHE_MAX_AGE_DAYS * 86400.0) -> None:
+        """
+        Inicializa la caché y expulsa las entradas caducadas o sobrantes.
+
+        Args:
+            directory: Directorio de la caché (por defecto, ``get_cache_directory() / "tts"``)
+            max_bytes: Tamaño total máximo en bytes
+            max_age: Segundos sin uso tras los que una entrada caduca (0 sin caducidad)
+        """
+        if directory is None:
+            from utils.file_utils import get_cache_directory
+
+            directory = get_cache_directory() / TTS_CACHE_DIRNAME
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prune()
+
+    def path_for(self, key: str) -> Path:
+        """
+        Obtiene la ruta del archivo de una clave.
+
+        Args:
+            key: Clave calculada con ``make_cache_key``
+
+        Returns:
+            Ruta del archivo de audio (exista o no)
+        """
+        return self.directory / f"{key}{AUDIO_EXTENSION}"
+
+    def _is_expired(self, modified_at: float, now: float) -> bool:
+        """Indica si una entrada sin uso desde ``modified_at`` caducó."""
+        return self.max_age > 0 and now - modified_at > self.max_age
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """
+        Obtiene la ruta de una entrada vigente y la marca como usada.
+
+        Args:
+            key: Clave del enunciado
+
+        Returns:
+            Ruta del archivo o None si no existe o caducó
+        """
+        path = self.path_for(key)
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        now = time.time()
+        if self._is_expired(stat.st_mtime, now):
+            self._remove(path, stat.st_size)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Obtiene el audio de una entrada vigente.
+
+        Args:
+            key: Clave del enunciado
+
+        Returns:
+            Bytes del audio o None si no existe o caducó
+        """
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes) -> Path:
+        """
+        Guarda el audio de un enunciado y expulsa entradas si se supera el tamaño.
+
+        Args:
+            key: Clave del enunciado
+            data: Bytes del audio
+
+        Returns:
+            Ruta del archivo guardado
+        """
+        path = self.path_for(key)
+        try:
+            previous_size = path.stat().st_size
+        except OSError:
+            previous_size = 0
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=str(self.directory), suffix=TEMP_SUFFIX)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            self._total_bytes += len(data) - previous_size
+            over_limit = self._total_bytes > self.max_bytes
+        if over_limit:
+            self.prune()
+        return path
+
+    def _remove(self, path: Path, size: int) -> None:
+        """Elimina un archivo de la caché y descuenta su tamaño."""
+        try:
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def prune(self) -> int:
+        """
+        Expulsa las entradas caducadas y, si se supera el tamaño máximo, las
+        menos usadas hasta quedar por debajo del 90 % del límite. También
+        elimina los archivos temporales abandonados por un ``put`` interrumpido.
+
+        Returns:
+            Número de entradas expulsadas
+        """
+        now = time.time()
+        for path in self.directory.glob(f"*{TEMP_SUFFIX}"):
+            try:
+                if now - path.stat().st_mtime > STALE_TEMP_SECONDS:
+                    path.unlink()
+            except OSError:
+                pass
+
+        entries = []
+        for path in self.directory.glob(f"*{AUDIO_EXTENSION}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        evicted = 0
+        total_bytes = 0
+        fresh = []
+        for modified_at, size, path in entries:
+            if self._is_expired(modified_at, now):
+                try:
+                    path.unlink()
+                    evicted += 1
+                except OSError:
+                    pass
+            else:
+                fresh.append((modified_at, size, path))
+                total_bytes += size
+
+        if total_bytes > self.max_bytes:
+            target = int(self.max_bytes * 0.9)
+            for modified_at, size, path in sorted(fresh, key=lambda entry: entry[0]):
+                if total_bytes <= target:
+                    break
+                try:
+                    path.unlink()
+                    evicted += 1
+                    total_bytes -= size
+                except OSError:
+                    pass
+
+        with self._lock:
+            self._total_bytes = total_bytes
+            self.evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        """Elimina todas las entradas de la caché."""
+        for path in self.directory.glob(f"*{AUDIO_EXTENSION}"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        with self._lock:
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene los contadores de la caché.
+
+        Returns:
+            Diccionario con tamaño, límites, aciertos, fallos y expulsiones
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "directory": str(self.directory),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_age": self.max_age,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) * 100 if lookups else 0.0,
+            }
+
+
+def create_tts_cache() -> Optional[TTSCache]:
+    """
+    Crea la caché de audio según ``AudioConfig``.
+
+    Returns:
+        TTSCache configurada o None si está desactivada o no se pudo crear
+    """
+    max_mb, max_age_days = DEFAULT_TTS_CACHE_MAX_MB, DEFAULT_TTS_CACHE_MAX_AGE_DAYS
+    try:
+        from utils.config_utils import get_global_config
+
+        audio_config = get_global_config().audio
+        if not audio_config.tts_cache_enabled:
+            return None
+        max_mb, max_age_days = audio_config.tts_cache_max_mb, audio_config.tts_cache_max_age_days
+    except Exception as e:
+        print(f"⚠️ No se pudo leer la configuración de la caché de audio: {e}")
+
+    try:
+        return TTSCache(max_bytes=max_mb * 1024 * 1024, max_age=max_age_days * 86400.0)
+    except OSError as e:
+        print(f"⚠️ No se pudo crear la caché de audio: {e}")
+        return None
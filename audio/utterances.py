@@ -0,0 +1,48 @@
+"""
+Enunciados de Voz de las Señas
+
+Construye los textos que pronuncia el motor de voz a partir de las filas de
+los CSV. Están separados de ``speech_engine`` para que el prerenderizado
+pueda calcular exactamente los mismos enunciados sin cargar pygame ni
+Whisper.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+# Mapeo de idiomas a países
+LANGUAGE_COUNTRY_MAP = {
+    "ecuatoriano": "Ecuador",
+    "chileno": "Chile",
+    "mexicano": "México"
+}
+
+DEFAULT_COUNTRY = "Ecuador"
+
+
+def get_country(language: str) -> str:
+    """
+    Obtiene el país de un idioma de señas.
+
+    Args:
+        language: Idioma de la seña (ecuatoriano, chileno, mexicano)
+
+    Returns:
+        Nombre del país (Ecuador si el idioma no se conoce)
+    """
+    return LANGUAGE_COUNTRY_MAP.get(language, DEFAULT_COUNTRY)
+
+
+def build_instruction_text(word: str, instructions: str, language: str = "ecuatoriano") -> str:
+    """
+    Construye el enunciado con las instrucciones de una seña.
+
+    Args:
+        word: Palabra de la seña
+        instructions: Instrucciones de cómo hacer la seña
+        language: Idioma de la seña
+
+    Returns:
+        Texto que pronuncia ``SpeechEngine.speak_sign_instruction``
+    """
+    return f"La palabra '{word}' en lengua de señas de {get_country(language)} se hace así: {instructions}"
@@ -0,0 +1,263 @@
+"""
+Fachada Asíncrona del Procesador de Señas
+
+Expone ``search_sign``, ``process_voice_search`` y ``speak`` como corrutinas
+para que un frontend web asíncrono atienda a muchos usuarios desde un solo
+bucle de eventos. El trabajo bloqueante se ejecuta en dos grupos de hilos
+compartidos por el proceso: uno para búsquedas (puntuación difusa) y otro
+para audio (grabación, Whisper y encolado de voz), de modo que una grabación
+larga nunca retrasa las búsquedas del resto de usuarios. La reproducción no
+ocupa hilos del grupo: ``speak`` espera el fin del enunciado con un futuro
+que resuelve la cola de voz.
+
+Las búsquedas tienen como tiempo límite ``DatabaseConfig.search_timeout``.
+Cancelar la corrutina (o agotar su tiempo) libera de inmediato al bucle de
+eventos; el enunciado de voz además se retira de la cola de reproducción,
+mientras que una búsqueda o transcripción ya iniciada termina en su hilo y su
+resultado se descarta.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from audio.speech_queue import SpeechQueue, SpeechRequest
+from core.sign_processor import SearchResult, SignProcessor, create_session_processor
+
+T = TypeVar("T")
+
+# Hilos del grupo de audio (Whisper es costoso; la reproducción la hace la cola de voz)
+AUDIO_WORKERS = 2
+
+# Grupos de hilos compartidos por todas las fachadas del proceso
+_search_executor: Optional[ThreadPoolExecutor] = None
+_audio_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_search_executor() -> ThreadPoolExecutor:
+    """
+    Obtiene el grupo de hilos compartido para búsquedas.
+
+    Returns:
+        ThreadPoolExecutor con un hilo por núcleo
+    """
+    global _search_executor
+    if _search_executor is None:
+        with _executor_lock:
+            if _search_executor is None:
+                _search_executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 4, thread_name_prefix="signify-search"
+                )
+    return _search_executor
+
+
+def get_audio_executor() -> ThreadPoolExecutor:
+    """
+    Obtiene el grupo de hilos compartido para grabación, transcripción y reproducción.
+
+    Returns:
+        ThreadPoolExecutor de audio
+    """
+    global _audio_executor
+    if _audio_executor is None:
+        with _executor_lock:
+            if _audio_executor is None:
+                _audio_executor = ThreadPoolExecutor(
+                    max_workers=AUDIO_WORKERS, thread_name_prefix="signify-audio"
+                )
+    return _audio_executor
+
+
+def _resolve_future(future: "asyncio.Future[None]") -> None:
+    """Resuelve un futuro de fin de voz si nadie lo canceló antes."""
+    if not future.done():
+        future.set_result(None)
+
+
+def _notify_finished(loop: asyncio.AbstractEventLoop, future: "asyncio.Future[None]",
+                     request: SpeechRequest) -> None:
+    """Resuelve desde el hilo de la cola el futuro de fin de un enunciado."""
+    try:
+        loop.call_soon_threadsafe(_resolve_future, future)
+    except RuntimeError:
+        pass  # El bucle ya se cerró: nadie espera el enunciado
+
+
+def _cancel_submitted(speech_queue: SpeechQueue, submission: "asyncio.Future[Any]") -> None:
+    """Retira de la cola un enunciado cuyo ``speak`` se canceló mientras se encolaba."""
+    if submission.cancelled() or submission.exception() is not None:
+        return
+    request = submission.result()
+    if request is not None:
+        speech_queue.cancel(request)
+
+
+def shutdown_executors() -> None:
+    """Detiene los grupos de hilos compartidos (se recrean al volver a usarse)."""
+    global _search_executor, _audio_executor
+    with _executor_lock:
+        for executor in (_search_executor, _audio_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        _search_executor = None
+        _audio_executor = None
+
+
+class AsyncSignProcessor:
+    """
+    Fachada asyncio sobre un ``SignProcessor`` de sesión.
+
+    Cada usuario debe tener su propia fachada (con su propio historial); los
+    recursos compartidos y los grupos de hilos son comunes a todo el proceso.
+    """
+
+    def __init__(self, processor: Optional[SignProcessor] = None,
+                 search_executor: Optional[Executor] = None,
+                 audio_executor: Optional[Executor] = None,
+                 search_timeout: Optional[float] = None) -> None:
+        """
+        Inicializa la fachada.
+
+        Args:
+            processor: Procesador de la sesión (por defecto, uno nuevo)
+            search_executor: Ejecutor de búsquedas (por defecto, el compartido)
+            audio_executor: Ejecutor de audio (por defecto, el compartido)
+            search_timeout: Segundos límite por búsqueda (por defecto, ``DatabaseConfig.search_timeout``)
+        """
+        self.processor = processor or create_session_processor()
+        self.search_executor = search_executor or get_search_executor()
+        self.audio_executor = audio_executor or get_audio_executor()
+        self.search_timeout = (
+            search_timeout if search_timeout is not None else self.processor.shared.search_timeout
+        )
+
+    async def _run(self, executor: Executor, timeout: Optional[float],
+                   func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Ejecuta una función bloqueante en un ejecutor con tiempo límite.
+
+        Args:
+            executor: Ejecutor en el que correr la función
+            timeout: Segundos límite (None sin límite)
+            func: Función bloqueante
+
+        Returns:
+            Resultado de la función
+
+        Raises:
+            asyncio.TimeoutError: Si se agota el tiempo límite
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+        return await asyncio.wait_for(future, timeout)
+
+    async def search_sign(self, query: str, include_similar: bool = True,
+                          max_similar: int = SignProcessor.DEFAULT_SIMILAR_RESULTS,
+                          language: str = "ecuatoriano",
+                          timeout: Optional[float] = None) -> SearchResult:
+        """
+        Busca una seña sin bloquear el bucle de eventos.
+
+        Args:
+            query: Palabra a buscar
+            include_similar: Si incluir búsquedas similares
+            max_similar: Número máximo de resultados similares
+            language: Idioma en el que buscar
+            timeout: Segundos límite (por defecto, ``search_timeout``)
+
+        Returns:
+            SearchResult con los resultados de la búsqueda
+
+        Raises:
+            asyncio.TimeoutError: Si la búsqueda supera el tiempo límite
+        """
+        return await self._run(
+            self.search_executor,
+            timeout if timeout is not None else self.search_timeout,
+            self.processor.search_sign, query, include_similar, max_similar, language
+        )
+
+    async def process_voice_search(self, duration: int = SignProcessor.DEFAULT_VOICE_DURATION,
+                                   language: str = "ecuatoriano") -> SearchResult:
+        """
+        Graba, transcribe y busca sin bloquear el bucle de eventos.
+
+        La grabación y la transcripción corren en el grupo de audio con un
+        límite de ``duration`` más ``AudioConfig.voice_timeout`` segundos; la
+        búsqueda posterior (``SignProcessor.search_transcript``, que traduce
+        frases completas), en el grupo de búsquedas con ``search_timeout``.
+
+        Args:
+            duration: Duración de la grabación en segundos
+            language: Idioma en el que buscar
+
+        Returns:
+            SearchResult con los resultados
+
+        Raises:
+            RuntimeError: Si el reconocimiento de voz no está disponible
+            asyncio.TimeoutError: Si la transcripción o la búsqueda superan su tiempo límite
+        """
+        voice_recognition = self.processor.voice_recognition
+        if not voice_recognition.is_available():
+            raise RuntimeError("Motor de reconocimiento de voz no disponible")
+
+        transcribed_text = await self._run(
+            self.audio_executor,
+            duration + self.processor.shared.voice_timeout,
+            voice_recognition.record_and_transcribe, duration
+        )
+        if not transcribed_text:
+            return SearchResult(query="", found=False, search_time=0.0)
+
+        return await self._run(
+            self.search_executor, self.search_timeout,
+            self.processor.search_transcript, transcribed_text, language
+        )
+
+    async def speak(self, text: str, timeout: Optional[float] = None) -> None:
+        """
+        Encola un texto en la cola de voz; termina cuando acaba su reproducción.
+
+        Si la corrutina se cancela o se agota el tiempo límite, el enunciado
+        se descarta o, si ya suena, se detiene; el resto de la cola sigue.
+
+        Args:
+            text: Texto a reproducir
+            timeout: Segundos límite (None sin límite)
+
+        Raises:
+            asyncio.TimeoutError: Si la reproducción supera el tiempo límite
+        """
+        speech_engine = self.processor.speech_engine
+        speech_queue = speech_engine.speech_queue
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        # Encolar puede esperar sitio (``AudioConfig.speech_queue_timeout``)
+        submission = loop.run_in_executor(
+            self.audio_executor, functools.partial(speech_engine.speak_text, text)
+        )
+        try:
+            request = await asyncio.wait_for(asyncio.shield(submission), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            submission.add_done_callback(functools.partial(_cancel_submitted, speech_queue))
+            raise
+        if request is None:
+            return
+
+        finished = loop.create_future()
+        request.add_done_callback(functools.partial(_notify_finished, loop, finished))
+        remaining = None if deadline is None else max(deadline - loop.time(), 0.0)
+        try:
+            await asyncio.wait_for(finished, remaining)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            speech_queue.cancel(request)
+            raise
@@ -0,0 +1,221 @@
+"""
+Pruebas de Concurrencia del Procesador de Señas.
+
+Ejercita ``SignProcessor`` con varias sesiones y hilos sobre unos mismos
+``SharedResources`` mientras el corpus se recarga en caliente, y falla si
+algún resultado difiere del de una búsqueda secuencial. Los motores de voz
+se sustituyen por implementaciones nulas.
+
+Uso:
+    python -m core.benchmarks
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import csv
+import os
+import random
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Dict, List, Optional
+
+from core.sign_processor import SharedResources, SignProcessor
+from database.benchmarks import (
+    generate_synthetic_words,
+    load_database_quietly,
+    mutate_query,
+    write_synthetic_csv,
+)
+
+
+class NullSpeechEngine:
+    """Motor de voz que no reproduce nada (misma interfaz que ``SpeechEngine``)."""
+
+    def speak_text(self, text: str, async_mode: bool = True, **kwargs) -> None:
+        """Descarta el texto."""
+        return None
+
+    def speak_sign_instruction(self, word: str, instructions: str, language: str = "ecuatoriano",
+                               interrupt: bool = True) -> None:
+        """Descarta las instrucciones."""
+
+    def speak_search_result(self, word: str, found: bool, instructions: Optional[str] = None,
+                            language: str = "ecuatoriano", interrupt: bool = True) -> None:
+        """Descarta el resultado."""
+
+    def stop_speech(self) -> None:
+        """No hay reproducción que detener."""
+
+    def is_playing(self) -> bool:
+        """Nunca hay audio reproduciéndose."""
+        return False
+
+    def cleanup(self) -> None:
+        """No hay recursos que liberar."""
+
+
+class NullVoiceRecognition:
+    """Reconocimiento de voz siempre no disponible (misma interfaz que ``VoiceRecognitionEngine``)."""
+
+    def is_available(self) -> bool:
+        """El reconocimiento nunca está disponible."""
+        return False
+
+    def record_and_transcribe(self, duration: int = 5, sample_rate: int = 16000) -> Optional[str]:
+        """No graba ni transcribe."""
+        return None
+
+    def cleanup(self) -> None:
+        """No hay recursos que liberar."""
+
+
+def stress_test_sessions(num_sessions: int = 8, threads_per_session: int = 4,
+                         searches_per_thread: int = 100, corpus_size: int = 2000,
+                         reload_interval: float = 0.02) -> Dict[str, float]:
+    """
+    Prueba de concurrencia de ``SignProcessor.search_sign`` con varias sesiones.
+
+    Crea ``num_sessions`` procesadores de sesión sobre unos mismos
+    ``SharedResources`` y lanza ``threads_per_session`` hilos por sesión que
+    buscan a la vez palabras exactas y con errores, mientras otro hilo recarga
+    el CSV en caliente agregando palabras que no afectan a las consultas.
+    Verifica que ningún hilo falle, que cada resultado coincida con el de una
+    búsqueda secuencial y que cada historial registre exactamente sus búsquedas.
+    Los motores de voz se sustituyen por ``NullSpeechEngine`` y
+    ``NullVoiceRecognition``, de modo que no se inicia audio ni se carga Whisper.
+
+    Args:
+        num_sessions: Número de sesiones (procesadores) concurrentes
+        threads_per_session: Hilos que comparten cada sesión
+        searches_per_thread: Búsquedas por hilo
+        corpus_size: Tamaño del corpus sintético
+        reload_interval: Segundos entre recargas del hilo escritor
+
+    Returns:
+        Diccionario con el rendimiento y el resultado de las verificaciones
+
+    Raises:
+        AssertionError: Si algún hilo falló, algún resultado difiere del
+            secuencial o algún historial no registró todas sus búsquedas
+    """
+    rng = random.Random(11)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        words = generate_synthetic_words(corpus_size)
+        csv_path = os.path.join(temp_dir, f"stress_{corpus_size}.csv")
+        write_synthetic_csv(csv_path, words)
+        database = load_database_quietly({"ecuatoriano": csv_path})
+
+        # Consultas exactas y con errores, con su resultado secuencial esperado
+        queries = [rng.choice(words) for _ in range(200)]
+        queries += [mutate_query(rng.choice(words), rng) for _ in range(200)]
+        expected = {}
+        for query in queries:
+            normalized = " ".join(query.lower().split())
+            exact_match = database.search_exact(normalized)
+            if exact_match is None:
+                rewritten = database.search_rewritten(normalized)
+                exact_match = rewritten[0] if rewritten else None
+            similar = [] if exact_match else database.search_fuzzy(normalized, 5, SignProcessor.MIN_SIMILARITY_THRESHOLD)
+            expected[query] = (exact_match.word if exact_match else None,
+                               [(entry.word, score) for entry, score in similar])
+
+        shared = SharedResources(database, NullSpeechEngine(), NullVoiceRecognition())
+        sessions = [SignProcessor(shared) for _ in range(num_sessions)]
+        errors: List[str] = []
+        mismatches = [0]
+        counter_lock = threading.Lock()
+        stop_event = threading.Event()
+        reloads = [0]
+
+        def reader(processor: SignProcessor, seed: int) -> None:
+            thread_rng = random.Random(seed)
+            try:
+                for _ in range(searches_per_thread):
+                    query = thread_rng.choice(queries)
+                    result = processor.search_sign(query)
+                    observed = (result.exact_match.word if result.exact_match else None,
+                                [(entry.word, score) for entry, score in result.similar_matches])
+                    if observed != expected[query]:
+                        with counter_lock:
+                            mismatches[0] += 1
+            except Exception as e:
+                with counter_lock:
+                    errors.append(repr(e))
+
+        def writer() -> None:
+            writer_rng = random.Random(5)
+            try:
+                while not stop_event.wait(reload_interval):
+                    # Palabras sin letras comunes con el corpus: no cambian los resultados esperados
+                    extra_word = "".join(writer_rng.choice("xyzwkfjv") for _ in range(8))
+                    with open(csv_path, "a", encoding="utf-8", newline="") as file:
+                        csv.writer(file).writerow([extra_word, "Seña agregada durante la prueba."])
+                    database.reload_language("ecuatoriano")
+                    reloads[0] += 1
+            except Exception as e:
+                with counter_lock:
+                    errors.append(repr(e))
+
+        threads = [
+            threading.Thread(target=reader, args=(processor, session * 100 + index))
+            for session, processor in enumerate(sessions)
+            for index in range(threads_per_session)
+        ]
+        writer_thread = threading.Thread(target=writer)
+
+        with redirect_stdout(StringIO()):
+            start = time.perf_counter()
+            writer_thread.start()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            stop_event.set()
+            writer_thread.join()
+
+    searches_per_session = threads_per_session * searches_per_thread
+    histories_ok = all(
+        processor.get_search_statistics()["total_searches"] == searches_per_session
+        and len(processor.search_history) == min(searches_per_session, processor.search_history.capacity)
+        for processor in sessions
+    )
+    total_searches = searches_per_session * num_sessions
+    row = {
+        "sessions": num_sessions,
+        "threads": len(threads),
+        "searches": total_searches,
+        "reloads": reloads[0],
+        "searches_per_second": total_searches / elapsed if elapsed else 0.0,
+        "errors": len(errors),
+        "mismatches": mismatches[0],
+        "histories_ok": histories_ok,
+        "cache_hit_rate": shared.result_cache.get_stats()["hit_rate"] if shared.result_cache else 0.0,
+    }
+    passed = not errors and not mismatches[0] and histories_ok
+    print(
+        f"📊 {row['threads']} hilos / {num_sessions} sesiones: {total_searches} búsquedas, "
+        f"{row['reloads']} recargas, {row['searches_per_second']:.0f} búsquedas/s | "
+        f"errores: {row['errors']} | discrepancias: {row['mismatches']} | "
+        f"historiales: {'✅' if histories_ok else '❌'} | {'✅' if passed else '❌'}"
+    )
+    for error in errors[:5]:
+        print(f"❌ {error}")
+    shared.cleanup()
+
+    if errors:
+        raise AssertionError(f"{len(errors)} hilos fallaron; primer error: {errors[0]}")
+    if mismatches[0]:
+        raise AssertionError(f"{mismatches[0]} resultados difieren de la búsqueda secuencial")
+    if not histories_ok:
+        raise AssertionError("Algún historial de sesión no registró exactamente sus búsquedas")
+    return row
+
+
+if __name__ == "__main__":
+    stress_test_sessions()
@@ -0,0 +1,139 @@
+"""
+Caché de Resultados de Búsqueda
+
+Caché acotada con expulsión LRU y caducidad por tiempo (TTL) que se coloca
+delante de ``SignProcessor.search_sign``. Cada entrada guarda la generación
+de la base de datos con la que se calculó; cuando la base de datos se recarga
+o edita la generación cambia y la caché se vacía.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+# Valores por defecto (coinciden con DatabaseConfig)
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL = 300.0
+
+
+class QueryCache(Generic[V]):
+    """
+    Caché LRU con caducidad por tiempo e invalidación por generación.
+
+    Es segura entre hilos: todas las operaciones toman un candado corto.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL) -> None:
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            max_entries: Número máximo de entradas antes de expulsar la menos usada
+            ttl: Segundos de vigencia de cada entrada (0 sin caducidad)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # {clave: (valor, instante de inserción)} en orden de uso
+        self._entries: "OrderedDict[Hashable, Tuple[V, float]]" = OrderedDict()
+        self._generation: Optional[int] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _sync_generation(self, generation: int) -> None:
+        """Vacía la caché si la base de datos cambió de generación."""
+        if generation != self._generation:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._generation = generation
+
+    def get(self, key: Hashable, generation: int) -> Optional[V]:
+        """
+        Obtiene un valor vigente de la caché.
+
+        Args:
+            key: Clave de la consulta
+            generation: Generación actual de la base de datos
+
+        Returns:
+            Valor en caché o None si no existe, caducó o la generación cambió
+        """
+        with self._lock:
+            self._sync_generation(generation)
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            value, stored_at = item
+            if self.ttl > 0 and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V, generation: int) -> None:
+        """
+        Guarda un valor en la caché.
+
+        Si la generación es anterior a la actual (la base de datos cambió
+        mientras se calculaba el valor) el valor se descarta.
+
+        Args:
+            key: Clave de la consulta
+            value: Valor a guardar
+            generation: Generación de la base de datos con la que se calculó
+        """
+        with self._lock:
+            if self._generation is not None and generation < self._generation:
+                return
+            self._sync_generation(generation)
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Vacía la caché conservando los contadores."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene los contadores de la caché.
+
+        Returns:
+            Diccionario con tamaño, aciertos, fallos, expulsiones y tasa de aciertos
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "hit_rate": (self.hits / lookups) * 100 if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        """Retorna el número de entradas en caché."""
+        return len(self._entries)
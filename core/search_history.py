@@ -0,0 +1,299 @@
+"""
+Historial de Búsquedas Acotado
+
+Guarda las búsquedas más recientes en un búfer circular de capacidad fija y
+mantiene agregados incrementales de todas las búsquedas registradas desde
+la última limpieza: conteos, tasa de éxito, media/mínimo/máximo del tiempo
+de búsqueda (algoritmo de Welford) y las palabras más buscadas (algoritmo
+Space-Saving). Consultar las estadísticas cuesta O(1) y la memoria no crece
+con el tiempo de vida del proceso.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import heapq
+import math
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Tuple
+
+from database.top_k import top_k
+
+if TYPE_CHECKING:
+    from core.sign_processor import SearchResult
+
+# Valores por defecto (coinciden con DatabaseConfig)
+DEFAULT_HISTORY_SIZE = 1000
+DEFAULT_TRACKED_WORDS = 100
+
+
+class RunningStats:
+    """
+    Media, varianza, mínimo y máximo de una serie con el algoritmo de Welford.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa las estadísticas vacías."""
+        self.count = 0
+        self.mean = 0.0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.maximum = 0.0
+        self._m2 = 0.0
+
+    def update(self, value: float) -> None:
+        """
+        Agrega un valor a la serie.
+
+        Args:
+            value: Valor observado
+        """
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if self.count == 1:
+            self.minimum = self.maximum = value
+        else:
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+
+    @property
+    def variance(self) -> float:
+        """Varianza muestral de la serie (0.0 con menos de dos valores)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Desviación estándar muestral de la serie."""
+        return math.sqrt(self.variance)
+
+
+class HeavyHitters:
+    """
+    Palabras más frecuentes de un flujo con memoria acotada (Space-Saving).
+
+    Mantiene como máximo ``capacity`` contadores. Cuando llega una palabra no
+    vigilada y no hay hueco, reemplaza a la de menor conteo y hereda ese
+    conteo como error, por lo que los conteos son cotas superiores y toda
+    palabra con frecuencia mayor que ``total / capacity`` está garantizada.
+
+    La palabra a reemplazar sale de un montículo de mínimos con una entrada
+    por palabra vigilada cuyo conteo es una cota inferior: los incrementos no
+    tocan el montículo y una entrada desactualizada se reinserta con su conteo
+    vigente al extraerla, de modo que un acierto cuesta O(1) y un reemplazo
+    O(log capacity) amortizado.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TRACKED_WORDS) -> None:
+        """
+        Inicializa el resumen vacío.
+
+        Args:
+            capacity: Número máximo de palabras vigiladas
+        """
+        self.capacity = capacity
+        # {palabra: (conteo, orden de primera aparición)}
+        self._counts: Dict[str, Tuple[int, int]] = {}
+        self._errors: Dict[str, int] = {}
+        # Entradas (conteo como cota inferior, orden de primera aparición, palabra)
+        self._heap: List[Tuple[int, int, str]] = []
+        self._arrivals = 0
+
+    def _pop_minimum(self) -> str:
+        """Extrae la palabra vigilada de menor conteo (y primera aparición más antigua)."""
+        while True:
+            count, arrival, word = heapq.heappop(self._heap)
+            current_count = self._counts[word][0]
+            if current_count == count:
+                return word
+            heapq.heappush(self._heap, (current_count, arrival, word))
+
+    def add(self, word: str) -> None:
+        """
+        Registra una aparición de una palabra.
+
+        Args:
+            word: Palabra observada
+        """
+        if word in self._counts:
+            count, arrival = self._counts[word]
+            self._counts[word] = (count + 1, arrival)
+            return
+
+        self._arrivals += 1
+        if len(self._counts) < self.capacity:
+            self._counts[word] = (1, self._arrivals)
+            self._errors[word] = 0
+            heapq.heappush(self._heap, (1, self._arrivals, word))
+            return
+
+        evicted = self._pop_minimum()
+        evicted_count = self._counts.pop(evicted)[0]
+        del self._errors[evicted]
+        self._counts[word] = (evicted_count + 1, self._arrivals)
+        self._errors[word] = evicted_count
+        heapq.heappush(self._heap, (evicted_count + 1, self._arrivals, word))
+
+    def most_common(self, k: int = 10) -> List[Tuple[str, int]]:
+        """
+        Obtiene las palabras más frecuentes.
+
+        Args:
+            k: Número máximo de palabras
+
+        Returns:
+            Lista de tuplas (palabra, conteo estimado) de mayor a menor conteo
+            (empates por orden de primera aparición)
+        """
+        ranked = top_k(self._counts.items(), k, key=lambda item: (-item[1][0], item[1][1]))
+        return [(word, count) for word, (count, _) in ranked]
+
+    def error_of(self, word: str) -> int:
+        """
+        Obtiene la sobreestimación máxima del conteo de una palabra.
+
+        Args:
+            word: Palabra vigilada
+
+        Returns:
+            Error máximo del conteo (0 si el conteo es exacto o no se vigila)
+        """
+        return self._errors.get(word, 0)
+
+    def __len__(self) -> int:
+        """Retorna el número de palabras vigiladas."""
+        return len(self._counts)
+
+
+class SearchHistory:
+    """
+    Búfer circular de búsquedas recientes con agregados incrementales.
+
+    Se comporta como una secuencia de ``SearchResult`` (iteración, ``len``,
+    índices y cortes) limitada a las ``capacity`` búsquedas más recientes;
+    los agregados abarcan todas las búsquedas registradas desde la creación
+    o la última llamada a ``clear``. Es segura entre hilos: las lecturas
+    trabajan sobre copias tomadas bajo el candado.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE,
+                 tracked_words: int = DEFAULT_TRACKED_WORDS) -> None:
+        """
+        Inicializa el historial vacío.
+
+        Args:
+            capacity: Número máximo de búsquedas conservadas
+            tracked_words: Número máximo de palabras vigiladas para las más buscadas
+        """
+        self.capacity = capacity
+        self.tracked_words = tracked_words
+        self._results: Deque["SearchResult"] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        """Reinicia los agregados."""
+        self.total_searches = 0
+        self.successful_searches = 0
+        self.confidence_total = 0.0
+        self.search_times = RunningStats()
+        self.words = HeavyHitters(self.tracked_words)
+
+    def append(self, result: "SearchResult") -> None:
+        """
+        Registra una búsqueda (descarta la más antigua si el búfer está lleno).
+
+        Args:
+            result: Resultado de la búsqueda
+        """
+        confidence = result.get_confidence_score()
+        word = result.query.lower()
+
+        with self._lock:
+            self._results.append(result)
+            self.total_searches += 1
+            if result.found:
+                self.successful_searches += 1
+            self.confidence_total += confidence
+            self.search_times.update(result.search_time)
+            if word:  # Evitar consultas vacías
+                self.words.add(word)
+
+    def clear(self) -> None:
+        """Vacía el búfer y reinicia los agregados."""
+        with self._lock:
+            self._results.clear()
+            self._reset_aggregates()
+
+    def recent(self, limit: int = 10) -> List["SearchResult"]:
+        """
+        Obtiene las búsquedas más recientes.
+
+        Args:
+            limit: Número máximo de búsquedas
+
+        Returns:
+            Lista de SearchResult de la más antigua a la más reciente
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            start = max(len(self._results) - limit, 0)
+            return [self._results[index] for index in range(start, len(self._results))]
+
+    def get_summary(self, top_words: int = 10) -> Dict[str, Any]:
+        """
+        Obtiene los agregados de todas las búsquedas registradas.
+
+        Args:
+            top_words: Número de palabras más buscadas a incluir
+
+        Returns:
+            Diccionario con conteos, tasa de éxito, tiempos y palabras más buscadas
+        """
+        with self._lock:
+            total = self.total_searches
+            return {
+                "total_searches": total,
+                "successful_searches": self.successful_searches,
+                "success_rate": (self.successful_searches / total) * 100 if total else 0.0,
+                "average_search_time": self.search_times.mean,
+                "min_search_time": self.search_times.minimum,
+                "max_search_time": self.search_times.maximum,
+                "stddev_search_time": self.search_times.stddev,
+                "total_processing_time": self.search_times.total,
+                "average_confidence": self.confidence_total / total if total else 0.0,
+                "most_searched_words": self.words.most_common(top_words),
+            }
+
+    def __len__(self) -> int:
+        """Retorna el número de búsquedas conservadas en el búfer."""
+        return len(self._results)
+
+    def __iter__(self) -> Iterator["SearchResult"]:
+        """Recorre las búsquedas conservadas de la más antigua a la más reciente."""
+        with self._lock:
+            return iter(list(self._results))
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Obtiene una búsqueda por posición o un corte de búsquedas.
+
+        Args:
+            index: Posición (admite negativas) o corte
+
+        Returns:
+            SearchResult o lista de SearchResult
+        """
+        with self._lock:
+            if isinstance(index, slice):
+                return [self._results[position] for position in range(*index.indices(len(self._results)))]
+            return self._results[index]
+
+    def __bool__(self) -> bool:
+        """Indica si hay búsquedas conservadas en el búfer."""
+        return bool(self._results)
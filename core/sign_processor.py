@@ -8,9 +8,10 @@ Autor: Signify Team
 Versión: 2.0.0
 """
 
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from audio.speech_engine import (
     SpeechEngine,
@@ -18,7 +19,55 @@ from audio.speech_engine import (
     get_speech_engine,
     get_voice_recognition,
 )
-from database.signs_database import SignEntry, SignsDatabase, get_database_instance
+from audio.speech_queue import PRIORITY_HIGH
+from core.query_cache import QueryCache
+from core.search_history import DEFAULT_HISTORY_SIZE, SearchHistory
+from core.tracing import (
+    PHASE_CACHE,
+    PHASE_EXACT,
+    PHASE_FUZZY,
+    PHASE_NORMALIZE,
+    PHASE_REWRITE,
+    PHASE_TOTAL,
+    SearchTracer,
+    SpanExporter,
+    create_exporter,
+)
+from database.lemma_index import QueryRewrite
+from database.signs_database import SignEntry, get_database_instance
+from database.storage import SignLookupTable, SignsBackend
+
+# Umbral por defecto de la búsqueda difusa por término (coincide con DatabaseConfig)
+DEFAULT_FUZZY_SEARCH_THRESHOLD = 0.6
+
+# Tiempos límite por defecto en segundos (coinciden con DatabaseConfig y AudioConfig)
+DEFAULT_SEARCH_TIMEOUT = 5.0
+DEFAULT_VOICE_TIMEOUT = 5.0
+
+
+@dataclass
+class PhraseSegment:
+    """
+    Segmento de una frase traducida a señas.
+    
+    Attributes:
+        text: Términos (plegados) de la frase que cubre el segmento
+        sign: Seña de la glosa o de su reescritura por lema o sinónimo (None si no hay)
+        rewrite: Reescritura aplicada para encontrar la seña (None para glosas conocidas)
+        suggestion: Seña más parecida por búsqueda difusa cuando no hay seña; es
+            solo una sugerencia y no cuenta como encontrada
+        similarity: Similitud de la sugerencia (0.0 sin sugerencia)
+    """
+    text: str
+    sign: Optional[SignEntry] = None
+    rewrite: Optional[QueryRewrite] = None
+    suggestion: Optional[SignEntry] = None
+    similarity: float = 0.0
+    
+    @property
+    def found(self) -> bool:
+        """Indica si el segmento tiene seña."""
+        return self.sign is not None
 
 
 @dataclass
@@ -33,6 +82,10 @@ class SearchResult:
         similar_matches: Lista de coincidencias similares con puntuación
         search_time: Tiempo de búsqueda en segundos
         timestamp: Marca de tiempo de la búsqueda
+        rewrites: Reescrituras por lema o sinónimo aplicadas para encontrar la seña
+        variants: Variantes regionales de la seña encontrada (vacía si solo hay una)
+        phrase: Traducción por segmentos de una frase sin seña propia (vacía para
+            una sola palabra)
     """
     query: str
     found: bool
@@ -40,6 +93,9 @@ class SearchResult:
     similar_matches: List[Tuple[SignEntry, float]] = field(default_factory=list)
     search_time: float = 0.0
     timestamp: float = field(default_factory=time.time)
+    rewrites: List[QueryRewrite] = field(default_factory=list)
+    variants: List[SignEntry] = field(default_factory=list)
+    phrase: List[PhraseSegment] = field(default_factory=list)
     
     def get_best_match(self) -> Optional[SignEntry]:
         """
@@ -68,12 +124,113 @@ class SearchResult:
         return 0.0
 
 
+class SharedResources:
+    """
+    Recursos de solo lectura compartidos por todos los procesadores del proceso.
+    
+    Agrupa la base de datos con sus índices, los motores de voz, la caché de
+    resultados y el trazador de latencias (ambos seguros entre hilos). Se
+    crean una sola vez por proceso; el estado de cada sesión vive en su propio
+    ``SignProcessor``.
+    """
+    
+    def __init__(self, database: Optional[SignsBackend] = None,
+                 speech_engine: Optional[SpeechEngine] = None,
+                 voice_recognition: Optional[VoiceRecognitionEngine] = None) -> None:
+        """
+        Inicializa los recursos compartidos.
+        
+        Args:
+            database: Backend de señas, en memoria o SQLite (por defecto, la instancia global)
+            speech_engine: Motor de síntesis de voz (por defecto, el global)
+            voice_recognition: Motor de reconocimiento de voz (por defecto, el global)
+        """
+        self.database: SignsBackend = database or get_database_instance()
+        self.speech_engine = speech_engine or get_speech_engine()
+        self.voice_recognition = voice_recognition or get_voice_recognition()
+        
+        config = self._load_config()
+        database_config = config.database if config else None
+        self.search_history_size = (
+            database_config.search_history_size if database_config else DEFAULT_HISTORY_SIZE
+        )
+        self.fuzzy_search_threshold = (
+            database_config.fuzzy_search_threshold if database_config else DEFAULT_FUZZY_SEARCH_THRESHOLD
+        )
+        self.search_timeout = (
+            database_config.search_timeout if database_config else DEFAULT_SEARCH_TIMEOUT
+        )
+        self.voice_timeout = config.audio.voice_timeout if config else DEFAULT_VOICE_TIMEOUT
+        self.result_cache = self._create_result_cache(database_config)
+        self.tracer = SearchTracer(self._create_trace_exporter(config.system if config else None))
+    
+    def _load_config(self) -> Optional[Any]:
+        """
+        Lee la configuración global de la aplicación.
+        
+        Returns:
+            AppConfig global o None si no se pudo leer
+        """
+        try:
+            from utils.config_utils import get_global_config
+            return get_global_config()
+        except Exception as e:
+            print(f"⚠️ No se pudo leer la configuración de búsqueda: {e}")
+            return None
+    
+    def _create_trace_exporter(self, system_config: Optional[Any]) -> Optional[SpanExporter]:
+        """
+        Crea el exportador de latencias si ``SystemConfig.performance_monitoring`` está activo.
+        
+        Args:
+            system_config: Configuración del sistema (None para no exportar)
+        
+        Returns:
+            Exportador de tramos o None si no se exporta
+        """
+        if system_config is None or not system_config.performance_monitoring:
+            return None
+        
+        try:
+            return create_exporter(system_config.trace_exporter, system_config.trace_export_path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ No se pudo crear el exportador de latencias: {e}")
+            return None
+    
+    def _create_result_cache(self, database_config: Optional[Any]) -> Optional[QueryCache]:
+        """
+        Crea la caché de resultados según ``DatabaseConfig``.
+        
+        Args:
+            database_config: Configuración de la base de datos (None para no usar caché)
+        
+        Returns:
+            QueryCache configurada o None si la caché está desactivada
+        """
+        if database_config is None or not database_config.cache_enabled:
+            return None
+        
+        return QueryCache(database_config.cache_max_entries, database_config.cache_ttl)
+    
+    def cleanup(self) -> None:
+        """Libera los motores de voz y cierra el exportador de latencias."""
+        self.tracer.close()
+        try:
+            self.speech_engine.cleanup()
+            self.voice_recognition.cleanup()
+        except Exception as e:
+            print(f"⚠️ Error durante limpieza de los recursos compartidos: {e}")
+
+
 class SignProcessor:
     """
     Procesador principal que maneja todas las operaciones de señas.
     
     Integra la base de datos de señas, el motor de síntesis de voz
     y el reconocimiento de voz para proporcionar una interfaz unificada.
+    Cada sesión de usuario usa su propio procesador (historial propio) sobre
+    los ``SharedResources`` del proceso, por lo que varias sesiones pueden
+    buscar en paralelo sin compartir estado mutable.
     """
     
     # Configuraciones por defecto
@@ -81,13 +238,21 @@ class SignProcessor:
     DEFAULT_VOICE_DURATION = 5
     MIN_SIMILARITY_THRESHOLD = 0.3
     
-    def __init__(self) -> None:
-        """Inicializa el procesador de señas."""
-        self.database = get_database_instance()
-        self.speech_engine = get_speech_engine()
-        self.voice_recognition = get_voice_recognition()
-        self.search_history: List[SearchResult] = []
+    def __init__(self, shared: Optional[SharedResources] = None) -> None:
+        """
+        Inicializa el procesador de señas.
+        
+        Args:
+            shared: Recursos compartidos del proceso (por defecto, los globales)
+        """
+        self.shared = shared or get_shared_resources()
+        self.database: SignsBackend = self.shared.database
+        self.speech_engine = self.shared.speech_engine
+        self.voice_recognition = self.shared.voice_recognition
+        self._result_cache = self.shared.result_cache
+        self._tracer = self.shared.tracer
         self._category_keywords = self._initialize_category_keywords()
+        self.search_history = SearchHistory(self.shared.search_history_size)
     
     def _initialize_category_keywords(self) -> Dict[str, List[str]]:
         """
@@ -117,9 +282,19 @@ class SignProcessor:
         """
         Busca una seña en la base de datos.
         
+        Una palabra con variantes regionales ("mayo") retorna todas ellas en
+        ``variants`` con una sola consulta. Si no hay coincidencia exacta y
+        ``include_similar`` está activo, la consulta se reescribe por lema o
+        sinónimo ("necesitando" -> "necesitar") antes de recurrir a la
+        búsqueda difusa; las reescrituras aplicadas quedan en el resultado.
+        Con ``include_similar=False`` solo cuenta la coincidencia exacta.
+        Los resultados se guardan en caché por (consulta normalizada, idioma,
+        include_similar, max_similar) hasta que la base de datos cambie. La
+        duración de cada fase se registra en el trazador de latencias.
+        
         Args:
             query: Palabra a buscar
-            include_similar: Si incluir búsquedas similares
+            include_similar: Si incluir reescrituras y búsquedas similares
             max_similar: Número máximo de resultados similares
             language: Idioma en el que buscar
             
@@ -129,32 +304,78 @@ class SignProcessor:
         if not query or not query.strip():
             return SearchResult(query="", found=False)
         
-        start_time = time.time()
+        spans: Dict[str, int] = {}
+        start_ns = time.perf_counter_ns()
         # Normalizar la consulta para búsqueda pero mantener la original para mostrar
         original_query = query.strip()
         normalized_query = self._normalize_search_query(original_query)
+        phase_end = time.perf_counter_ns()
+        spans[PHASE_NORMALIZE] = phase_end - start_ns
+        
+        cache_key = (normalized_query, language, include_similar, max_similar)
+        cached = None
+        if self._result_cache is not None:
+            # La generación se lee antes de buscar para no guardar resultados obsoletos
+            generation = self.database.get_generation()
+            cached = self._result_cache.get(cache_key, generation)
+            phase_start, phase_end = phase_end, time.perf_counter_ns()
+            spans[PHASE_CACHE] = phase_end - phase_start
+        
+        if cached is not None:
+            exact_match, cached_similar, cached_rewrites, cached_variants = cached
+            similar_matches = list(cached_similar)
+            rewrites = list(cached_rewrites)
+            variants = list(cached_variants)
+        else:
+            # Búsqueda exacta con la consulta normalizada (junto con sus variantes regionales)
+            variants = self.database.search_variants(normalized_query, language)
+            exact_match = variants[0] if variants else None
+            if len(variants) < 2:
+                variants = []
+            phase_start, phase_end = phase_end, time.perf_counter_ns()
+            spans[PHASE_EXACT] = phase_end - phase_start
+            
+            # Reescritura por lema o sinónimo si no hay coincidencia exacta
+            rewrites = []
+            if not exact_match and include_similar:
+                rewritten = self.database.search_rewritten(normalized_query, language)
+                if rewritten is not None:
+                    exact_match, rewrite = rewritten
+                    rewrites.append(rewrite)
+                phase_start, phase_end = phase_end, time.perf_counter_ns()
+                spans[PHASE_REWRITE] = phase_end - phase_start
+            
+            # Búsqueda similar si no hay coincidencia exacta
+            similar_matches = []
+            if not exact_match and include_similar:
+                similar_matches = self.database.search_fuzzy(
+                    normalized_query, 
+                    max_results=max_similar,
+                    min_similarity=self.MIN_SIMILARITY_THRESHOLD,
+                    language=language
+                )
+                phase_start, phase_end = phase_end, time.perf_counter_ns()
+                spans[PHASE_FUZZY] = phase_end - phase_start
+            
+            if self._result_cache is not None:
+                self._result_cache.put(
+                    cache_key,
+                    (exact_match, tuple(similar_matches), tuple(rewrites), tuple(variants)),
+                    generation
+                )
         
-        # Búsqueda exacta con la consulta normalizada
-        exact_match = self.database.search_exact(normalized_query, language)
-        
-        # Búsqueda similar si no hay coincidencia exacta
-        similar_matches = []
-        if not exact_match and include_similar:
-            similar_matches = self.database.search_fuzzy(
-                normalized_query, 
-                max_results=max_similar,
-                min_similarity=self.MIN_SIMILARITY_THRESHOLD,
-                language=language
-            )
-        
-        search_time = time.time() - start_time
+        spans[PHASE_TOTAL] = time.perf_counter_ns() - start_ns
+        self._tracer.record_search(spans)
+        search_time = spans[PHASE_TOTAL] / 1e9
         
         result = SearchResult(
             query=original_query,  # Mantener la consulta original
             found=exact_match is not None,
             exact_match=exact_match,
             similar_matches=similar_matches,
-            search_time=search_time
+            search_time=search_time,
+            rewrites=rewrites,
+            variants=variants
         )
         
         # Agregar a historial
@@ -184,13 +405,118 @@ class SignProcessor:
         
         return normalized
 
-    def search_partial(self, partial_query: str, max_results: int = 10) -> List[SignEntry]:
+    def search_many(self, queries: Sequence[str],
+                    languages: Optional[Sequence[str]] = None) -> SignLookupTable:
+        """
+        Busca exactamente varias consultas en varios idiomas en una sola pasada.
+        
+        Las consultas se normalizan una vez y no se registran en el historial.
+        
+        Args:
+            queries: Consultas a buscar
+            languages: Idiomas en los que buscar (por defecto, todos)
+            
+        Returns:
+            Tabla densa consulta × idioma (las filas conservan las consultas originales)
+        """
+        queries = list(queries)
+        table = self.database.search_many(
+            [self._normalize_search_query(query) for query in queries], languages
+        )
+        table.words = queries
+        return table
+    
+    def translate_phrase(self, query: str, language: str = "ecuatoriano",
+                         fuzzy_fallback: bool = False) -> List[PhraseSegment]:
+        """
+        Traduce una frase completa a una secuencia ordenada de señas.
+        
+        La frase se divide en una sola pasada en las glosas conocidas más
+        largas ("buenos días mamá" -> "buenos dias" + "mama"). Los términos
+        sin glosa se reescriben por lema o sinónimo con una consulta al
+        diccionario de raíces; nunca se recorre el corpus por cada término.
+        Con ``fuzzy_fallback`` los términos que siguen sin seña reciben la
+        más parecida (umbral ``DatabaseConfig.fuzzy_search_threshold``) como
+        sugerencia, sin contarla como encontrada.
+        
+        Args:
+            query: Frase a traducir (por ejemplo, una transcripción de voz)
+            language: Idioma en el que buscar
+            fuzzy_fallback: Si sugerir la seña más parecida para los términos sin seña
+            
+        Returns:
+            Lista de PhraseSegment en el orden de la frase
+        """
+        normalized_query = self._normalize_search_query(query)
+        if not normalized_query:
+            return []
+        
+        segments = []
+        for text, sign in self.database.segment_phrase(normalized_query, language):
+            if sign is not None:
+                segments.append(PhraseSegment(text=text, sign=sign))
+                continue
+            
+            rewritten = self.database.search_rewritten(text, language)
+            if rewritten is not None:
+                sign, rewrite = rewritten
+                segments.append(PhraseSegment(text=text, sign=sign, rewrite=rewrite))
+                continue
+            
+            segment = PhraseSegment(text=text)
+            if fuzzy_fallback:
+                matches = self.database.search_fuzzy(
+                    text,
+                    max_results=1,
+                    min_similarity=self.shared.fuzzy_search_threshold,
+                    language=language
+                )
+                if matches:
+                    segment.suggestion, segment.similarity = matches[0]
+            segments.append(segment)
+        
+        return segments
+    
+    def search_transcript(self, text: str, language: str = "ecuatoriano") -> SearchResult:
+        """
+        Busca una transcripción de voz, que puede ser una frase completa.
+        
+        Una palabra suelta, o una frase que es en sí una glosa ("buenos
+        días"), se busca con ``search_sign``. Una frase de varias glosas se
+        traduce con ``translate_phrase`` y la secuencia de señas queda en
+        ``phrase``; solo si ningún término tiene seña se recurre a la
+        búsqueda difusa sobre la frase completa.
+        
+        Args:
+            text: Texto transcrito
+            language: Idioma en el que buscar
+            
+        Returns:
+            SearchResult con la seña encontrada o la traducción por segmentos
+        """
+        start = time.perf_counter()
+        segments = self.translate_phrase(text, language)
+        if len(segments) < 2 or not any(segment.found for segment in segments):
+            return self.search_sign(text, language=language)
+        
+        result = SearchResult(
+            query=text.strip(),
+            found=False,
+            search_time=time.perf_counter() - start,
+            phrase=segments
+        )
+        self.search_history.append(result)
+        return result
+    
+    def search_partial(self, partial_query: str, max_results: int = 10,
+                       language: str = "ecuatoriano") -> List[SignEntry]:
         """
         Busca señas que contengan la consulta parcial.
         
         Args:
             partial_query: Parte de la palabra a buscar
             max_results: Número máximo de resultados
+            language: Idioma en el que buscar
             
         Returns:
             Lista de SignEntry que contienen la consulta parcial
@@ -198,14 +524,37 @@ class SignProcessor:
         if not partial_query or not partial_query.strip():
             return []
         
-        return self.database.search_partial(partial_query.strip(), max_results)
+        return self.database.search_partial(partial_query.strip(), max_results, language)
+    
+    def autocomplete(self, prefix: str, language: str = "ecuatoriano", k: int = 5) -> List[str]:
+        """
+        Sugiere palabras para completar lo que el usuario está escribiendo.
+        
+        Args:
+            prefix: Texto escrito hasta el momento
+            language: Idioma en el que buscar
+            k: Número máximo de sugerencias
+            
+        Returns:
+            Lista de palabras sugeridas
+        """
+        normalized_prefix = self._normalize_search_query(prefix)
+        if not normalized_prefix:
+            return []
+        
+        return [entry.word for entry in self.database.autocomplete(normalized_prefix, language, k)]
     
-    def process_voice_search(self, duration: int = DEFAULT_VOICE_DURATION) -> SearchResult:
+    def process_voice_search(self, duration: int = DEFAULT_VOICE_DURATION,
+                             language: str = "ecuatoriano") -> SearchResult:
         """
         Procesa búsqueda por voz.
         
+        La transcripción se busca con ``search_transcript``, de modo que una
+        frase completa se traduce a su secuencia de señas.
+        
         Args:
             duration: Duración de la grabación en segundos
+            language: Idioma en el que buscar
             
         Returns:
             SearchResult con los resultados
@@ -226,13 +575,15 @@ class SignProcessor:
                 search_time=0.0
             )
         
-        # Buscar la seña transcrita
-        return self.search_sign(transcribed_text)
+        # Buscar la seña (o la secuencia de señas) transcrita
+        return self.search_transcript(transcribed_text, language)
     
     def speak_search_result(self, result: SearchResult) -> None:
         """
         Reproduce el resultado de búsqueda usando síntesis de voz.
         
+        El enunciado reemplaza la voz pendiente o en curso de búsquedas anteriores.
+        
         Args:
             result: Resultado de búsqueda a reproducir
         """
@@ -242,8 +593,11 @@ class SignProcessor:
         if result.found and result.exact_match:
             self.speech_engine.speak_sign_instruction(
                 result.exact_match.word,
-                result.exact_match.instructions
+                result.exact_match.instructions,
+                result.exact_match.language
             )
+        elif any(segment.found for segment in result.phrase):
+            self.speak_phrase(result.phrase)
         elif result.similar_matches:
             # Reproducir la mejor coincidencia similar
             best_match, similarity_score = result.similar_matches[0]
@@ -254,10 +608,32 @@ class SignProcessor:
                 f"{best_match.instructions}"
             )
             
-            self.speech_engine.speak_text(suggestion_text)
+            self.speech_engine.speak_text(suggestion_text, priority=PRIORITY_HIGH, interrupt=True)
         else:
             self.speech_engine.speak_search_result(result.query, False)
     
+    def speak_phrase(self, segments: List[PhraseSegment]) -> None:
+        """
+        Reproduce en orden las señas de una frase traducida.
+        
+        El primer enunciado reemplaza la voz pendiente o en curso; los demás
+        se encolan detrás de él. Los segmentos sin seña se omiten.
+        
+        Args:
+            segments: Segmentos retornados por ``translate_phrase``
+        """
+        interrupt = True
+        for segment in segments:
+            if segment.sign is None:
+                continue
+            self.speech_engine.speak_sign_instruction(
+                segment.sign.word,
+                segment.sign.instructions,
+                segment.sign.language,
+                interrupt=interrupt
+            )
+            interrupt = False
+    
     def speak_search_results(self, results: List[SearchResult]) -> None:
         """
         Reproduce una lista de resultados de búsqueda.
@@ -286,13 +662,15 @@ class SignProcessor:
         """
         return self.database.get_random_signs(count)
     
-    def get_signs_by_category(self, category: str, max_results: int = 20) -> List[SignEntry]:
+    def get_signs_by_category(self, category: str, max_results: int = 20,
+                              language: str = "ecuatoriano") -> List[SignEntry]:
         """
         Obtiene señas por categoría.
         
         Args:
             category: Categoría a buscar
             max_results: Número máximo de resultados
+            language: Idioma en el que buscar
             
         Returns:
             Lista de señas de la categoría
@@ -303,13 +681,13 @@ class SignProcessor:
         category_lower = category.lower().strip()
         
         # Buscar por categoría directa primero
-        direct_results = self.database.search_by_category(category, max_results)
+        direct_results = self.database.search_by_category(category, language, max_results)
         if direct_results:
             return direct_results
         
         # Buscar usando palabras clave predefinidas
         keywords = self._category_keywords.get(category_lower, [category])
-        return self.database.get_signs_by_keywords(keywords, max_results)
+        return self.database.get_signs_by_keywords(keywords, language, max_results)
     
     def get_available_categories(self) -> List[str]:
         """
@@ -329,42 +707,22 @@ class SignProcessor:
         """
         Obtiene estadísticas de búsqueda.
         
+        Los agregados se mantienen de forma incremental y abarcan todas las
+        búsquedas desde la última limpieza, no solo las conservadas en el
+        historial; las palabras más buscadas son conteos estimados.
+        
         Returns:
             Diccionario con estadísticas detalladas
         """
-        if not self.search_history:
-            return {
-                "total_searches": 0,
-                "successful_searches": 0,
-                "success_rate": 0.0,
-                "average_search_time": 0.0,
-                "average_confidence": 0.0,
-                "most_searched_words": [],
-                "database_stats": self.database.get_database_stats()
-            }
-        
-        total_searches = len(self.search_history)
-        successful_searches = sum(1 for result in self.search_history if result.found)
-        success_rate = (successful_searches / total_searches) * 100
-        average_search_time = sum(result.search_time for result in self.search_history) / total_searches
-        average_confidence = sum(result.get_confidence_score() for result in self.search_history) / total_searches
-        
-        # Palabras más buscadas
-        word_counts = {}
-        for result in self.search_history:
-            word = result.query.lower()
-            if word:  # Evitar consultas vacías
-                word_counts[word] = word_counts.get(word, 0) + 1
-        
-        most_searched = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        summary = self.search_history.get_summary()
         
         return {
-            "total_searches": total_searches,
-            "successful_searches": successful_searches,
-            "success_rate": success_rate,
-            "average_search_time": average_search_time,
-            "average_confidence": average_confidence,
-            "most_searched_words": most_searched,
+            "total_searches": summary["total_searches"],
+            "successful_searches": summary["successful_searches"],
+            "success_rate": summary["success_rate"],
+            "average_search_time": summary["average_search_time"],
+            "average_confidence": summary["average_confidence"],
+            "most_searched_words": summary["most_searched_words"],
             "database_stats": self.database.get_database_stats()
         }
     
@@ -372,26 +730,41 @@ class SignProcessor:
         """
         Obtiene métricas de rendimiento del procesador.
         
+        Los tiempos agregados corresponden a las búsquedas de esta sesión; los
+        percentiles por fase (``<fase>_p50_ms``, ``_p95_ms``, ``_p99_ms``...)
+        a todas las búsquedas del proceso.
+        
         Returns:
             Diccionario con métricas de rendimiento
         """
-        if not self.search_history:
-            return {
-                "avg_search_time": 0.0,
-                "min_search_time": 0.0,
-                "max_search_time": 0.0,
-                "total_processing_time": 0.0
-            }
-        
-        search_times = [result.search_time for result in self.search_history]
+        summary = self.search_history.get_summary(top_words=0)
         
         return {
-            "avg_search_time": sum(search_times) / len(search_times),
-            "min_search_time": min(search_times),
-            "max_search_time": max(search_times),
-            "total_processing_time": sum(search_times)
+            "avg_search_time": summary["average_search_time"],
+            "min_search_time": summary["min_search_time"],
+            "max_search_time": summary["max_search_time"],
+            "total_processing_time": summary["total_processing_time"],
+            **self._tracer.get_metrics()
         }
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene los contadores de la caché de resultados.
+        
+        Returns:
+            Diccionario con aciertos, fallos y tamaño de la caché
+            (``{"enabled": False}`` si está desactivada)
+        """
+        if self._result_cache is None:
+            return {"enabled": False}
+        
+        return {"enabled": True, **self._result_cache.get_stats()}
+    
+    def clear_result_cache(self) -> None:
+        """Vacía la caché de resultados de búsqueda."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+    
     def clear_search_history(self) -> None:
         """Limpia el historial de búsquedas."""
         self.search_history.clear()
@@ -406,14 +779,11 @@ class SignProcessor:
         Returns:
             Lista de SearchResult más recientes
         """
-        if not self.search_history:
-            return []
-        
-        return self.search_history[-limit:] if len(self.search_history) >= limit else self.search_history
+        return self.search_history.recent(limit)
     
     def get_successful_searches(self, limit: Optional[int] = None) -> List[SearchResult]:
         """
-        Obtiene solo las búsquedas exitosas.
+        Obtiene solo las búsquedas exitosas conservadas en el historial.
         
         Args:
             limit: Número máximo de resultados (None para todos)
@@ -442,6 +812,7 @@ class SignProcessor:
                 "word": result.exact_match.word if result.exact_match else None,
                 "instructions": result.exact_match.instructions if result.exact_match else None,
                 "category": result.exact_match.category if result.exact_match else None,
+                "language": result.exact_match.language if result.exact_match else None,
                 "search_time": result.search_time,
                 "confidence_score": result.get_confidence_score(),
                 "similar_matches_count": len(result.similar_matches),
@@ -454,19 +825,33 @@ class SignProcessor:
         """
         Importa historial de búsquedas desde datos externos.
         
+        Las palabras encontradas se resuelven contra la base de datos con una
+        única búsqueda en bloque, de modo que el historial importado apunta a
+        las entradas actuales; si una palabra ya no existe se reconstruye la
+        entrada a partir de los datos exportados.
+        
         Args:
             history_data: Lista de diccionarios con datos de historial
         """
+        words = [data.get("word") or "" for data in history_data if isinstance(data, dict)]
+        languages = list(dict.fromkeys(
+            data.get("language") or "ecuatoriano" for data in history_data if isinstance(data, dict)
+        ))
+        lookup = self.database.search_many(words, languages) if words else None
+        
         for data in history_data:
             try:
                 # Reconstruir SearchResult desde datos
                 exact_match = None
                 if data.get("word") and data.get("instructions"):
-                    exact_match = SignEntry(
-                        word=data["word"],
-                        instructions=data["instructions"],
-                        category=data.get("category", "General")
-                    )
+                    exact_match = lookup.get(data["word"], data.get("language") or "ecuatoriano")
+                    if exact_match is None:
+                        exact_match = SignEntry(
+                            word=data["word"],
+                            instructions=data["instructions"],
+                            category=data.get("category", "General"),
+                            language=data.get("language") or "ecuatoriano"
+                        )
                 
                 result = SearchResult(
                     query=data["query"],
@@ -495,28 +880,64 @@ class SignProcessor:
         }
     
     def cleanup(self) -> None:
-        """Limpia recursos del procesador."""
-        try:
-            self.speech_engine.cleanup()
-            self.voice_recognition.cleanup()
-        except Exception as e:
-            print(f"⚠️ Error durante limpieza del procesador: {e}")
+        """
+        Limpia el estado de la sesión.
+        
+        Los motores de voz son compartidos y se liberan con ``cleanup_processor``.
+        """
+        self.search_history.clear()
 
 
-# Instancia global singleton del procesador
+# Instancias globales singleton de los recursos compartidos y del procesador
+_shared_resources: Optional[SharedResources] = None
 _processor_instance: Optional[SignProcessor] = None
+_singleton_lock = threading.Lock()
+
+
+def get_shared_resources() -> SharedResources:
+    """
+    Obtiene los recursos compartidos del proceso (se crean una sola vez).
+    
+    Returns:
+        Instancia de SharedResources
+    """
+    global _shared_resources
+    if _shared_resources is None:
+        with _singleton_lock:
+            if _shared_resources is None:
+                _shared_resources = SharedResources()
+    return _shared_resources
+
+
+def create_session_processor() -> SignProcessor:
+    """
+    Crea un procesador con estado propio para una sesión de usuario.
+    
+    Comparte la base de datos, los motores de voz y la caché con el resto de
+    sesiones, pero tiene su propio historial de búsquedas.
+    
+    Returns:
+        Nueva instancia de SignProcessor
+    """
+    return SignProcessor(get_shared_resources())
 
 
 def get_processor() -> SignProcessor:
     """
     Obtiene la instancia singleton del procesador.
     
+    Su historial es común a todo el proceso; las sesiones de la interfaz
+    deben usar ``create_session_processor``.
+    
     Returns:
         Instancia de SignProcessor
     """
     global _processor_instance
     if _processor_instance is None:
-        _processor_instance = SignProcessor()
+        shared = get_shared_resources()
+        with _singleton_lock:
+            if _processor_instance is None:
+                _processor_instance = SignProcessor(shared)
     return _processor_instance
 
 
@@ -554,8 +975,11 @@ def voice_search_and_speak(duration: int = 5) -> SearchResult:
 
 
 def cleanup_processor() -> None:
-    """Limpia la instancia global del procesador."""
-    global _processor_instance
+    """Limpia la instancia global del procesador y libera los recursos compartidos."""
+    global _processor_instance, _shared_resources
     if _processor_instance:
         _processor_instance.cleanup()
-        _processor_instance = None
\ No newline at end of file
+        _processor_instance = None
+    if _shared_resources:
+        _shared_resources.cleanup()
+        _shared_resources = None
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Instrumentación de Latencia de Búsquedas
+
+Mide cada fase de ``SignProcessor.search_sign`` (normalización, caché,
+búsqueda exacta, reescritura por lemas, búsqueda difusa y total) con
+``time.perf_counter_ns`` y acumula las duraciones en histogramas
+log-lineales de memoria acotada, de los que se obtienen percentiles
+p50/p95/p99. Opcionalmente exporta los tramos a un archivo JSONL o a un
+archivo de texto con formato Prometheus.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+# Fases instrumentadas de una búsqueda
+PHASE_NORMALIZE = "normalize"
+PHASE_CACHE = "cache"
+PHASE_EXACT = "exact"
+PHASE_REWRITE = "rewrite"
+PHASE_FUZZY = "fuzzy"
+PHASE_TOTAL = "total"
+SEARCH_PHASES = (PHASE_NORMALIZE, PHASE_CACHE, PHASE_EXACT, PHASE_REWRITE, PHASE_FUZZY, PHASE_TOTAL)
+
+# Exportadores disponibles para SystemConfig.trace_exporter
+EXPORTER_JSONL = "jsonl"
+EXPORTER_PROMETHEUS = "prometheus"
+AVAILABLE_EXPORTERS = (EXPORTER_JSONL, EXPORTER_PROMETHEUS)
+
+# Percentiles publicados en las métricas
+REPORTED_PERCENTILES = (50, 95, 99)
+
+# Bits de subdivisión de cada potencia de dos (error relativo máximo 1/8)
+SUB_BUCKET_BITS = 4
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+
+class LatencyHistogram:
+    """
+    Histograma log-lineal de duraciones en nanosegundos.
+
+    Cada potencia de dos se divide en ``2 ** (SUB_BUCKET_BITS - 1)`` cubetas,
+    de modo que los percentiles tienen un error relativo acotado y el número
+    de cubetas crece solo con el logaritmo del rango de valores.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el histograma vacío."""
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    @staticmethod
+    def _bucket_index(value: int) -> int:
+        """Calcula la cubeta de un valor."""
+        shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+        return shift * SUB_BUCKET_HALF + (value >> shift)
+
+    @staticmethod
+    def _bucket_bounds(index: int) -> Tuple[int, int]:
+        """Calcula el rango [inferior, superior] de valores de una cubeta."""
+        if index < 2 * SUB_BUCKET_HALF:
+            return index, index
+        shift = index // SUB_BUCKET_HALF - 1
+        top = index - shift * SUB_BUCKET_HALF
+        return top << shift, ((top + 1) << shift) - 1
+
+    def record(self, duration_ns: int) -> None:
+        """
+        Registra una duración.
+
+        Args:
+            duration_ns: Duración en nanosegundos
+        """
+        duration_ns = max(int(duration_ns), 0)
+        index = self._bucket_index(duration_ns)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        if self.count == 0:
+            self.min_ns = self.max_ns = duration_ns
+        else:
+            self.min_ns = min(self.min_ns, duration_ns)
+            self.max_ns = max(self.max_ns, duration_ns)
+        self.count += 1
+        self.total_ns += duration_ns
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estima un percentil.
+
+        Args:
+            percent: Percentil a estimar (0 - 100)
+
+        Returns:
+            Duración estimada en nanosegundos (0.0 si no hay registros)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                lower, upper = self._bucket_bounds(index)
+                estimate = (lower + upper) / 2
+                return float(min(max(estimate, self.min_ns), self.max_ns))
+        return float(self.max_ns)
+
+    @property
+    def mean_ns(self) -> float:
+        """Duración media en nanosegundos."""
+        return self.total_ns / self.count if self.count else 0.0
+
+
+class SpanExporter(ABC):
+    """Interfaz base de los exportadores de tramos de búsqueda."""
+
+    @abstractmethod
+    def export(self, spans: Dict[str, int], tracer: "SearchTracer") -> None:
+        """
+        Exporta los tramos de una búsqueda.
+
+        Args:
+            spans: Duración en nanosegundos por fase
+            tracer: Trazador con los histogramas acumulados
+        """
+
+    def close(self, tracer: "SearchTracer") -> None:
+        """
+        Vacía y cierra el exportador.
+
+        Args:
+            tracer: Trazador con los histogramas acumulados
+        """
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Agrega una línea JSON por búsqueda con la duración de cada fase."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Inicializa el exportador.
+
+        Args:
+            path: Ruta del archivo JSONL (se agrega al final)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def export(self, spans: Dict[str, int], tracer: "SearchTracer") -> None:
+        """Escribe los tramos de una búsqueda como una línea JSON."""
+        line = json.dumps({"timestamp": time.time(), "spans_ns": spans})
+        self._file.write(line + "\n")
+        self._file.flush()
+
+    def close(self, tracer: "SearchTracer") -> None:
+        """Cierra el archivo."""
+        self._file.close()
+
+
+class PrometheusFileExporter(SpanExporter):
+    """
+    Escribe los histogramas en formato de texto de Prometheus.
+
+    El archivo se reescribe de forma atómica cada ``write_every`` búsquedas
+    (y al cerrar), para que lo recoja el colector de archivos de texto de
+    node_exporter u otro similar.
+    """
+
+    def __init__(self, path: Union[str, Path], write_every: int = 100) -> None:
+        """
+        Inicializa el exportador.
+
+        Args:
+            path: Ruta del archivo .prom
+            write_every: Número de búsquedas entre escrituras
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.write_every = write_every
+        self._pending = 0
+
+    def export(self, spans: Dict[str, int], tracer: "SearchTracer") -> None:
+        """Reescribe el archivo cada ``write_every`` búsquedas."""
+        self._pending += 1
+        if self._pending >= self.write_every:
+            self._write(tracer)
+
+    def close(self, tracer: "SearchTracer") -> None:
+        """Escribe el estado final de los histogramas."""
+        if self._pending:
+            self._write(tracer)
+
+    def _write(self, tracer: "SearchTracer") -> None:
+        """Escribe el archivo de texto de forma atómica."""
+        self._pending = 0
+        lines = [
+            "# HELP signify_search_phase_seconds Latencia de las fases de búsqueda de señas.",
+            "# TYPE signify_search_phase_seconds summary",
+        ]
+        for phase, histogram in tracer.histograms.items():
+            for percent in REPORTED_PERCENTILES:
+                lines.append(
+                    f'signify_search_phase_seconds{{phase="{phase}",quantile="{percent / 100}"}} '
+                    f"{histogram.percentile(percent) / 1e9:.9f}"
+                )
+            lines.append(f'signify_search_phase_seconds_sum{{phase="{phase}"}} {histogram.total_ns / 1e9:.9f}')
+            lines.append(f'signify_search_phase_seconds_count{{phase="{phase}"}} {histogram.count}')
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            print(f"⚠️ No se pudieron exportar las métricas de búsqueda: {e}")
+
+
+class SearchTracer:
+    """
+    Acumula la latencia por fase de las búsquedas. Es seguro entre hilos.
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None) -> None:
+        """
+        Inicializa el trazador.
+
+        Args:
+            exporter: Exportador de tramos (opcional)
+        """
+        self.histograms: Dict[str, LatencyHistogram] = {phase: LatencyHistogram() for phase in SEARCH_PHASES}
+        self.exporter = exporter
+        self._lock = threading.Lock()
+
+    def record_search(self, spans: Dict[str, int]) -> None:
+        """
+        Registra los tramos de una búsqueda.
+
+        Args:
+            spans: Duración en nanosegundos por fase (las fases omitidas no se ejecutaron)
+        """
+        with self._lock:
+            for phase, duration_ns in spans.items():
+                histogram = self.histograms.get(phase)
+                if histogram is None:
+                    histogram = self.histograms[phase] = LatencyHistogram()
+                histogram.record(duration_ns)
+
+            if self.exporter is not None:
+                try:
+                    self.exporter.export(spans, self)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Exportador de trazas desactivado: {e}")
+                    self.exporter = None
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Obtiene los percentiles de latencia por fase.
+
+        Returns:
+            Diccionario plano {"<fase>_p50_ms": ..., "<fase>_count": ...}
+        """
+        metrics: Dict[str, float] = {}
+        with self._lock:
+            for phase, histogram in self.histograms.items():
+                metrics[f"{phase}_count"] = histogram.count
+                metrics[f"{phase}_mean_ms"] = histogram.mean_ns / 1e6
+                for percent in REPORTED_PERCENTILES:
+                    metrics[f"{phase}_p{percent}_ms"] = histogram.percentile(percent) / 1e6
+                metrics[f"{phase}_max_ms"] = histogram.max_ns / 1e6
+        return metrics
+
+    def reset(self) -> None:
+        """Vacía los histogramas."""
+        with self._lock:
+            self.histograms = {phase: LatencyHistogram() for phase in SEARCH_PHASES}
+
+    def close(self) -> None:
+        """Vacía y cierra el exportador."""
+        with self._lock:
+            if self.exporter is not None:
+                self.exporter.close(self)
+                self.exporter = None
+
+
+def create_exporter(kind: str, path: Optional[Union[str, Path]] = None) -> SpanExporter:
+    """
+    Crea un exportador de tramos.
+
+    Args:
+        kind: Tipo de exportador ("jsonl" o "prometheus")
+        path: Ruta del archivo (por defecto en el directorio de logs)
+
+    Returns:
+        Exportador configurado
+
+    Raises:
+        ValueError: Si el tipo de exportador no existe
+    """
+    if kind not in AVAILABLE_EXPORTERS:
+        raise ValueError(f"Exportador de trazas desconocido: {kind}. Opciones: {AVAILABLE_EXPORTERS}")
+
+    if path is None:
+        from utils.file_utils import get_logs_directory
+
+        filename = "search_spans.jsonl" if kind == EXPORTER_JSONL else "search_latency.prom"
+        path = get_logs_directory() / filename
+
+    if kind == EXPORTER_JSONL:
+        return JsonlSpanExporter(path)
+    return PrometheusFileExporter(path)
@@ -0,0 +1,345 @@
+"""
+Pruebas de Rendimiento de la Base de Datos de Señas.
+
+Genera corpus sintéticos en CSV con el mismo formato que los archivos
+reales y mide las operaciones de búsqueda de ``SignsDatabase``.
+
+Uso:
+    python -m database.benchmarks
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import csv
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from io import StringIO
+from typing import Dict, List, Sequence
+
+from database.fuzzy_index import LinearScanIndex
+from database.signs_database import SignEntry, SignsDatabase
+
+# Sílabas para generar glosas sintéticas con aspecto de español
+SYLLABLES = [
+    "ma", "pa", "ta", "la", "sa", "ca", "da", "na", "ra", "ba",
+    "me", "pe", "te", "le", "se", "que", "de", "ne", "re", "be",
+    "mi", "pi", "ti", "li", "si", "qui", "di", "ni", "ri", "bi",
+    "mo", "po", "to", "lo", "so", "co", "do", "no", "ro", "bo",
+    "mu", "pu", "tu", "lu", "su", "cu", "du", "nu", "ru", "bu",
+    "ción", "ñá", "llo", "cha", "gue", "ás", "és", "ón",
+]
+
+
+def generate_synthetic_words(count: int, seed: int = 42) -> List[str]:
+    """
+    Genera glosas sintéticas únicas.
+
+    Args:
+        count: Número de glosas a generar
+        seed: Semilla para reproducibilidad
+
+    Returns:
+        Lista de glosas únicas
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5)))
+        if rng.random() < 0.15:
+            word += " " + "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 3)))
+        words.add(word.capitalize())
+    return sorted(words)
+
+
+def write_synthetic_csv(path: str, words: List[str], seed: int = 42) -> None:
+    """
+    Escribe un CSV sintético con el formato de los archivos de señas.
+
+    Args:
+        path: Ruta del archivo a crear
+        words: Glosas a escribir
+        seed: Semilla para reproducibilidad
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Palabra", "Descripción"])
+        for word in words:
+            instructions = " ".join(
+                "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 3)))
+                for _ in range(rng.randint(6, 20))
+            )
+            writer.writerow([word, instructions.capitalize() + "."])
+
+
+def mutate_query(word: str, rng: random.Random) -> str:
+    """
+    Introduce un error tipográfico en una palabra (borrado, cambio o inserción).
+
+    Args:
+        word: Palabra original
+        rng: Generador aleatorio
+
+    Returns:
+        Palabra con un error tipográfico
+    """
+    word = word.lower()
+    position = rng.randrange(len(word))
+    operation = rng.choice(["delete", "replace", "insert"])
+    if operation == "delete" and len(word) > 1:
+        return word[:position] + word[position + 1:]
+    if operation == "replace":
+        return word[:position] + rng.choice("aeioumnprst") + word[position + 1:]
+    return word[:position] + rng.choice("aeioumnprst") + word[position:]
+
+
+def load_database_quietly(csv_files: Dict[str, str], **kwargs) -> SignsDatabase:
+    """Construye una base de datos suprimiendo los mensajes de carga."""
+    with redirect_stdout(StringIO()):
+        return SignsDatabase(csv_files, **kwargs)
+
+
+def benchmark_fuzzy_search(corpus_sizes: Sequence[int] = (1000, 5000, 20000),
+                           num_queries: int = 200, max_results: int = 5,
+                           min_similarity: float = 0.3) -> List[Dict[str, float]]:
+    """
+    Compara ``search_fuzzy`` indexado contra el recorrido lineal original.
+
+    Además del tiempo, verifica que ambos métodos devuelvan el mismo top-k.
+
+    Args:
+        corpus_sizes: Tamaños de corpus sintético a evaluar
+        num_queries: Número de consultas con errores tipográficos por tamaño
+        max_results: Número de resultados solicitados (k)
+        min_similarity: Umbral mínimo de similitud
+
+    Returns:
+        Lista de diccionarios con los resultados por tamaño de corpus
+    """
+    results = []
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in corpus_sizes:
+            words = generate_synthetic_words(size)
+            csv_path = os.path.join(temp_dir, f"bench_{size}.csv")
+            write_synthetic_csv(csv_path, words)
+            csv_files = {"ecuatoriano": csv_path}
+
+            linear_db = load_database_quietly(csv_files, fuzzy_index_factory=LinearScanIndex)
+            indexed_db = load_database_quietly(csv_files)
+            queries = [mutate_query(rng.choice(words), rng) for _ in range(num_queries)]
+
+            timings = {}
+            outputs = {}
+            for name, database in (("linear", linear_db), ("indexed", indexed_db)):
+                start = time.perf_counter()
+                outputs[name] = [
+                    [(entry.word, score) for entry, score in
+                     database.search_fuzzy(query, max_results, min_similarity)]
+                    for query in queries
+                ]
+                timings[name] = (time.perf_counter() - start) / num_queries
+
+            row = {
+                "corpus_size": size,
+                "linear_ms": timings["linear"] * 1000,
+                "indexed_ms": timings["indexed"] * 1000,
+                "speedup": timings["linear"] / timings["indexed"] if timings["indexed"] else 0.0,
+                "same_top_k": outputs["linear"] == outputs["indexed"],
+            }
+            results.append(row)
+            print(
+                f"📊 N={size:>6}: lineal {row['linear_ms']:8.2f} ms | "
+                f"indexado {row['indexed_ms']:8.2f} ms | x{row['speedup']:.1f} | "
+                f"mismo top-k: {'✅' if row['same_top_k'] else '❌'}"
+            )
+
+    return results
+
+
+@dataclass
+class _LegacySignEntry:
+    """Réplica del SignEntry original (dataclass con __dict__) para comparar memoria."""
+    word: str
+    instructions: str
+    category: str = "General"
+    description: str = ""
+    language: str = "ecuatoriano"
+
+    def __post_init__(self) -> None:
+        if not self.description:
+            self.description = self.instructions
+
+
+def _measure_allocation(build) -> int:
+    """Mide los bytes retenidos por el objeto que construye ``build``."""
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current - baseline
+
+
+def benchmark_memory(corpus_sizes: Sequence[int] = (10_000, 100_000)) -> List[Dict[str, float]]:
+    """
+    Mide la memoria por seña de las entradas y de la base de datos completa.
+
+    Compara el SignEntry original (dataclass) con el SignEntry compacto
+    usando los mismos textos, de modo que solo se mide el costo de las
+    entradas. También mide la base de datos cargada con todos sus índices.
+
+    Args:
+        corpus_sizes: Tamaños de corpus sintético a evaluar
+
+    Returns:
+        Lista de diccionarios con bytes por seña para cada tamaño
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in corpus_sizes:
+            words = generate_synthetic_words(size)
+            # Textos creados fuera de la medición; como al leer un CSV, cada fila
+            # tiene su propia copia de la categoría y del idioma
+            texts = [(word.lower(), word, f"Instrucciones de {word}.",
+                      "".join(("Gene", "ral")), "".join(("ecua", "toriano")))
+                     for word in words]
+
+            legacy_bytes = _measure_allocation(lambda: {
+                key: _LegacySignEntry(word, instructions, category, language=language)
+                for key, word, instructions, category, language in texts
+            })
+            compact_bytes = _measure_allocation(lambda: {
+                key: SignEntry(word, instructions, category, language=language)
+                for key, word, instructions, category, language in texts
+            })
+
+            csv_path = os.path.join(temp_dir, f"bench_{size}.csv")
+            write_synthetic_csv(csv_path, words)
+            database_bytes = _measure_allocation(lambda: load_database_quietly({"ecuatoriano": csv_path}))
+
+            row = {
+                "corpus_size": size,
+                "legacy_entry_bytes": legacy_bytes / size,
+                "compact_entry_bytes": compact_bytes / size,
+                "database_bytes": database_bytes / size,
+            }
+            results.append(row)
+            print(
+                f"🧠 N={size:>7}: entrada original {row['legacy_entry_bytes']:7.1f} B/seña | "
+                f"entrada compacta {row['compact_entry_bytes']:7.1f} B/seña | "
+                f"base de datos completa {row['database_bytes']:8.1f} B/seña"
+            )
+
+    return results
+
+
+def benchmark_vector_scoring(corpus_sizes: Sequence[int] = (1000, 5000, 20000),
+                             num_queries: int = 100, max_results: int = 5,
+                             min_similarity: float = 0.3,
+                             reference_queries: int = 10) -> List[Dict[str, float]]:
+    """
+    Compara los escorers vectorizados con NumPy contra la ruta de difflib.
+
+    Para cada escorer vectorizado verifica que su top-k coincida exactamente
+    con el de su implementación escalar de referencia (sobre las primeras
+    ``reference_queries`` consultas) y mide cuánto se solapa su ranking con
+    el de ``SequenceMatcher``.
+
+    Args:
+        corpus_sizes: Tamaños de corpus sintético a evaluar
+        num_queries: Número de consultas con errores tipográficos por tamaño
+        max_results: Número de resultados solicitados (k)
+        min_similarity: Umbral mínimo de similitud
+        reference_queries: Consultas verificadas contra la referencia escalar
+
+    Returns:
+        Lista de diccionarios con los resultados por tamaño y escorer
+    """
+    # Importación local: NumPy solo es necesario para esta prueba
+    from database.vector_scoring import (
+        REFERENCE_SCORERS,
+        SCORER_DIFFLIB,
+        get_fuzzy_index_factory,
+    )
+
+    results = []
+    rng = random.Random(11)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in corpus_sizes:
+            words = generate_synthetic_words(size)
+            csv_path = os.path.join(temp_dir, f"bench_{size}.csv")
+            write_synthetic_csv(csv_path, words)
+            csv_files = {"ecuatoriano": csv_path}
+            queries = [mutate_query(rng.choice(words), rng) for _ in range(num_queries)]
+
+            baseline_ms = 0.0
+            baseline_top = []
+            for scorer in (SCORER_DIFFLIB, *REFERENCE_SCORERS):
+                database = load_database_quietly(csv_files, fuzzy_index_factory=get_fuzzy_index_factory(scorer))
+                keys = list(database.signs["ecuatoriano"])
+
+                start = time.perf_counter()
+                top = [
+                    [entry.word.lower() for entry, _ in
+                     database.search_fuzzy(query, max_results, min_similarity)]
+                    for query in queries
+                ]
+                elapsed_ms = (time.perf_counter() - start) / num_queries * 1000
+
+                if scorer == SCORER_DIFFLIB:
+                    baseline_ms, baseline_top = elapsed_ms, top
+                    print(f"📊 N={size:>6}: difflib      {elapsed_ms:8.2f} ms")
+                    continue
+
+                reference = REFERENCE_SCORERS[scorer]
+                matches_reference = True
+                for query, vector_top in zip(queries[:reference_queries], top):
+                    scored = [(key, reference(query, key)) for key in keys]
+                    expected = [key for key, score in sorted(
+                        (item for item in scored if item[1] >= min_similarity),
+                        key=lambda item: -item[1])[:max_results]]
+                    if vector_top != expected:
+                        matches_reference = False
+                        break
+
+                overlap = sum(
+                    len(set(vector_top) & set(difflib_top)) / max(len(difflib_top), 1)
+                    for vector_top, difflib_top in zip(top, baseline_top)
+                ) / num_queries
+
+                row = {
+                    "corpus_size": size,
+                    "scorer": scorer,
+                    "difflib_ms": baseline_ms,
+                    "vector_ms": elapsed_ms,
+                    "speedup": baseline_ms / elapsed_ms if elapsed_ms else 0.0,
+                    "matches_reference": matches_reference,
+                    "overlap_with_difflib": overlap,
+                }
+                results.append(row)
+                print(
+                    f"📊 N={size:>6}: {scorer:<12} {elapsed_ms:8.2f} ms | x{row['speedup']:.1f} | "
+                    f"igual a referencia: {'✅' if matches_reference else '❌'} | "
+                    f"solapamiento con difflib: {overlap:.0%}"
+                )
+
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_fuzzy_search()
+    benchmark_memory()
+    benchmark_vector_scoring()
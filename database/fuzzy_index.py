@@ -0,0 +1,210 @@
+"""
+Índices para Búsqueda Difusa de Señas.
+
+Proporciona índices intercambiables que generan candidatos para
+``SignsDatabase.search_fuzzy`` junto con una cota superior de su similitud,
+de modo que solo los candidatos prometedores se puntúan con difflib.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import difflib
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Dict, Iterator, List, Tuple
+
+from database.top_k import TopK, iter_sorted
+
+
+class FuzzyIndex(ABC):
+    """
+    Interfaz base de los índices de búsqueda difusa.
+
+    Un índice mantiene el conjunto de claves de un idioma y, para una consulta,
+    produce pares (clave, cota) ordenados por cota descendente. La cota debe ser
+    mayor o igual a ``difflib.SequenceMatcher(None, consulta, clave).ratio()``
+    para que la búsqueda pueda terminar anticipadamente sin perder resultados.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el índice vacío."""
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+
+    def add(self, key: str) -> None:
+        """
+        Agrega una clave al índice.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        if key not in self._order:
+            self._order[key] = self._next_order
+            self._next_order += 1
+
+    def remove(self, key: str) -> None:
+        """
+        Elimina una clave del índice.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        self._order.pop(key, None)
+
+    def build(self, keys: List[str]) -> None:
+        """
+        Construye el índice a partir de una lista de claves.
+
+        Args:
+            keys: Claves en el orden de inserción de la base de datos
+        """
+        for key in keys:
+            self.add(key)
+
+    def prepare(self) -> None:
+        """Completa el trabajo diferido para que las lecturas no modifiquen el índice."""
+
+    def order_of(self, key: str) -> int:
+        """
+        Obtiene la posición de inserción de una clave (para desempates estables).
+
+        Args:
+            key: Clave indexada
+
+        Returns:
+            Posición de inserción de la clave
+        """
+        return self._order[key]
+
+    @abstractmethod
+    def candidates(self, query: str, min_similarity: float = 0.0) -> Iterator[Tuple[str, float]]:
+        """
+        Genera candidatos con su cota superior de similitud.
+
+        Args:
+            query: Consulta normalizada
+            min_similarity: Candidatos con cota menor se descartan
+
+        Returns:
+            Iterador de tuplas (clave, cota) ordenado por cota descendente
+        """
+
+    def top_matches(self, query: str, max_results: int = 5,
+                    min_similarity: float = 0.3) -> List[Tuple[str, float]]:
+        """
+        Obtiene las claves más similares a una consulta.
+
+        Puntúa los candidatos con ``SequenceMatcher`` en orden de cota y se
+        detiene en cuanto ninguna cota restante puede superar al peor de los
+        ``max_results`` mejores resultados.
+
+        Args:
+            query: Consulta normalizada
+            max_results: Número máximo de resultados
+            min_similarity: Umbral mínimo de similitud (0.0 - 1.0)
+
+        Returns:
+            Lista de tuplas (clave, similitud) ordenada por similitud descendente
+            (empates en orden de inserción)
+        """
+        if max_results <= 0:
+            return []
+
+        top: TopK[str] = TopK(max_results)
+
+        for key, upper_bound in self.candidates(query, min_similarity):
+            # Los candidatos vienen ordenados por cota: ninguno restante puede entrar
+            if not top.accepts(upper_bound):
+                break
+
+            similarity = difflib.SequenceMatcher(None, query, key).ratio()
+            if similarity >= min_similarity:
+                top.push(similarity, self._order[key], key)
+
+        return top.results()
+
+    def __len__(self) -> int:
+        """Retorna el número de claves indexadas."""
+        return len(self._order)
+
+
+class LinearScanIndex(FuzzyIndex):
+    """
+    Índice trivial que recorre todas las claves (comportamiento original).
+
+    Se conserva como referencia para pruebas de rendimiento y como opción
+    para corpus muy pequeños.
+    """
+
+    def candidates(self, query: str, min_similarity: float = 0.0) -> Iterator[Tuple[str, float]]:
+        """Genera todas las claves con cota 1.0 en orden de inserción."""
+        for key in self._order:
+            yield key, 1.0
+
+
+class CharacterCountIndex(FuzzyIndex):
+    """
+    Índice invertido de caracteres con conteos (n-gramas de tamaño 1).
+
+    Para cada carácter guarda las claves que lo contienen y cuántas veces.
+    El solapamiento de multiconjuntos de caracteres acota el número de
+    coincidencias que puede encontrar ``SequenceMatcher``, por lo que
+    ``2 * solapamiento / (len(a) + len(b))`` es una cota exacta de ``ratio()``
+    (equivale a ``quick_ratio()`` de difflib) calculada solo con las listas
+    de publicación de los caracteres de la consulta.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el índice vacío."""
+        super().__init__()
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+
+    def add(self, key: str) -> None:
+        """Agrega una clave y sus conteos de caracteres al índice."""
+        if key in self._lengths:
+            return
+        super().add(key)
+        self._lengths[key] = len(key)
+        for char, count in Counter(key).items():
+            self._postings.setdefault(char, {})[key] = count
+
+    def remove(self, key: str) -> None:
+        """Elimina una clave y sus publicaciones del índice."""
+        if key not in self._lengths:
+            return
+        super().remove(key)
+        del self._lengths[key]
+        for char in set(key):
+            posting = self._postings.get(char)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self._postings[char]
+
+    def candidates(self, query: str, min_similarity: float = 0.0) -> Iterator[Tuple[str, float]]:
+        """Genera claves ordenadas por la cota de similitud de multiconjuntos."""
+        query_length = len(query)
+        overlaps: Dict[str, int] = {}
+
+        for char, query_count in Counter(query).items():
+            for key, key_count in self._postings.get(char, {}).items():
+                overlaps[key] = overlaps.get(key, 0) + min(query_count, key_count)
+
+        scored = []
+        for key, overlap in overlaps.items():
+            bound = 2.0 * overlap / (query_length + self._lengths[key])
+            if bound >= min_similarity:
+                scored.append((key, bound))
+
+        # Claves sin caracteres en común tienen similitud 0.0
+        if min_similarity <= 0.0:
+            scored.extend((key, 0.0) for key in self._lengths if key not in overlaps)
+
+        # Orden perezoso: top_matches suele detenerse tras pocos candidatos
+        return iter_sorted(scored, key=lambda item: (-item[1], self._order[item[0]]))
+
+
+# Índice usado por defecto en SignsDatabase
+DEFAULT_FUZZY_INDEX = CharacterCountIndex
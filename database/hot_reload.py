@@ -0,0 +1,160 @@
+"""
+Recarga en Caliente de la Base de Datos de Señas.
+
+Vigila los CSV de origen por sondeo de fecha de modificación y tamaño
+(el hash solo se recalcula cuando cambian) y, al detectar un archivo
+modificado, recarga únicamente ese idioma aplicando las diferencias fila a
+fila con ``SignsDatabase.reload_language``.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from database.signs_database import SignsDatabase
+from database.snapshot import describe_source
+
+# Segundos entre comprobaciones de los archivos CSV
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+class DatabaseWatcher:
+    """
+    Vigilante de los CSV de una base de datos de señas.
+
+    Se ejecuta en un hilo en segundo plano; ``check_now`` permite además
+    forzar una comprobación de forma síncrona.
+    """
+
+    def __init__(self, database: SignsDatabase, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """
+        Inicializa el vigilante con el estado actual de los archivos.
+
+        Args:
+            database: Base de datos a mantener sincronizada
+            poll_interval: Segundos entre comprobaciones
+        """
+        self.database = database
+        self.poll_interval = poll_interval
+        self._sources: Dict[str, Dict[str, Any]] = {
+            language: describe_source(csv_path)
+            for language, csv_path in database.csv_files.items()
+        }
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Indica si el hilo de vigilancia está activo."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def check_now(self) -> Dict[str, Dict[str, int]]:
+        """
+        Comprueba los archivos y recarga los idiomas cuyo contenido cambió.
+
+        Un cambio solo de fecha de modificación (mismo hash) no provoca recarga.
+        Si la recarga de un idioma falla se conserva su estado anterior y se
+        reintenta en la siguiente comprobación.
+
+        Returns:
+            Diccionario {idioma: cambios aplicados} de los idiomas recargados
+        """
+        reloaded = {}
+
+        for language, csv_path in list(self.database.csv_files.items()):
+            known = self._sources.get(language)
+            try:
+                current = describe_source(csv_path, known)
+            except OSError as e:
+                print(f"⚠️ No se pudo comprobar {csv_path}: {e}")
+                continue
+
+            if known is not None and (known.get("exists"), known.get("sha256")) == (
+                    current.get("exists"), current.get("sha256")):
+                self._sources[language] = current
+                continue
+
+            try:
+                reloaded[language] = self.database.reload_language(language)
+            except Exception as e:
+                print(f"❌ Error recargando {language}: {e}")
+                continue
+
+            self._sources[language] = current
+
+        return reloaded
+
+    def _run(self) -> None:
+        """Bucle del hilo de vigilancia."""
+        while not self._stop_event.wait(self.poll_interval):
+            self.check_now()
+
+    def start(self) -> None:
+        """Inicia la vigilancia en un hilo en segundo plano."""
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="signs-database-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Detiene la vigilancia.
+
+        Args:
+            timeout: Segundos máximos de espera al hilo
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+# Instancia global para uso singleton
+_database_watcher: Optional[DatabaseWatcher] = None
+
+
+def start_auto_reload(database: SignsDatabase,
+                      poll_interval: float = DEFAULT_POLL_INTERVAL) -> Optional[DatabaseWatcher]:
+    """
+    Inicia la recarga automática si ``DatabaseConfig.auto_reload`` está activo.
+
+    Args:
+        database: Base de datos a vigilar
+        poll_interval: Segundos entre comprobaciones
+
+    Returns:
+        El vigilante en ejecución o None si la recarga automática está desactivada
+    """
+    global _database_watcher
+
+    try:
+        from utils.config_utils import get_global_config
+        auto_reload = get_global_config().database.auto_reload
+    except Exception as e:
+        print(f"⚠️ No se pudo leer la configuración de recarga automática: {e}")
+        auto_reload = False
+
+    if not auto_reload:
+        return None
+
+    if _database_watcher is None or _database_watcher.database is not database:
+        if _database_watcher is not None:
+            _database_watcher.stop()
+        _database_watcher = DatabaseWatcher(database, poll_interval)
+
+    _database_watcher.start()
+    return _database_watcher
+
+
+def get_database_watcher() -> Optional[DatabaseWatcher]:
+    """
+    Obtiene el vigilante global de la base de datos.
+
+    Returns:
+        Instancia del vigilante o None si no se inició la recarga automática
+    """
+    return _database_watcher
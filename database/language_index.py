@@ -0,0 +1,228 @@
+"""
+Índices y Metadatos por Idioma de la Base de Datos de Señas.
+
+Agrupa las señas de un idioma con todos sus índices de búsqueda y metadatos
+(categorías y conteos) y los mantiene sincronizados ante inserciones,
+actualizaciones y eliminaciones individuales.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import copy
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from database.fuzzy_index import FuzzyIndex
+from database.lemma_index import LemmaIndex
+from database.normalization import fold_key
+from database.phrase_index import PhraseIndex
+from database.prefix_index import PrefixTrie, SuffixArrayIndex
+from database.text_index import InvertedIndex
+
+if TYPE_CHECKING:
+    from database.signs_database import SignEntry
+
+
+class LanguageIndex:
+    """
+    Señas de un idioma junto con sus índices de búsqueda y metadatos.
+
+    Attributes:
+        language: Idioma de las señas
+        signs: Diccionario {clave: SignEntry} en orden de carga
+        fuzzy_index: Índice para búsqueda difusa
+        prefix_index: Trie de prefijos para autocompletado
+        substring_index: Arreglo de sufijos para búsqueda parcial
+        folded_index: Claves por forma plegada (sin acentos ni variante)
+        variant_index: Claves con variante regional ("(Costa)", "(Sierra)") por forma plegada base
+        phrase_index: Glosas por forma de términos para segmentar frases
+        lemma_index: Claves por forma de raíces y sinónimos para reescribir consultas
+        text_index: Índice invertido sobre palabra, instrucciones y categoría
+        categories: Claves por categoría, en orden de carga
+        total_instruction_length: Suma de longitudes de las instrucciones
+    """
+
+    def __init__(self, language: str, fuzzy_index_factory: Callable[[], FuzzyIndex]) -> None:
+        """
+        Inicializa los índices vacíos de un idioma.
+
+        Args:
+            language: Idioma de las señas
+            fuzzy_index_factory: Fábrica del índice de búsqueda difusa
+        """
+        self.language = language
+        self.signs: Dict[str, "SignEntry"] = {}
+        self.fuzzy_index = fuzzy_index_factory()
+        self.prefix_index = PrefixTrie()
+        self.substring_index = SuffixArrayIndex()
+        self.folded_index: Dict[str, List[str]] = {}
+        self.variant_index: Dict[str, List[str]] = {}
+        self.phrase_index = PhraseIndex()
+        self.lemma_index = LemmaIndex()
+        self.text_index = InvertedIndex()
+        self.categories: Dict[str, Dict[str, None]] = {}
+        self.total_instruction_length = 0
+        self._sorted_categories: Optional[List[str]] = None
+
+    @staticmethod
+    def get_searchable_text(sign_entry: "SignEntry") -> str:
+        """
+        Obtiene el texto indexado para búsquedas por palabras clave.
+
+        Args:
+            sign_entry: Entrada de seña
+
+        Returns:
+            Texto con la palabra, las instrucciones y la categoría
+        """
+        return f"{sign_entry.word} {sign_entry.instructions} {sign_entry.category}"
+
+    def build(self, signs: Dict[str, "SignEntry"]) -> None:
+        """
+        Construye todos los índices a partir de las señas cargadas.
+
+        Args:
+            signs: Diccionario {clave: SignEntry} en orden de carga
+        """
+        self.signs = signs
+        keys = list(signs.keys())
+
+        self.fuzzy_index.build(keys)
+        self.prefix_index.build(keys)
+        self.substring_index.build(keys)
+
+        for key, sign_entry in signs.items():
+            self._index_key(key)
+            self._index_content(key, sign_entry)
+
+    def _index_key(self, key: str) -> None:
+        """Registra la clave en los índices de formas plegadas, variantes, frases y lemas."""
+        folded_base, variant = fold_key(key)
+        self.folded_index.setdefault(folded_base, []).append(key)
+        if variant:
+            self.variant_index.setdefault(folded_base, []).append(key)
+        self.phrase_index.add(key)
+        self.lemma_index.add(key)
+
+    def _unindex_key(self, key: str) -> None:
+        """Elimina la clave de los índices de formas plegadas, variantes, frases y lemas."""
+        self.phrase_index.remove(key)
+        self.lemma_index.remove(key)
+        folded_base, _ = fold_key(key)
+        for index in (self.folded_index, self.variant_index):
+            keys = index.get(folded_base)
+            if keys and key in keys:
+                keys.remove(key)
+                if not keys:
+                    del index[folded_base]
+
+    def _index_content(self, key: str, sign_entry: "SignEntry") -> None:
+        """Registra el contenido de la entrada (texto, categoría y longitudes)."""
+        self.text_index.add(key, self.get_searchable_text(sign_entry))
+        if sign_entry.category:
+            if sign_entry.category not in self.categories:
+                self._sorted_categories = None
+            self.categories.setdefault(sign_entry.category, {})[key] = None
+        self.total_instruction_length += len(sign_entry.instructions)
+
+    def _unindex_content(self, key: str, sign_entry: "SignEntry",
+                         replacement: Optional["SignEntry"] = None) -> None:
+        """
+        Elimina el contenido de la entrada de los índices.
+
+        Si ``replacement`` la reemplaza sin cambiar de categoría, la clave se
+        queda en su categoría para conservar su posición en ella.
+        """
+        self.text_index.remove(key)
+        category_keys = self.categories.get(sign_entry.category)
+        keeps_category = replacement is not None and replacement.category == sign_entry.category
+        if category_keys is not None and not keeps_category:
+            category_keys.pop(key, None)
+            if not category_keys:
+                del self.categories[sign_entry.category]
+                self._sorted_categories = None
+        self.total_instruction_length -= len(sign_entry.instructions)
+
+    def add(self, key: str, sign_entry: "SignEntry") -> None:
+        """
+        Inserta o actualiza una seña en todos los índices.
+
+        Una actualización conserva la posición original de la clave, también
+        dentro de su categoría si esta no cambia.
+
+        Args:
+            key: Clave normalizada de la seña
+            sign_entry: Entrada de seña
+        """
+        previous = self.signs.get(key)
+        if previous is not None:
+            self._unindex_content(key, previous, sign_entry)
+        else:
+            self.fuzzy_index.add(key)
+            self.prefix_index.add(key)
+            self.substring_index.add(key)
+            self._index_key(key)
+
+        self.signs[key] = sign_entry
+        self._index_content(key, sign_entry)
+
+    def remove(self, key: str) -> Optional["SignEntry"]:
+        """
+        Elimina una seña de todos los índices.
+
+        Args:
+            key: Clave normalizada de la seña
+
+        Returns:
+            La entrada eliminada o None si no existía
+        """
+        sign_entry = self.signs.pop(key, None)
+        if sign_entry is None:
+            return None
+
+        self.fuzzy_index.remove(key)
+        self.prefix_index.remove(key)
+        self.substring_index.remove(key)
+        self._unindex_key(key)
+        self._unindex_content(key, sign_entry)
+        return sign_entry
+
+    def prepare(self) -> None:
+        """
+        Completa el trabajo diferido de todos los índices.
+
+        Se llama antes de publicar el índice para que las lecturas concurrentes
+        no tengan que reconstruir estructuras compartidas.
+        """
+        self.fuzzy_index.prepare()
+        self.substring_index.prepare()
+        self.text_index.prepare()
+        self.get_sorted_categories()
+
+    def clone(self) -> "LanguageIndex":
+        """
+        Crea una copia independiente de los índices para modificarla aparte.
+
+        Las entradas de seña no se copian: se comparten entre ambas versiones
+        porque los índices nunca las modifican.
+
+        Returns:
+            Copia de los índices del idioma
+        """
+        memo = {id(sign_entry): sign_entry for sign_entry in self.signs.values()}
+        return copy.deepcopy(self, memo)
+    
+    def get_sorted_categories(self) -> List[str]:
+        """
+        Obtiene las categorías del idioma ordenadas alfabéticamente.
+
+        Returns:
+            Lista de categorías (calculada solo cuando cambia el conjunto)
+        """
+        if self._sorted_categories is None:
+            self._sorted_categories = sorted(self.categories)
+        return list(self._sorted_categories)
+
+    def __len__(self) -> int:
+        """Retorna el número de señas del idioma."""
+        return len(self.signs)
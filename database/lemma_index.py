@@ -0,0 +1,264 @@
+"""
+Reescritura de Consultas por Lemas y Sinónimos.
+
+Cuando una consulta no coincide exactamente con ninguna seña, suele ser una
+forma flexionada ("necesitando", "trabajadores") o un sinónimo ("papá") de
+una palabra del corpus. Este módulo reduce cada término a su raíz quitando
+solo sufijos flexivos del español (gerundios, participios, infinitivos,
+conjugaciones y plurales) y precompila, por idioma, un diccionario
+{forma de raíces: claves} que incluye las formas de los sinónimos de cada
+palabra del corpus. Así la reescritura cuesta una sola consulta al
+diccionario en lugar de una búsqueda difusa lineal.
+
+La reescritura se promueve a coincidencia exacta, así que es conservadora:
+las raíces tienen al menos ``MIN_STEM_LENGTH`` letras, conservan la ñ
+("sena" no es "señas") y la consulta debe parecerse a la forma reescrita
+(``MIN_REWRITE_SIMILARITY``). Ante la duda no hay reescritura y la consulta
+sigue a la búsqueda difusa, que la presenta como sugerencia.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+from database.normalization import EDGE_PUNCTUATION, TOKEN_PATTERN, split_variant
+
+# Tipos de reescritura
+REWRITE_LEMMA = "lema"
+REWRITE_SYNONYM = "sinónimo"
+
+# Longitud mínima de la raíz que deja el lematizador
+MIN_STEM_LENGTH = 4
+
+# Similitud mínima entre la consulta y la forma (clave o sinónimo) que reescribe
+MIN_REWRITE_SIMILARITY = 0.6
+
+# Sufijos flexivos, del más largo al más corto (formas plegadas). No incluye
+# vocales sueltas ni sufijos derivativos: "libro" y "libre" o "solo" y "sol"
+# son palabras distintas, no formas de la misma
+SPANISH_SUFFIXES = sorted([
+    "ieron", "aron", "iendo", "yendo", "ando",
+    "ados", "adas", "idos", "idas", "amos", "emos", "imos", "aban", "abas",
+    "ado", "ada", "ido", "ida", "aba", "ian",
+    "ar", "er", "ir", "es",
+    "s",
+], key=len, reverse=True)
+
+# Grupos de sinónimos (formas plegadas con ñ); solo se usan si alguno está en el corpus
+SYNONYM_GROUPS: List[Tuple[str, ...]] = [
+    ("adios", "chao"),
+    ("trabajo", "empleo"),
+    ("padre", "papa"),
+    ("madre", "mama"),
+    ("esposo", "marido"),
+    ("colega", "compañero", "compañera"),
+    ("regresar", "volver"),
+    ("cedula", "identificacion", "credencial", "carne"),
+    ("bus", "autobus", "buseta", "omnibus"),
+    ("interprete", "traductor"),
+    ("emergencia", "urgencia"),
+    ("robar", "hurtar"),
+    ("perder", "extraviar"),
+    ("esperar", "aguardar"),
+    ("reunirse", "juntarse"),
+    ("solucionar", "resolver"),
+    ("baño", "sanitario"),
+]
+
+# {término plegado: otros términos de su grupo}
+SYNONYMS: Dict[str, Tuple[str, ...]] = {
+    term: tuple(other for other in group if other != term)
+    for group in SYNONYM_GROUPS
+    for term in group
+}
+
+
+@dataclass(frozen=True)
+class QueryRewrite:
+    """
+    Reescritura aplicada a una consulta.
+
+    Attributes:
+        kind: Tipo de reescritura ("lema" o "sinónimo")
+        source: Consulta plegada original (conserva la ñ)
+        target: Clave de la seña encontrada
+    """
+    kind: str
+    source: str
+    target: str
+
+    def __str__(self) -> str:
+        """Representación legible de la reescritura."""
+        return f"{self.source} -> {self.target} ({self.kind})"
+
+
+def get_lemma_terms(text: str) -> List[str]:
+    """
+    Divide un texto en términos plegados para lematizar.
+
+    Como ``tokenize(fold_key(text)[0])`` pero conserva la ñ, que distingue
+    palabras ("sena" y "seña") en lugar de ser un acento.
+
+    Args:
+        text: Palabra o frase original
+
+    Returns:
+        Lista de términos sin acentos, en minúsculas y sin variante regional
+    """
+    decomposed = unicodedata.normalize("NFD", text.casefold())
+    # Se conserva la tilde de la ñ (U+0303) y se descartan las demás marcas
+    kept = "".join(
+        char for char in decomposed if not unicodedata.combining(char) or char == "\u0303"
+    )
+    folded = " ".join(unicodedata.normalize("NFC", kept).split()).strip(EDGE_PUNCTUATION).strip()
+    return TOKEN_PATTERN.findall(split_variant(folded)[0])
+
+
+def stem_term(term: str) -> str:
+    """
+    Reduce un término plegado a su raíz quitando un sufijo flexivo.
+
+    Quita el sufijo más largo que deje al menos ``MIN_STEM_LENGTH`` letras
+    ("trabajando" -> "trabaj", "trabajadores" -> "trabajador",
+    "hermanos" -> "hermano"); "sol", "meter" o "marido" no cambian.
+
+    Args:
+        term: Término plegado con ``get_lemma_terms``
+
+    Returns:
+        Raíz del término (el propio término si es demasiado corto)
+    """
+    for suffix in SPANISH_SUFFIXES:
+        if term.endswith(suffix) and len(term) - len(suffix) >= MIN_STEM_LENGTH:
+            return term[:-len(suffix)]
+    return term
+
+
+def get_stem_form(text: str) -> str:
+    """
+    Obtiene la forma de raíces de una palabra o frase.
+
+    Args:
+        text: Palabra o frase original
+
+    Returns:
+        Raíces de sus términos separadas por un espacio
+        ("Necesitando ayuda" -> "necesit ayuda")
+    """
+    return " ".join(stem_term(term) for term in get_lemma_terms(text))
+
+
+class LemmaIndex:
+    """
+    Diccionario precompilado de formas de raíces a claves de señas.
+
+    Cada clave se registra bajo su propia forma de raíces (reescritura por
+    lema) y bajo las formas que resultan de sustituir uno de sus términos por
+    un sinónimo (reescritura por sinónimo). Cada registro guarda además el
+    texto de la clave o del sinónimo sustituido, con el que se compara la
+    consulta.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el índice vacío."""
+        # {forma de raíces: [(clave, tipo de reescritura, texto comparado)] en orden de carga}
+        self._forms: Dict[str, List[Tuple[str, str, str]]] = {}
+
+    @staticmethod
+    def _get_forms(key: str) -> List[Tuple[str, str, str, str]]:
+        """Calcula las formas de raíces (con su tipo y texto) bajo las que se registra una clave."""
+        terms = get_lemma_terms(key)
+        if not terms:
+            return []
+
+        stems = [stem_term(term) for term in terms]
+        forms = [(" ".join(stems), key, REWRITE_LEMMA, " ".join(terms))]
+        for position, term in enumerate(terms):
+            for synonym in SYNONYMS.get(term, ()):
+                synonym_stems = stems[:position] + [stem_term(synonym)] + stems[position + 1:]
+                synonym_terms = terms[:position] + [synonym] + terms[position + 1:]
+                forms.append((" ".join(synonym_stems), key, REWRITE_SYNONYM, " ".join(synonym_terms)))
+        return forms
+
+    def add(self, key: str) -> None:
+        """
+        Agrega una clave al índice.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        for form, *entry in self._get_forms(key):
+            entries = self._forms.setdefault(form, [])
+            if tuple(entry) not in entries:
+                entries.append(tuple(entry))
+
+    def remove(self, key: str) -> None:
+        """
+        Elimina una clave del índice.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        for form, *entry in self._get_forms(key):
+            entries = self._forms.get(form)
+            if not entries or tuple(entry) not in entries:
+                continue
+            entries.remove(tuple(entry))
+            if not entries:
+                del self._forms[form]
+
+    def build(self, keys: List[str]) -> None:
+        """
+        Construye el índice a partir de una lista de claves.
+
+        Args:
+            keys: Claves en el orden de inserción de la base de datos
+        """
+        for key in keys:
+            self.add(key)
+
+    def lookup(self, word: str) -> Optional[QueryRewrite]:
+        """
+        Reescribe una consulta a la clave de seña más cercana por lema o sinónimo.
+
+        Solo se aceptan claves cuya forma (la propia clave o el sinónimo
+        sustituido) tenga una similitud con la consulta de al menos
+        ``MIN_REWRITE_SIMILARITY``. Entre ellas se prefieren las reescrituras
+        por lema, luego la más parecida a la consulta y, por último, el orden
+        de carga.
+
+        Args:
+            word: Consulta a reescribir
+
+        Returns:
+            QueryRewrite aplicada o None si la consulta no tiene reescritura
+        """
+        terms = get_lemma_terms(word)
+        source = " ".join(terms)
+        entries = self._forms.get(" ".join(stem_term(term) for term in terms))
+        if not entries:
+            return None
+
+        best: Optional[Tuple[bool, float]] = None
+        best_entry: Optional[Tuple[str, str, str]] = None
+        for entry in entries:
+            key, kind, text = entry
+            similarity = SequenceMatcher(None, source, text).ratio()
+            if similarity < MIN_REWRITE_SIMILARITY:
+                continue
+            rank = (kind == REWRITE_LEMMA, similarity)
+            if best is None or rank > best:
+                best, best_entry = rank, entry
+
+        if best_entry is None:
+            return None
+        key, kind, _ = best_entry
+        return QueryRewrite(kind=kind, source=source, target=key)
+
+    def __len__(self) -> int:
+        """Retorna el número de formas de raíces indexadas."""
+        return len(self._forms)
@@ -0,0 +1,89 @@
+"""
+Normalización de Texto para Búsquedas de Señas.
+
+Proporciona la forma "plegada" de las palabras (sin acentos, sin distinción
+de mayúsculas y con espacios colapsados) usada como clave secundaria de
+búsqueda, junto con la separación de variantes regionales como
+"(Costa)" o "(Sierra)".
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import re
+import unicodedata
+from typing import List, Optional, Tuple
+
+# Signos que rodean palabras en el corpus y en las consultas (¿dónde?, ¡hola!)
+EDGE_PUNCTUATION = "¿?¡!.,;:\"'"
+
+# Sufijo de variante regional al final de la palabra: "mayo (costa)"
+VARIANT_SUFFIX_PATTERN = re.compile(r"\s*\(\s*(costa|sierra)\s*\)\s*$")
+
+# Secuencias alfanuméricas que forman los términos del índice de texto
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def fold_text(text: str) -> str:
+    """
+    Obtiene la forma plegada de un texto.
+
+    Aplica descomposición NFKD, elimina las marcas diacríticas, convierte a
+    minúsculas con ``casefold``, colapsa espacios y quita los signos de
+    puntuación de los extremos.
+
+    Args:
+        text: Texto a plegar
+
+    Returns:
+        Texto plegado ("¿Dónde?" -> "donde")
+    """
+    if not text:
+        return ""
+
+    decomposed = unicodedata.normalize("NFKD", text)
+    without_marks = "".join(char for char in decomposed if not unicodedata.combining(char))
+    folded = " ".join(without_marks.casefold().split())
+    return folded.strip(EDGE_PUNCTUATION).strip()
+
+
+def split_variant(folded_text: str) -> Tuple[str, Optional[str]]:
+    """
+    Separa el sufijo de variante regional de un texto plegado.
+
+    Args:
+        folded_text: Texto ya plegado con ``fold_text``
+
+    Returns:
+        Tupla (palabra base, variante o None): "mayo (costa)" -> ("mayo", "costa")
+    """
+    match = VARIANT_SUFFIX_PATTERN.search(folded_text)
+    if not match:
+        return folded_text, None
+    return folded_text[:match.start()].strip(EDGE_PUNCTUATION).strip(), match.group(1)
+
+
+def fold_key(word: str) -> Tuple[str, Optional[str]]:
+    """
+    Obtiene la clave plegada de una palabra y su variante regional.
+
+    Args:
+        word: Palabra original
+
+    Returns:
+        Tupla (palabra base plegada, variante o None)
+    """
+    return split_variant(fold_text(word))
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Divide un texto en términos plegados para el índice de texto completo.
+
+    Args:
+        text: Texto a dividir
+
+    Returns:
+        Lista de términos ("La mano se desplaza" -> ["la", "mano", "se", "desplaza"])
+    """
+    return TOKEN_PATTERN.findall(fold_text(text))
@@ -0,0 +1,146 @@
+"""
+Segmentación de Frases en Señas.
+
+Divide una frase (por ejemplo, una transcripción de voz como "buenos días
+mamá") en la secuencia de glosas conocidas más largas. Las glosas se
+indexan por su forma de términos plegados ("¿Qué hora es?" -> "que hora es")
+en un ``PrefixTrie``; la frase se recorre una sola vez y una programación
+dinámica elige la división que cubre más términos con menos señas.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from database.normalization import fold_key, tokenize
+from database.prefix_index import PrefixTrie
+
+
+def get_phrase_form(text: str) -> str:
+    """
+    Obtiene la forma de términos plegados de una glosa o frase.
+
+    Args:
+        text: Glosa o frase original
+
+    Returns:
+        Términos plegados separados por un espacio ("Buenos Días" -> "buenos dias")
+    """
+    return " ".join(tokenize(fold_key(text)[0]))
+
+
+class PhraseIndex:
+    """
+    Índice de glosas por forma de términos para segmentar frases.
+
+    Varias claves pueden compartir forma (variantes regionales o diferencias
+    de puntuación); se conservan en orden de inserción y la segmentación
+    usa la primera.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el índice vacío."""
+        self._trie = PrefixTrie()
+        self._keys: Dict[str, List[str]] = {}  # {forma: claves en orden de carga}
+
+    def add(self, key: str) -> None:
+        """
+        Agrega una clave al índice.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        phrase_form = get_phrase_form(key)
+        if not phrase_form:
+            return
+        keys = self._keys.setdefault(phrase_form, [])
+        if key not in keys:
+            keys.append(key)
+        self._trie.add(phrase_form)
+
+    def remove(self, key: str) -> None:
+        """
+        Elimina una clave del índice.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        phrase_form = get_phrase_form(key)
+        keys = self._keys.get(phrase_form)
+        if not keys or key not in keys:
+            return
+        keys.remove(key)
+        if not keys:
+            del self._keys[phrase_form]
+            self._trie.remove(phrase_form)
+
+    def build(self, keys: List[str]) -> None:
+        """
+        Construye el índice a partir de una lista de claves.
+
+        Args:
+            keys: Claves en el orden de inserción de la base de datos
+        """
+        for key in keys:
+            self.add(key)
+
+    def segment(self, text: str) -> List[Tuple[str, Optional[str]]]:
+        """
+        Divide una frase en glosas conocidas.
+
+        Cubre el máximo número de términos y, a igual cobertura, usa el menor
+        número de segmentos (las glosas más largas). Los términos que no
+        forman parte de ninguna glosa quedan como segmentos sin clave.
+
+        Args:
+            text: Frase a segmentar
+
+        Returns:
+            Lista ordenada de tuplas (términos del segmento, clave o None)
+        """
+        terms = tokenize(text)
+        if not terms:
+            return []
+
+        phrase = " ".join(terms)
+        starts: List[int] = []
+        ends: Dict[int, int] = {}  # {posición final en la frase: nº de términos}
+        position = 0
+        for index, term in enumerate(terms):
+            starts.append(position)
+            position += len(term)
+            ends[position] = index + 1
+            position += 1
+
+        # best[i]: (términos sin glosa, segmentos) para terms[i:]; next_end[i]: fin del segmento
+        term_count = len(terms)
+        best: List[Tuple[int, int]] = [(0, 0)] * (term_count + 1)
+        next_end = [0] * term_count
+        for index in range(term_count - 1, -1, -1):
+            uncovered, segments = best[index + 1]
+            best[index] = (uncovered + 1, segments + 1)
+            next_end[index] = index + 1
+            for end_offset in self._trie.iter_matches(phrase, starts[index]):
+                end = ends.get(end_offset)
+                if end is None:  # La glosa termina a mitad de un término
+                    continue
+                candidate = (best[end][0], best[end][1] + 1)
+                # Las coincidencias llegan de menor a mayor longitud: ante empate, la más larga
+                if candidate <= best[index]:
+                    best[index] = candidate
+                    next_end[index] = end
+
+        segments_found: List[Tuple[str, Optional[str]]] = []
+        index = 0
+        while index < term_count:
+            end = next_end[index]
+            segment_form = " ".join(terms[index:end])
+            keys = self._keys.get(segment_form)
+            segments_found.append((segment_form, keys[0] if keys else None))
+            index = end
+        return segments_found
+
+    def __len__(self) -> int:
+        """Retorna el número de formas de glosa indexadas."""
+        return len(self._keys)
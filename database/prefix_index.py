@@ -0,0 +1,298 @@
+"""
+Índices de Prefijos y Subcadenas para Señas.
+
+Proporciona un trie de prefijos para autocompletado y un arreglo de sufijos
+generalizado para búsquedas de subcadenas sobre las claves de un idioma.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from database.top_k import top_k
+
+# Bits reservados para el desplazamiento dentro de la clave en cada sufijo
+OFFSET_BITS = 16
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+
+class _TrieNode:
+    """Nodo interno del trie de prefijos."""
+
+    __slots__ = ("children", "is_terminal")
+
+    def __init__(self) -> None:
+        # Las hojas no reservan diccionario de hijos (la mayoría de los nodos)
+        self.children: Optional[Dict[str, "_TrieNode"]] = None
+        self.is_terminal = False
+
+    def child(self, char: str) -> Optional["_TrieNode"]:
+        """Obtiene el hijo para un carácter o None si no existe."""
+        return self.children.get(char) if self.children else None
+
+    def add_child(self, char: str) -> "_TrieNode":
+        """Obtiene o crea el hijo para un carácter."""
+        if self.children is None:
+            self.children = {}
+        node = self.children.get(char)
+        if node is None:
+            node = self.children[char] = _TrieNode()
+        return node
+
+
+class PrefixTrie:
+    """
+    Trie de prefijos sobre las claves normalizadas de un idioma.
+
+    Permite completar un prefijo en tiempo proporcional a su longitud más
+    el número de resultados solicitados, independientemente del tamaño del corpus.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el trie vacío."""
+        self._root = _TrieNode()
+        self._size = 0
+
+    def add(self, key: str) -> None:
+        """
+        Agrega una clave al trie.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        node = self._root
+        for char in key:
+            node = node.add_child(char)
+        if not node.is_terminal:
+            node.is_terminal = True
+            self._size += 1
+
+    def remove(self, key: str) -> None:
+        """
+        Elimina una clave del trie, podando las ramas que quedan vacías.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        path: List[Tuple[_TrieNode, str]] = []
+        node = self._root
+        for char in key:
+            child = node.child(char)
+            if child is None:
+                return
+            path.append((node, char))
+            node = child
+
+        if not node.is_terminal:
+            return
+
+        node.is_terminal = False
+        self._size -= 1
+
+        # Podar nodos sin hijos ni claves terminales
+        for parent, char in reversed(path):
+            child = parent.children[char]
+            if child.children or child.is_terminal:
+                break
+            del parent.children[char]
+            if not parent.children:
+                parent.children = None
+
+    def build(self, keys: List[str]) -> None:
+        """
+        Construye el trie a partir de una lista de claves.
+
+        Args:
+            keys: Claves a indexar
+        """
+        for key in keys:
+            self.add(key)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Obtiene las claves que comienzan con un prefijo.
+
+        Args:
+            prefix: Prefijo a completar
+            limit: Número máximo de claves a retornar
+
+        Returns:
+            Lista de claves en orden lexicográfico
+        """
+        if limit <= 0:
+            return []
+
+        node = self._root
+        for char in prefix:
+            node = node.child(char)
+            if node is None:
+                return []
+
+        completions: List[str] = []
+        # Recorrido en profundidad con pila explícita en orden lexicográfico
+        stack: List[Tuple[_TrieNode, str]] = [(node, prefix)]
+        while stack and len(completions) < limit:
+            current, text = stack.pop()
+            if current.is_terminal:
+                completions.append(text)
+            if current.children:
+                for char in sorted(current.children, reverse=True):
+                    stack.append((current.children[char], text + char))
+
+        return completions
+
+    def iter_matches(self, text: str, start: int = 0) -> Iterator[int]:
+        """
+        Recorre las claves que son prefijo de ``text[start:]``.
+
+        Args:
+            text: Texto en el que buscar
+            start: Posición inicial dentro del texto
+
+        Returns:
+            Iterador de posiciones finales (exclusivas) de cada clave, de menor a mayor
+        """
+        node = self._root
+        for position in range(start, len(text)):
+            node = node.child(text[position])
+            if node is None:
+                return
+            if node.is_terminal:
+                yield position + 1
+
+    def __len__(self) -> int:
+        """Retorna el número de claves en el trie."""
+        return self._size
+
+
+class SuffixArrayIndex:
+    """
+    Arreglo de sufijos generalizado sobre las claves de un idioma.
+
+    Equivale a un arreglo de sufijos sobre la concatenación de las claves
+    con separadores: cada sufijo se identifica por (id de clave,
+    desplazamiento), empaquetado en un entero de 64 bits dentro de un
+    ``array``, y la búsqueda de una subcadena es una búsqueda binaria del
+    rango de sufijos que comienzan con ella. Las modificaciones marcan el
+    índice como desactualizado y se reconstruye en la siguiente consulta.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el índice vacío."""
+        self._keys: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}
+        self._suffixes = array("Q")
+        self._dirty = False
+
+    def add(self, key: str) -> None:
+        """
+        Agrega una clave al índice.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        if key in self._ids:
+            return
+        self._ids[key] = len(self._keys)
+        self._keys.append(key)
+        self._dirty = True
+
+    def remove(self, key: str) -> None:
+        """
+        Elimina una clave del índice.
+
+        Args:
+            key: Clave normalizada de la seña
+        """
+        key_id = self._ids.pop(key, None)
+        if key_id is None:
+            return
+        self._keys[key_id] = None
+        self._dirty = True
+
+    def build(self, keys: List[str]) -> None:
+        """
+        Construye el índice a partir de una lista de claves.
+
+        Args:
+            keys: Claves a indexar en orden de inserción
+        """
+        for key in keys:
+            self.add(key)
+        self._rebuild()
+
+    def prepare(self) -> None:
+        """Reconstruye el arreglo de sufijos si hay cambios pendientes."""
+        if self._dirty:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Compacta las claves y ordena todos los sufijos."""
+        self._keys = [key for key in self._keys if key is not None]
+        self._ids = {key: key_id for key_id, key in enumerate(self._keys)}
+        keys = self._keys
+        suffixes = [
+            (key_id << OFFSET_BITS) | offset
+            for key_id, key in enumerate(keys)
+            for offset in range(min(len(key), OFFSET_MASK + 1))
+        ]
+        suffixes.sort(key=lambda suffix: keys[suffix >> OFFSET_BITS][suffix & OFFSET_MASK:])
+        self._suffixes = array("Q", suffixes)
+        self._dirty = False
+
+    def _lower_bound(self, pattern: str) -> int:
+        """Primera posición cuyo sufijo (truncado) no es menor que el patrón."""
+        keys, suffixes = self._keys, self._suffixes
+        length = len(pattern)
+        low, high = 0, len(suffixes)
+        while low < high:
+            middle = (low + high) // 2
+            suffix = suffixes[middle]
+            key_id, offset = suffix >> OFFSET_BITS, suffix & OFFSET_MASK
+            if keys[key_id][offset:offset + length] < pattern:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _upper_bound(self, pattern: str) -> int:
+        """Primera posición cuyo sufijo (truncado) es mayor que el patrón."""
+        keys, suffixes = self._keys, self._suffixes
+        length = len(pattern)
+        low, high = 0, len(suffixes)
+        while low < high:
+            middle = (low + high) // 2
+            suffix = suffixes[middle]
+            key_id, offset = suffix >> OFFSET_BITS, suffix & OFFSET_MASK
+            if keys[key_id][offset:offset + length] <= pattern:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find(self, pattern: str, limit: int = 10) -> List[str]:
+        """
+        Obtiene las claves que contienen una subcadena.
+
+        Args:
+            pattern: Subcadena a buscar
+            limit: Número máximo de claves a retornar
+
+        Returns:
+            Lista de claves que contienen la subcadena, en orden de inserción
+        """
+        if not pattern or limit <= 0:
+            return []
+
+        self.prepare()
+
+        start = self._lower_bound(pattern)
+        end = self._upper_bound(pattern)
+        key_ids = top_k({self._suffixes[position] >> OFFSET_BITS for position in range(start, end)}, limit)
+        return [self._keys[key_id] for key_id in key_ids]
+
+    def __len__(self) -> int:
+        """Retorna el número de claves indexadas."""
+        return len(self._ids)
@@ -11,17 +11,40 @@ Versión: 2.0.0
 import csv
 import os
 import random
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
-import difflib
+from database.fuzzy_index import DEFAULT_FUZZY_INDEX, FuzzyIndex
+from database.language_index import LanguageIndex
+from database.lemma_index import QueryRewrite
+from database.normalization import fold_key
+from database.storage import BACKEND_MEMORY, BACKEND_SQLITE, SignLookupTable, SignsBackend
+
+
+def get_default_csv_files() -> Dict[str, str]:
+    """
+    Obtiene las rutas por defecto de los archivos CSV para cada idioma.
+    
+    Returns:
+        Diccionario con idioma como clave y ruta del CSV como valor
+    """
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return {
+        "ecuatoriano": os.path.join(project_root, "señas_ecuatorianas.csv"),
+        "chileno": os.path.join(project_root, "señas_chilenas.csv"),
+        "mexicano": os.path.join(project_root, "señas_mexicanas.csv")
+    }
 
 
-@dataclass
 class SignEntry:
     """
     Representa una entrada de seña en la base de datos.
     
+    Usa ``__slots__`` en lugar de un ``__dict__`` por instancia, interna las
+    cadenas repetidas (categoría e idioma) y no duplica las instrucciones
+    cuando la descripción coincide con ellas.
+    
     Attributes:
         word: Palabra o término de la seña
         instructions: Instrucciones detalladas para realizar la seña
@@ -29,43 +52,105 @@ class SignEntry:
         description: Descripción adicional (mantenido por compatibilidad)
         language: Idioma de la seña (ecuatoriano, chileno, mexicano)
     """
-    word: str
-    instructions: str
-    category: str = "General"
-    description: str = ""
-    language: str = "ecuatoriano"
     
-    def __post_init__(self) -> None:
-        """Inicialización posterior para mantener compatibilidad."""
-        if not self.description:
-            self.description = self.instructions
+    __slots__ = ("word", "instructions", "category", "language", "_description")
+    
+    def __init__(self, word: str, instructions: str, category: str = "General",
+                 description: str = "", language: str = "ecuatoriano") -> None:
+        """
+        Inicializa la entrada de seña.
+        
+        Args:
+            word: Palabra o término de la seña
+            instructions: Instrucciones detalladas para realizar la seña
+            category: Categoría temática de la seña
+            description: Descripción adicional (por defecto, las instrucciones)
+            language: Idioma de la seña
+        """
+        self.word = word
+        self.instructions = instructions
+        self.category = sys.intern(category) if category else category
+        self.language = sys.intern(language) if language else language
+        self.description = description
+    
+    @property
+    def description(self) -> str:
+        """Descripción de la seña (las instrucciones si no se definió otra)."""
+        return self._description if self._description is not None else self.instructions
+    
+    @description.setter
+    def description(self, value: str) -> None:
+        """Guarda la descripción solo si difiere de las instrucciones."""
+        self._description = value if value and value != self.instructions else None
+    
+    def _fields(self) -> Tuple[str, str, str, str, str]:
+        """Retorna los campos de la entrada en orden de declaración."""
+        return (self.word, self.instructions, self.category, self.description, self.language)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compara dos entradas campo por campo."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    __hash__ = None  # Entrada mutable, igual que el dataclass original
+    
+    def __repr__(self) -> str:
+        """Representación detallada de la entrada de seña."""
+        return (
+            f"SignEntry(word={self.word!r}, instructions={self.instructions!r}, "
+            f"category={self.category!r}, description={self.description!r}, "
+            f"language={self.language!r})"
+        )
     
     def __str__(self) -> str:
         """Representación en cadena de la entrada de seña."""
         return f"{self.word}: {self.instructions}"
 
 
-class SignsDatabase:
+class SignsDatabase(SignsBackend):
     """
     Clase principal para manejar la base de datos de señas multiidioma.
     
     Proporciona funcionalidades para cargar, buscar y gestionar señas
     desde múltiples archivos CSV con soporte para búsquedas exactas, difusas
-    y por categorías en diferentes idiomas de señas.
+    y por categorías en diferentes idiomas de señas. Es el backend en memoria
+    de ``SignsBackend``: cada proceso mantiene su propia copia indexada.
     """
     
-    def __init__(self, csv_files: Optional[Dict[str, str]] = None) -> None:
+    def __init__(self, csv_files: Optional[Dict[str, str]] = None,
+                 fuzzy_index_factory: Optional[Callable[[], FuzzyIndex]] = None) -> None:
         """
         Inicializa la base de datos de señas multiidioma.
         
         Args:
             csv_files: Diccionario con idioma como clave y ruta del CSV como valor.
                       Si es None, usa las rutas por defecto.
+            fuzzy_index_factory: Fábrica del índice de búsqueda difusa por idioma.
+                                Si es None, usa el índice de caracteres por defecto.
         """
         self.signs: Dict[str, Dict[str, SignEntry]] = {}  # {idioma: {palabra: SignEntry}}
         self.csv_files = csv_files or self._get_default_csv_files()
+        self._fuzzy_index_factory = fuzzy_index_factory or DEFAULT_FUZZY_INDEX
+        self._indexes: Dict[str, LanguageIndex] = {}  # {idioma: índices y metadatos}
+        self._word_language_counts: Dict[str, int] = {}  # {palabra: nº de idiomas que la tienen}
+        self._common_words: Set[str] = set()
+        self._sorted_common_words: Optional[List[str]] = None
+        self._write_lock = threading.RLock()  # Serializa cargas, recargas y ediciones
+        self._generation = 0  # Se incrementa tras publicar cada cambio
         self._load_all_signs()
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Estado serializable (sin el candado de escritura)."""
+        state = self.__dict__.copy()
+        del state["_write_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restaura el estado y crea un candado de escritura nuevo."""
+        self.__dict__.update(state)
+        self._write_lock = threading.RLock()
+    
     def _get_default_csv_files(self) -> Dict[str, str]:
         """
         Obtiene las rutas por defecto de los archivos CSV para cada idioma.
@@ -73,12 +158,7 @@ class SignsDatabase:
         Returns:
             Diccionario con idioma como clave y ruta del CSV como valor
         """
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        return {
-            "ecuatoriano": os.path.join(project_root, "señas_ecuatorianas.csv"),
-            "chileno": os.path.join(project_root, "señas_chilenas.csv"),
-            "mexicano": os.path.join(project_root, "señas_mexicanas.csv")
-        }
+        return get_default_csv_files()
     
     def _get_default_csv_path(self) -> str:
         """
@@ -103,14 +183,152 @@ class SignsDatabase:
             try:
                 self.signs[language] = {}
                 loaded_count = self._load_signs_from_file(csv_path, language)
+                self._build_language_indexes(language)
                 total_loaded += loaded_count
                 print(f"✅ {language.capitalize()}: {loaded_count} señas cargadas")
             except Exception as e:
                 print(f"❌ Error cargando {language}: {e}")
                 self.signs[language] = {}
+                self._build_language_indexes(language)
         
         print(f"✅ Total: {total_loaded} señas cargadas de {len(self.csv_files)} idiomas")
     
+    def _build_language_indexes(self, language: str) -> None:
+        """
+        Construye los índices y metadatos de un idioma a partir de sus señas cargadas.
+        
+        Args:
+            language: Idioma cuyos índices se construyen
+        """
+        language_index = LanguageIndex(language, self._fuzzy_index_factory)
+        language_index.build(self.signs.get(language, {}))
+        self._set_language_index(language, language_index)
+    
+    def _set_language_index(self, language: str, language_index: LanguageIndex) -> None:
+        """
+        Publica los índices de un idioma y actualiza las palabras comunes.
+        
+        Args:
+            language: Idioma a publicar
+            language_index: Índices ya construidos del idioma
+        """
+        language_index.prepare()
+        previous = self._indexes.get(language)
+        self._indexes[language] = language_index
+        self.signs[language] = language_index.signs
+        
+        if previous is None:
+            # Cambia el número de idiomas: recalcular la intersección completa
+            self._rebuild_common_words()
+            self._generation += 1
+            return
+        
+        for word_key in previous.signs:
+            self._unregister_word(word_key)
+        for word_key in language_index.signs:
+            self._register_word(word_key)
+        self._generation += 1
+    
+    def _rebuild_common_words(self) -> None:
+        """Recalcula desde cero los conteos de palabras por idioma."""
+        self._word_language_counts = {}
+        self._common_words = set()
+        self._sorted_common_words = None
+        for language_index in self._indexes.values():
+            for word_key in language_index.signs:
+                self._register_word(word_key)
+    
+    def _register_word(self, word_key: str) -> None:
+        """Cuenta una palabra como presente en un idioma más."""
+        count = self._word_language_counts.get(word_key, 0) + 1
+        self._word_language_counts[word_key] = count
+        if count == len(self._indexes):
+            self._common_words.add(word_key)
+            self._sorted_common_words = None
+    
+    def _unregister_word(self, word_key: str) -> None:
+        """Descuenta una palabra de un idioma."""
+        count = self._word_language_counts.get(word_key, 0)
+        if count <= 0:
+            return
+        if word_key in self._common_words:
+            self._common_words.discard(word_key)
+            self._sorted_common_words = None
+        if count == 1:
+            del self._word_language_counts[word_key]
+        else:
+            self._word_language_counts[word_key] = count - 1
+    
+    def add_sign(self, word: str, instructions: str, category: str = "General",
+                 language: str = "ecuatoriano") -> SignEntry:
+        """
+        Inserta o actualiza una seña manteniendo índices y estadísticas al día.
+        
+        Como ``reload_language``, edita una copia de los índices del idioma y
+        la publica con una sola asignación, de modo que las lecturas
+        concurrentes (que no toman candado) nunca ven índices a medio editar.
+        
+        Args:
+            word: Palabra de la seña
+            instructions: Instrucciones para realizar la seña
+            category: Categoría temática de la seña
+            language: Idioma de la seña
+            
+        Returns:
+            La entrada de seña insertada
+            
+        Raises:
+            ValueError: Si la palabra o las instrucciones están vacías
+        """
+        word_key = word.lower().strip() if word else ""
+        if not word_key or not instructions or not instructions.strip():
+            raise ValueError("La palabra y las instrucciones son obligatorias")
+        
+        sign_entry = SignEntry(
+            word=self._normalize_word(word),
+            instructions=instructions.strip(),
+            category=category.strip() if category else "General",
+            language=language
+        )
+        
+        with self._write_lock:
+            if language not in self._indexes:
+                self.signs[language] = {}
+                self._build_language_indexes(language)
+            
+            staged = self._indexes[language].clone()
+            staged.add(word_key, sign_entry)
+            self._set_language_index(language, staged)
+        
+        return sign_entry
+    
+    def remove_sign(self, word: str, language: str = "ecuatoriano") -> bool:
+        """
+        Elimina una seña manteniendo índices y estadísticas al día.
+        
+        La eliminación se aplica sobre una copia de los índices del idioma que
+        se publica con una sola asignación, igual que en ``add_sign``.
+        
+        Args:
+            word: Palabra de la seña
+            language: Idioma de la seña
+            
+        Returns:
+            True si la seña existía y se eliminó
+        """
+        if not word or language not in self._indexes:
+            return False
+        
+        word_key = word.lower().strip()
+        with self._write_lock:
+            current = self._indexes[language]
+            if word_key not in current.signs:
+                return False
+            staged = current.clone()
+            staged.remove(word_key)
+            self._set_language_index(language, staged)
+        return True
+    
     def _load_signs_from_file(self, csv_path: str, language: str) -> int:
         """
         Carga las señas desde un archivo CSV específico.
@@ -123,25 +341,49 @@ class SignsDatabase:
             Número de señas cargadas
             
         Raises:
-            FileNotFoundError: Si el archivo CSV no existe
             Exception: Si hay errores durante la carga
         """
+        signs = self.read_signs_file(csv_path, language)
+        self.signs[language] = signs
+        return len(signs)
+    
+    @classmethod
+    def read_signs_file(cls, csv_path: str, language: str) -> Dict[str, SignEntry]:
+        """
+        Lee las señas de un archivo CSV sin modificar ninguna base de datos.
+        
+        Lo usan la carga, la recarga incremental y los importadores de otros
+        backends de almacenamiento.
+        
+        Args:
+            csv_path: Ruta del archivo CSV
+            language: Idioma de las señas
+            
+        Returns:
+            Diccionario {clave: SignEntry} en el orden del archivo
+            (vacío si el archivo no existe)
+            
+        Raises:
+            Exception: Si hay errores durante la lectura
+        """
+        signs: Dict[str, SignEntry] = {}
         if not os.path.exists(csv_path):
             print(f"⚠️ Archivo no encontrado: {csv_path}")
-            return 0
+            return signs
             
         try:
             with open(csv_path, 'r', encoding='utf-8-sig') as file:
                 csv_reader = csv.DictReader(file, quotechar='"', skipinitialspace=True)
                 
-                loaded_count = 0
+                # Identificar las columnas una sola vez a partir del encabezado
+                fieldnames = csv_reader.fieldnames or []
+                palabra_key = next((k for k in fieldnames if 'Palabra' in k), 'Palabra')
+                descripcion_key = next((k for k in fieldnames if 'Descripción' in k), 'Descripción')
+                categoria_key = next((k for k in fieldnames if 'Categoría' in k), 'Categoría')
+                
                 for row_num, row in enumerate(csv_reader, start=2):
                     try:
                         # Obtener y limpiar los datos
-                        palabra_key = next((k for k in row.keys() if 'Palabra' in k), 'Palabra')
-                        descripcion_key = next((k for k in row.keys() if 'Descripción' in k), 'Descripción')
-                        categoria_key = next((k for k in row.keys() if 'Categoría' in k), 'Categoría')
-                        
                         raw_word = row.get(palabra_key, '').strip()
                         instructions = row.get(descripcion_key, '').strip()
                         category = row.get(categoria_key, 'General').strip()
@@ -151,17 +393,16 @@ class SignsDatabase:
                             raw_word = raw_word[1:-1]
                         
                         # Normalizar la palabra
-                        word_normalized = self._normalize_word(raw_word)
+                        word_normalized = cls._normalize_word(raw_word)
                         word_key = raw_word.lower().strip()
                         
                         if word_key and instructions:
-                            self.signs[language][word_key] = SignEntry(
+                            signs[word_key] = SignEntry(
                                 word=word_normalized,
                                 instructions=instructions,
                                 category=category,
                                 language=language
                             )
-                            loaded_count += 1
                         else:
                             print(f"⚠️ {language} - Fila {row_num}: Datos incompletos")
                             
@@ -169,14 +410,15 @@ class SignsDatabase:
                         print(f"⚠️ {language} - Error en fila {row_num}: {row_error}")
                         continue
                 
-                return loaded_count
+                return signs
                 
         except Exception as e:
             error_msg = f"Error al cargar {csv_path}: {e}"
             print(error_msg)
             raise Exception(error_msg) from e
     
-    def _normalize_word(self, word: str) -> str:
+    @staticmethod
+    def _normalize_word(word: str) -> str:
         """
         Normaliza una palabra para mostrar con formato consistente.
         
@@ -206,9 +448,110 @@ class SignsDatabase:
             return cleaned.capitalize()
 
     def reload_database(self) -> None:
-        """Recarga la base de datos desde todos los archivos CSV."""
-        self.signs.clear()
-        self._load_all_signs()
+        """
+        Recarga la base de datos desde todos los archivos CSV.
+        
+        Cada idioma se actualiza de forma incremental con ``reload_language``,
+        por lo que las búsquedas concurrentes siguen atendiéndose durante la recarga.
+        """
+        for language in list(self.csv_files):
+            try:
+                self.reload_language(language)
+            except Exception as e:
+                print(f"❌ Error recargando {language}: {e}")
+    
+    @staticmethod
+    def _diff_signs(current: Dict[str, SignEntry],
+                    updated: Dict[str, SignEntry]) -> Tuple[Dict[str, SignEntry], Dict[str, SignEntry], List[str]]:
+        """
+        Compara las señas cargadas con las leídas de nuevo del CSV.
+        
+        Args:
+            current: Señas cargadas actualmente
+            updated: Señas leídas del archivo
+            
+        Returns:
+            Tupla (insertadas, modificadas, claves eliminadas)
+        """
+        inserted: Dict[str, SignEntry] = {}
+        modified: Dict[str, SignEntry] = {}
+        for word_key, sign_entry in updated.items():
+            previous = current.get(word_key)
+            if previous is None:
+                inserted[word_key] = sign_entry
+            elif previous != sign_entry:
+                modified[word_key] = sign_entry
+        
+        deleted = [word_key for word_key in current if word_key not in updated]
+        return inserted, modified, deleted
+    
+    def reload_language(self, language: str) -> Dict[str, int]:
+        """
+        Recarga un idioma aplicando solo las diferencias con su CSV.
+        
+        Las inserciones, modificaciones y eliminaciones se aplican sobre una
+        copia de los índices del idioma que luego reemplaza a la actual con una
+        sola asignación: los lectores concurrentes ven la versión anterior o la
+        nueva, nunca un idioma a medio cargar.
+        
+        Args:
+            language: Idioma a recargar
+            
+        Returns:
+            Diccionario con el número de señas insertadas, modificadas y eliminadas
+            
+        Raises:
+            KeyError: Si el idioma no tiene un CSV configurado
+            Exception: Si hay errores al leer el archivo (se conserva el estado actual)
+        """
+        csv_path = self.csv_files[language]
+        
+        with self._write_lock:
+            updated_signs = self.read_signs_file(csv_path, language)
+            current = self._indexes.get(language)
+            
+            if current is None:
+                language_index = LanguageIndex(language, self._fuzzy_index_factory)
+                language_index.build(updated_signs)
+                self._set_language_index(language, language_index)
+                return {"inserted": len(updated_signs), "updated": 0, "deleted": 0}
+            
+            inserted, modified, deleted = self._diff_signs(current.signs, updated_signs)
+            changes = {"inserted": len(inserted), "updated": len(modified), "deleted": len(deleted)}
+            if not (inserted or modified or deleted):
+                return changes
+            
+            staged = current.clone()
+            for word_key in deleted:
+                staged.remove(word_key)
+            for word_key, sign_entry in modified.items():
+                staged.add(word_key, sign_entry)
+            for word_key, sign_entry in inserted.items():
+                staged.add(word_key, sign_entry)
+            
+            # Publicar la nueva versión del idioma
+            staged.prepare()
+            self._indexes[language] = staged
+            self.signs[language] = staged.signs
+            
+            for word_key in deleted:
+                self._unregister_word(word_key)
+            for word_key in inserted:
+                self._register_word(word_key)
+            self._generation += 1
+        
+        print(f"🔄 {language.capitalize()}: +{changes['inserted']} ~{changes['updated']} "
+              f"-{changes['deleted']} señas recargadas")
+        return changes
+    
+    def get_languages(self) -> List[str]:
+        """
+        Obtiene los idiomas cargados en el orden de configuración.
+        
+        Returns:
+            Lista de idiomas
+        """
+        return list(self.signs.keys())
     
     def search_exact(self, word: str, language: str = "ecuatoriano") -> Optional[SignEntry]:
         """
@@ -229,22 +572,125 @@ class SignsDatabase:
         
         # Normalizar la búsqueda a minúsculas para la clave
         search_key = word.lower().strip()
-        return self.signs[language].get(search_key)
+        sign_entry = self.signs[language].get(search_key)
+        if sign_entry is not None:
+            return sign_entry
+        
+        # Índice secundario insensible a acentos ("adios" -> "adiós")
+        return self._search_folded(search_key, language)
     
-    def search_exact_all_languages(self, word: str) -> Dict[str, Optional[SignEntry]]:
+    def _search_folded(self, word: str, language: str) -> Optional[SignEntry]:
         """
-        Busca una seña exacta en todos los idiomas disponibles.
+        Busca una seña por su forma plegada (sin acentos ni variante regional).
+        
+        Si la consulta indica una variante ("mayo (costa)") se prefiere esa
+        variante; en caso contrario se retorna la primera entrada cargada.
         
         Args:
             word: Palabra a buscar
+            language: Idioma en el que buscar
             
         Returns:
-            Diccionario con idioma como clave y SignEntry como valor (None si no se encuentra)
+            SignEntry si se encuentra, None si no existe
         """
-        results = {}
-        for language in self.signs.keys():
-            results[language] = self.search_exact(word, language)
-        return results
+        folded_base, variant = fold_key(word)
+        return self._resolve_folded(self._indexes[language], folded_base, variant)
+    
+    @staticmethod
+    def _resolve_folded(language_index: LanguageIndex, folded_base: str,
+                        variant: Optional[str]) -> Optional[SignEntry]:
+        """
+        Resuelve una forma plegada ya calculada en los índices de un idioma.
+        
+        Args:
+            language_index: Índices del idioma
+            folded_base: Palabra base plegada
+            variant: Variante regional pedida o None
+            
+        Returns:
+            SignEntry si se encuentra, None si no existe
+        """
+        candidate_keys = language_index.folded_index.get(folded_base)
+        if not candidate_keys:
+            return None
+        
+        signs = language_index.signs
+        if variant:
+            for key in candidate_keys:
+                if fold_key(key)[1] == variant:
+                    return signs[key]
+        
+        return signs[candidate_keys[0]]
+    
+    def search_variants(self, word: str, language: str = "ecuatoriano") -> List[SignEntry]:
+        """
+        Busca una seña exacta junto con sus variantes regionales.
+        
+        Las variantes ("Mayo (Costa)", "Mayo (Sierra)") se indexan al cargar
+        bajo su palabra base plegada, por lo que una sola consulta las
+        retorna todas.
+        
+        Args:
+            word: Palabra a buscar
+            language: Idioma en el que buscar
+            
+        Returns:
+            Lista con la coincidencia exacta seguida de las demás variantes
+            regionales (vacía si no existe; solo la variante pedida si la
+            consulta indica una)
+        """
+        sign_entry = self.search_exact(word, language)
+        if sign_entry is None:
+            return []
+        
+        folded_base, variant = fold_key(word.lower().strip())
+        if variant:
+            return [sign_entry]
+        
+        language_index = self._indexes[language]
+        signs = language_index.signs
+        variant_keys = language_index.variant_index.get(folded_base, ())
+        return [sign_entry] + [signs[key] for key in variant_keys if signs[key] is not sign_entry]
+    
+    def search_many(self, words: Sequence[str],
+                    languages: Optional[Sequence[str]] = None) -> SignLookupTable:
+        """
+        Busca exactamente varias palabras en varios idiomas a la vez.
+        
+        Cada palabra se normaliza (y se pliega, solo si hace falta) una única
+        vez para todos los idiomas, y cada idioma se resuelve con una sola
+        referencia a sus índices.
+        
+        Args:
+            words: Palabras a buscar
+            languages: Idiomas en los que buscar (por defecto, todos)
+            
+        Returns:
+            Tabla densa palabra × idioma; cada celda equivale a ``search_exact``
+        """
+        words = list(words)
+        languages = list(languages) if languages is not None else self.get_languages()
+        keys = [word.lower().strip() if word else "" for word in words]
+        folded: Dict[str, Tuple[str, Optional[str]]] = {}
+        rows: List[List[Optional[SignEntry]]] = [[None] * len(languages) for _ in words]
+        
+        for column, language in enumerate(languages):
+            language_index = self._indexes.get(language)
+            if language_index is None:
+                continue
+            
+            signs = language_index.signs
+            for row, key in enumerate(keys):
+                if not key:
+                    continue
+                sign_entry = signs.get(key)
+                if sign_entry is None:
+                    if key not in folded:
+                        folded[key] = fold_key(key)
+                    sign_entry = self._resolve_folded(language_index, *folded[key])
+                rows[row][column] = sign_entry
+        
+        return SignLookupTable(words=words, languages=languages, rows=rows)
     
     def search_fuzzy(self, word: str, max_results: int = 5, 
                     min_similarity: float = 0.3, language: str = "ecuatoriano") -> List[Tuple[SignEntry, float]]:
@@ -266,25 +712,81 @@ class SignsDatabase:
         if language not in self.signs:
             return []
         
+        if max_results <= 0:
+            return []
+        
         word = word.lower().strip()
-        matches = []
+        language_index = self._indexes[language]
+        signs = language_index.signs
+        fuzzy_index = language_index.fuzzy_index
+        
+        matches = fuzzy_index.top_matches(word, max_results, min_similarity)
+        return [(signs[sign_word], similarity) for sign_word, similarity in matches]
+    
+    def segment_phrase(self, text: str,
+                       language: str = "ecuatoriano") -> List[Tuple[str, Optional[SignEntry]]]:
+        """
+        Divide una frase en la secuencia de glosas conocidas más largas.
         
-        for sign_word, sign_entry in self.signs[language].items():
-            similarity = difflib.SequenceMatcher(None, word, sign_word).ratio()
-            if similarity >= min_similarity:
-                matches.append((sign_entry, similarity))
+        Recorre la frase una sola vez sobre el índice de frases del idioma
+        ("buenos días mamá" -> "buenos dias" + "mama").
         
-        # Ordenar por similitud descendente
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return matches[:max_results]
+        Args:
+            text: Frase a segmentar
+            language: Idioma en el que buscar
+            
+        Returns:
+            Lista ordenada de tuplas (términos plegados del segmento, SignEntry o None)
+        """
+        if not text or not text.strip():
+            return []
+        
+        if language not in self.signs:
+            return []
+        
+        language_index = self._indexes[language]
+        signs = language_index.signs
+        return [
+            (segment, signs[key] if key is not None else None)
+            for segment, key in language_index.phrase_index.segment(text)
+        ]
     
-    def search_partial(self, partial_word: str, max_results: int = 10) -> List[SignEntry]:
+    def search_rewritten(self, word: str,
+                         language: str = "ecuatoriano") -> Optional[Tuple[SignEntry, QueryRewrite]]:
+        """
+        Busca una seña reescribiendo la consulta por lema o sinónimo.
+        
+        Cuesta una consulta al diccionario precompilado de formas de raíces
+        del idioma ("necesitando" -> "necesitar", "papá" -> "padre").
+        
+        Args:
+            word: Palabra a buscar
+            language: Idioma en el que buscar
+            
+        Returns:
+            Tupla (SignEntry, reescritura aplicada) o None si no hay reescritura
+        """
+        if not word or not word.strip():
+            return None
+        
+        if language not in self.signs:
+            return None
+        
+        language_index = self._indexes[language]
+        rewrite = language_index.lemma_index.lookup(word)
+        if rewrite is None:
+            return None
+        return language_index.signs[rewrite.target], rewrite
+    
+    def search_partial(self, partial_word: str, max_results: int = 10,
+                       language: str = "ecuatoriano") -> List[SignEntry]:
         """
         Busca señas que contengan la palabra parcial.
         
         Args:
             partial_word: Parte de la palabra a buscar
             max_results: Número máximo de resultados
+            language: Idioma en el que buscar
             
         Returns:
             Lista de SignEntry que contienen la palabra parcial
@@ -292,16 +794,38 @@ class SignsDatabase:
         if not partial_word or not partial_word.strip():
             return []
         
+        if language not in self.signs:
+            return []
+        
         partial_word = partial_word.lower().strip()
-        matches = []
+        language_index = self._indexes[language]
+        keys = language_index.substring_index.find(partial_word, max_results)
+        signs = language_index.signs
+        return [signs[key] for key in keys]
+    
+    def autocomplete(self, prefix: str, language: str = "ecuatoriano", k: int = 10) -> List[SignEntry]:
+        """
+        Sugiere señas cuya palabra comienza con el prefijo dado.
         
-        for sign_word, sign_entry in self.signs.items():
-            if partial_word in sign_word:
-                matches.append(sign_entry)
-                if len(matches) >= max_results:
-                    break
+        Args:
+            prefix: Prefijo escrito por el usuario
+            language: Idioma en el que buscar
+            k: Número máximo de sugerencias
+            
+        Returns:
+            Lista de SignEntry en orden alfabético
+        """
+        if not prefix or not prefix.strip():
+            return []
         
-        return matches
+        if language not in self.signs:
+            return []
+        
+        prefix = prefix.lower().lstrip()
+        language_index = self._indexes[language]
+        keys = language_index.prefix_index.complete(prefix, k)
+        signs = language_index.signs
+        return [signs[key] for key in keys]
     
     def search_by_category(self, category: str, language: str = "ecuatoriano", max_results: int = 20) -> List[SignEntry]:
         """
@@ -322,13 +846,17 @@ class SignsDatabase:
             return []
         
         category = category.lower().strip()
+        language_index = self._indexes[language]
         matches = []
         
-        for sign_entry in self.signs[language].values():
-            if category in sign_entry.category.lower():
-                matches.append(sign_entry)
+        # Recorrer solo las categorías (pocas) y luego sus entradas
+        for category_name in language_index.get_sorted_categories():
+            if category not in category_name.lower():
+                continue
+            for word_key in language_index.categories[category_name]:
+                matches.append(language_index.signs[word_key])
                 if len(matches) >= max_results:
-                    break
+                    return matches
         
         return matches
     
@@ -354,12 +882,7 @@ class SignsDatabase:
         if language not in self.signs:
             return []
         
-        categories = set()
-        for sign_entry in self.signs[language].values():
-            if sign_entry.category:
-                categories.add(sign_entry.category)
-        
-        return sorted(list(categories))
+        return self._indexes[language].get_sorted_categories()
     
     def get_all_categories_all_languages(self) -> Dict[str, List[str]]:
         """
@@ -393,17 +916,24 @@ class SignsDatabase:
         return random.sample(available_signs, actual_count)
     
     def get_signs_by_keywords(self, keywords: List[str], 
-                             language: str = "ecuatoriano", max_results: int = 15) -> List[SignEntry]:
+                             language: str = "ecuatoriano", max_results: int = 15,
+                             match_all: bool = False) -> List[SignEntry]:
         """
         Obtiene señas que contengan palabras clave específicas.
         
+        Usa el índice invertido del idioma sobre la palabra, las instrucciones
+        y la categoría, por lo que el costo no depende del tamaño total del
+        texto de las instrucciones.
+        
         Args:
             keywords: Lista de palabras clave para filtrar
             language: Idioma en el que buscar
             max_results: Número máximo de resultados
+            match_all: Si True exige todas las palabras clave (AND);
+                       si False basta con cualquiera (OR)
             
         Returns:
-            Lista de SignEntry que contienen las palabras clave
+            Lista de SignEntry que contienen las palabras clave, ordenada por relevancia (BM25)
         """
         if not keywords or language not in self.signs:
             return []
@@ -412,18 +942,10 @@ class SignsDatabase:
         if not keywords:
             return []
         
-        matches = []
-        
-        for sign_entry in self.signs[language].values():
-            # Buscar en palabra, instrucciones y categoría
-            search_text = f"{sign_entry.word} {sign_entry.instructions} {sign_entry.category}".lower()
-            
-            if any(keyword in search_text for keyword in keywords):
-                matches.append(sign_entry)
-                if len(matches) >= max_results:
-                    break
-        
-        return matches
+        language_index = self._indexes[language]
+        ranked = language_index.text_index.search(keywords, match_all, max_results)
+        signs = language_index.signs
+        return [signs[key] for key, _ in ranked]
     
     def get_database_stats(self) -> Dict[str, Dict[str, int]]:
         """
@@ -434,15 +956,10 @@ class SignsDatabase:
         """
         stats = {}
         
-        for language, signs in self.signs.items():
-            categories = set()
-            for sign_entry in signs.values():
-                if sign_entry.category:
-                    categories.add(sign_entry.category)
-            
+        for language, language_index in self._indexes.items():
             stats[language] = {
-                "total_signs": len(signs),
-                "total_categories": len(categories)
+                "total_signs": len(language_index),
+                "total_categories": len(language_index.categories)
             }
         
         return stats
@@ -457,17 +974,24 @@ class SignsDatabase:
         if not self.signs:
             return []
         
-        # Obtener las palabras de cada idioma
-        language_words = {}
-        for language, signs in self.signs.items():
-            language_words[language] = set(signs.keys())
-        
-        # Encontrar la intersección de todas las palabras
-        if language_words:
-            common_words = set.intersection(*language_words.values())
-            return sorted(list(common_words))
+        # Intersección mantenida de forma incremental al cargar y modificar señas
+        sorted_common_words = self._sorted_common_words
+        if sorted_common_words is None:
+            # Ordenar bajo el candado: una edición concurrente modifica el conjunto
+            with self._write_lock:
+                if self._sorted_common_words is None:
+                    self._sorted_common_words = sorted(self._common_words)
+                sorted_common_words = self._sorted_common_words
+        return list(sorted_common_words)
+    
+    def get_generation(self) -> int:
+        """
+        Obtiene la generación de los datos en memoria.
         
-        return []
+        Returns:
+            Número de cambios publicados desde la carga (cargas, recargas y ediciones)
+        """
+        return self._generation
     
     def _calculate_average_instruction_length(self, language: str = "ecuatoriano") -> float:
         """
@@ -482,8 +1006,8 @@ class SignsDatabase:
         if language not in self.signs or not self.signs[language]:
             return 0.0
         
-        total_length = sum(len(sign.instructions) for sign in self.signs[language].values())
-        return total_length / len(self.signs[language]) if self.signs[language] else 0.0
+        language_index = self._indexes[language]
+        return language_index.total_instruction_length / len(language_index)
     
     def export_to_dict(self, language: str = "ecuatoriano") -> Dict[str, Dict[str, str]]:
         """
@@ -584,17 +1108,59 @@ def get_default_database() -> SignsDatabase:
 
 
 # Instancia global para uso singleton (opcional)
-_default_database: Optional[SignsDatabase] = None
+_default_database: Optional[SignsBackend] = None
+
+
+def _get_configured_backend() -> Tuple[str, Optional[str], Optional[Callable[[], FuzzyIndex]]]:
+    """
+    Obtiene el backend de almacenamiento y el escorer difuso configurados.
+    
+    Returns:
+        Tupla (nombre del backend, ruta del archivo SQLite o None,
+        fábrica del índice difuso o None para la de difflib)
+    """
+    try:
+        from utils.config_utils import get_global_config
+        database_config = get_global_config().database
+    except Exception as e:
+        print(f"⚠️ No se pudo leer el backend configurado, se usa memoria: {e}")
+        return BACKEND_MEMORY, None, None
+    
+    fuzzy_index_factory = None
+    if database_config.fuzzy_scorer != "difflib":
+        try:
+            # Importación local: los escorers vectorizados requieren NumPy
+            from database.vector_scoring import get_fuzzy_index_factory
+            fuzzy_index_factory = get_fuzzy_index_factory(database_config.fuzzy_scorer)
+        except ImportError as e:
+            print(f"⚠️ Escorer '{database_config.fuzzy_scorer}' no disponible, se usa difflib: {e}")
+    
+    return database_config.backend, database_config.sqlite_path, fuzzy_index_factory
 
 
-def get_database_instance() -> SignsDatabase:
+def get_database_instance() -> SignsBackend:
     """
     Obtiene la instancia singleton de la base de datos.
     
+    Con el backend en memoria se carga desde el snapshot binario en caché y
+    solo se reconstruye desde los CSV cuando alguno de ellos cambia; si
+    ``DatabaseConfig.auto_reload`` está activo, los cambios posteriores en
+    los CSV se aplican en caliente. Con el backend SQLite se abre el archivo
+    compartido, importando los CSV si aún no existe.
+    
     Returns:
-        Instancia singleton de SignsDatabase
+        Instancia singleton del backend configurado
     """
     global _default_database
     if _default_database is None:
-        _default_database = SignsDatabase()
+        backend, sqlite_path, fuzzy_index_factory = _get_configured_backend()
+        # Importaciones locales: estos módulos dependen de este módulo
+        if backend == BACKEND_SQLITE:
+            from database.sqlite_backend import open_sqlite_database
+            _default_database = open_sqlite_database(sqlite_path, fuzzy_index_factory=fuzzy_index_factory)
+        else:
+            from database.hot_reload import start_auto_reload
+            from database.snapshot import load_or_build_database
+            _default_database = load_or_build_database(fuzzy_index_factory=fuzzy_index_factory)
+            start_auto_reload(_default_database)
     return _default_database
\ No newline at end of file
@@ -0,0 +1,277 @@
+"""
+Snapshot Binario de la Base de Datos de Señas.
+
+Guarda la base de datos ya cargada e indexada en un archivo pickle versionado
+dentro del directorio de caché, asociado a las rutas, fechas de modificación
+y hashes de los CSV de origen. Mientras los CSV no cambien, el arranque
+carga el snapshot en lugar de volver a procesar los archivos.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from database.fuzzy_index import DEFAULT_FUZZY_INDEX, FuzzyIndex
+from database.signs_database import SignsDatabase, get_default_csv_files
+
+# Incrementar al cambiar el formato del archivo de snapshot
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = "signs_database.snapshot"
+
+# Módulos cuyas clases se serializan en el snapshot
+SNAPSHOT_SOURCE_MODULES = [
+    "signs_database.py",
+    "fuzzy_index.py",
+    "language_index.py",
+    "lemma_index.py",
+    "prefix_index.py",
+    "normalization.py",
+    "phrase_index.py",
+    "storage.py",
+    "text_index.py",
+    "vector_scoring.py",
+]
+
+
+def get_snapshot_path() -> Path:
+    """
+    Obtiene la ruta por defecto del snapshot de la base de datos.
+
+    Returns:
+        Path: Ruta del archivo de snapshot en el directorio de caché
+    """
+    from utils.file_utils import get_cache_directory
+
+    return get_cache_directory() / SNAPSHOT_FILENAME
+
+
+def _hash_file(file_path: str) -> str:
+    """Calcula el hash SHA-256 del contenido de un archivo."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _code_fingerprint() -> str:
+    """
+    Calcula una huella del código de las clases serializadas.
+
+    Un snapshot generado con otra versión del código se descarta aunque
+    los CSV no hayan cambiado.
+    """
+    digest = hashlib.sha256(str(SNAPSHOT_VERSION).encode("utf-8"))
+    module_dir = Path(__file__).parent
+    for module_name in SNAPSHOT_SOURCE_MODULES:
+        module_path = module_dir / module_name
+        if module_path.exists():
+            digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _describe_factory(fuzzy_index_factory: Optional[Callable[[], FuzzyIndex]]) -> str:
+    """Identifica la fábrica del índice difuso con la que se construyó la base de datos."""
+    factory = fuzzy_index_factory or DEFAULT_FUZZY_INDEX
+    return f"{factory.__module__}.{factory.__qualname__}"
+
+
+def describe_source(csv_path: str, known: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Describe un CSV de origen por ruta, fecha de modificación, tamaño y hash.
+
+    Si ``known`` tiene la misma fecha de modificación y tamaño se reutiliza
+    su hash para no volver a leer el archivo.
+
+    Args:
+        csv_path: Ruta del archivo CSV
+        known: Descripción previa del mismo archivo (opcional)
+
+    Returns:
+        Diccionario con la descripción del archivo
+    """
+    path = os.path.abspath(csv_path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {"path": path, "exists": False}
+
+    description = {
+        "path": path,
+        "exists": True,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+    if (known and known.get("exists") and known.get("mtime_ns") == stat.st_mtime_ns
+            and known.get("size") == stat.st_size):
+        description["sha256"] = known["sha256"]
+    else:
+        description["sha256"] = _hash_file(path)
+
+    return description
+
+
+def describe_sources(csv_files: Dict[str, str],
+                     known: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Describe todos los CSV de origen de una base de datos.
+
+    Args:
+        csv_files: Diccionario con idioma como clave y ruta del CSV como valor
+        known: Descripciones previas por idioma (opcional)
+
+    Returns:
+        Diccionario con idioma como clave y descripción del archivo como valor
+    """
+    known = known or {}
+    return {
+        language: describe_source(csv_path, known.get(language))
+        for language, csv_path in csv_files.items()
+    }
+
+
+def _sources_match(stored: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]) -> bool:
+    """Compara las descripciones de origen ignorando la fecha de modificación."""
+    if stored.keys() != current.keys():
+        return False
+    for language, description in current.items():
+        previous = stored[language]
+        if (previous.get("path"), previous.get("exists"), previous.get("sha256")) != (
+                description.get("path"), description.get("exists"), description.get("sha256")):
+            return False
+    return True
+
+
+def save_snapshot(database: SignsDatabase, snapshot_path: Optional[Path] = None,
+                  sources: Optional[Dict[str, Dict[str, Any]]] = None) -> Path:
+    """
+    Guarda la base de datos en un snapshot de forma atómica.
+
+    Args:
+        database: Base de datos cargada a guardar
+        snapshot_path: Ruta del snapshot (por defecto en el directorio de caché)
+        sources: Descripción de los CSV de origen (se calcula si es None)
+
+    Returns:
+        Path: Ruta del snapshot guardado
+
+    Raises:
+        OSError: Si no se puede escribir el snapshot
+    """
+    snapshot_path = Path(snapshot_path or get_snapshot_path())
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "code": _code_fingerprint(),
+        "sources": sources or describe_sources(database.csv_files),
+        "fuzzy_index": _describe_factory(database._fuzzy_index_factory),
+        "database": database,
+    }
+
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=str(snapshot_path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return snapshot_path
+
+
+def load_snapshot(csv_files: Dict[str, str],
+                  snapshot_path: Optional[Path] = None,
+                  fuzzy_index_factory: Optional[Callable[[], FuzzyIndex]] = None) -> Optional[SignsDatabase]:
+    """
+    Carga la base de datos desde el snapshot si sigue vigente.
+
+    El snapshot es vigente si fue generado con el mismo formato, código e
+    índice difuso y los CSV de origen tienen el mismo contenido. Si solo
+    cambió la fecha de modificación se actualiza el snapshot para no
+    recalcular el hash.
+
+    Args:
+        csv_files: Diccionario con idioma como clave y ruta del CSV como valor
+        snapshot_path: Ruta del snapshot (por defecto en el directorio de caché)
+        fuzzy_index_factory: Fábrica del índice difuso esperada (None para la de difflib)
+
+    Returns:
+        SignsDatabase cargada o None si el snapshot no existe o está desactualizado
+    """
+    snapshot_path = Path(snapshot_path or get_snapshot_path())
+    if not snapshot_path.exists():
+        return None
+
+    try:
+        with open(snapshot_path, "rb") as file:
+            payload = pickle.load(file)
+    except Exception as e:
+        print(f"⚠️ Snapshot de la base de datos ilegible, se reconstruirá: {e}")
+        return None
+
+    if (not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION
+            or payload.get("code") != _code_fingerprint()
+            or payload.get("fuzzy_index") != _describe_factory(fuzzy_index_factory)):
+        return None
+
+    stored_sources = payload.get("sources", {})
+    current_sources = describe_sources(csv_files, stored_sources)
+    if not _sources_match(stored_sources, current_sources):
+        return None
+
+    database = payload["database"]
+    database.csv_files = dict(csv_files)
+
+    if current_sources != stored_sources:
+        try:
+            save_snapshot(database, snapshot_path, current_sources)
+        except OSError as e:
+            print(f"⚠️ No se pudo actualizar el snapshot: {e}")
+
+    return database
+
+
+def load_or_build_database(csv_files: Optional[Dict[str, str]] = None,
+                           snapshot_path: Optional[Path] = None,
+                           fuzzy_index_factory: Optional[Callable[[], FuzzyIndex]] = None) -> SignsDatabase:
+    """
+    Obtiene la base de datos desde el snapshot o la construye desde los CSV.
+
+    Args:
+        csv_files: Diccionario con idioma como clave y ruta del CSV como valor.
+                  Si es None, usa las rutas por defecto.
+        snapshot_path: Ruta del snapshot (por defecto en el directorio de caché)
+        fuzzy_index_factory: Fábrica del índice difuso (None para la de difflib)
+
+    Returns:
+        Instancia de SignsDatabase cargada
+    """
+    csv_files = csv_files or get_default_csv_files()
+
+    try:
+        database = load_snapshot(csv_files, snapshot_path, fuzzy_index_factory)
+    except OSError as e:
+        print(f"⚠️ Error al leer el snapshot de la base de datos: {e}")
+        database = None
+
+    if database is not None:
+        print(f"✅ Base de datos cargada desde snapshot: {len(database)} señas")
+        return database
+
+    sources = describe_sources(csv_files)
+    database = SignsDatabase(csv_files, fuzzy_index_factory)
+    try:
+        save_snapshot(database, snapshot_path, sources)
+    except (OSError, pickle.PicklingError) as e:
+        print(f"⚠️ No se pudo guardar el snapshot de la base de datos: {e}")
+
+    return database
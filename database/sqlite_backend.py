@@ -0,0 +1,696 @@
+"""
+Backend SQLite para la Base de Datos de Señas.
+
+Guarda el corpus en un único archivo SQLite que varios procesos (por
+ejemplo, varios workers de Streamlit) abren en modo solo lectura y
+comparten a través de la caché de páginas del sistema operativo, en lugar
+de mantener cada uno su propia copia en memoria.
+
+La tabla ``signs`` tiene una columna indexada con la palabra normalizada
+(y otra con su forma plegada sin acentos) y la tabla virtual FTS5
+``signs_fts`` (sin contenido propio, enlazada por ``rowid``) indexa el mismo
+texto que el índice en memoria: palabra, instrucciones y categoría. La tabla
+FTS5 ``signs_keys`` (tokenizador ``trigram``, enlazada a ``signs``) indexa
+las palabras normalizadas para la búsqueda por subcadena. El importador
+carga los ``señas_*.csv``.
+
+Uso:
+    python -m database.sqlite_backend [ruta_del_archivo.sqlite3]
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from database.fuzzy_index import DEFAULT_FUZZY_INDEX, FuzzyIndex
+from database.language_index import LanguageIndex
+from database.lemma_index import LemmaIndex, QueryRewrite
+from database.normalization import fold_key, tokenize
+from database.phrase_index import PhraseIndex
+from database.signs_database import SignEntry, SignsDatabase, get_default_csv_files
+from database.storage import SignLookupTable, SignsBackend
+
+T = TypeVar("T")
+
+SQLITE_FILENAME = "signs.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS languages (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS signs (
+    id INTEGER PRIMARY KEY,
+    language TEXT NOT NULL,
+    word_key TEXT NOT NULL,
+    folded_key TEXT NOT NULL,
+    variant TEXT,
+    word TEXT NOT NULL,
+    instructions TEXT NOT NULL,
+    category TEXT NOT NULL,
+    UNIQUE (language, word_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_signs_folded ON signs (language, folded_key);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS signs_fts USING fts5(
+    text,
+    content='',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Índice de trigramas de las palabras (requiere SQLite 3.34 o posterior)
+TRIGRAM_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS signs_keys USING fts5(
+    word_key,
+    content='signs',
+    content_rowid='id',
+    tokenize='trigram'
+);
+"""
+
+# Longitud mínima de una subcadena para consultar el índice de trigramas
+TRIGRAM_MIN_LENGTH = 3
+
+# Columnas con las que se construye cada SignEntry
+ENTRY_COLUMNS = "word, instructions, category, language"
+
+# Parámetros por consulta en las búsquedas en bloque (límite de SQLite: 32766)
+BATCH_SIZE = 500
+
+
+def get_default_sqlite_path() -> Path:
+    """
+    Obtiene la ruta por defecto del archivo SQLite.
+
+    Returns:
+        Path: Ruta del archivo en el directorio de datos del proyecto
+    """
+    from utils.file_utils import get_data_directory
+
+    return get_data_directory() / SQLITE_FILENAME
+
+
+def import_csv_files(sqlite_path: Optional[str] = None,
+                     csv_files: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+    """
+    Importa los CSV de señas a un archivo SQLite.
+
+    Todos los idiomas se reemplazan en una sola transacción, de modo que
+    los procesos que leen el archivo ven el corpus anterior o el nuevo
+    completo. Los idiomas que ya no están configurados se eliminan.
+
+    Args:
+        sqlite_path: Ruta del archivo SQLite (por defecto en el directorio de datos)
+        csv_files: Diccionario con idioma como clave y ruta del CSV como valor.
+                  Si es None, usa las rutas por defecto.
+
+    Returns:
+        Diccionario con el número de señas importadas por idioma
+
+    Raises:
+        sqlite3.Error: Si no se puede escribir el archivo
+        Exception: Si hay errores al leer algún CSV
+    """
+    sqlite_path = Path(sqlite_path or get_default_sqlite_path())
+    csv_files = csv_files or get_default_csv_files()
+    sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Leer todos los CSV antes de tocar el archivo
+    signs_by_language = {
+        language: SignsDatabase.read_signs_file(csv_path, language)
+        for language, csv_path in csv_files.items()
+    }
+
+    connection = sqlite3.connect(str(sqlite_path))
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        try:
+            connection.executescript(TRIGRAM_SCHEMA)
+            has_trigram_index = True
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ SQLite sin tokenizador trigram; la búsqueda por subcadena será lineal: {e}")
+            has_trigram_index = False
+
+        with connection:
+            connection.execute("DELETE FROM languages")
+            connection.execute("DELETE FROM signs")
+            connection.execute("INSERT INTO signs_fts (signs_fts) VALUES ('delete-all')")
+
+            for position, (language, signs) in enumerate(signs_by_language.items()):
+                connection.execute("INSERT INTO languages (name, position) VALUES (?, ?)",
+                                   (language, position))
+                for word_key, sign_entry in signs.items():
+                    folded_base, variant = fold_key(word_key)
+                    cursor = connection.execute(
+                        "INSERT INTO signs (language, word_key, folded_key, variant, word, instructions, category) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (language, word_key, folded_base, variant, sign_entry.word,
+                         sign_entry.instructions, sign_entry.category)
+                    )
+                    connection.execute("INSERT INTO signs_fts (rowid, text) VALUES (?, ?)",
+                                       (cursor.lastrowid, LanguageIndex.get_searchable_text(sign_entry)))
+
+            if has_trigram_index:
+                connection.execute("INSERT INTO signs_keys (signs_keys) VALUES ('rebuild')")
+
+            # Generación del corpus: los lectores descartan sus cachés al cambiar
+            connection.execute(
+                "INSERT INTO metadata (key, value) VALUES ('generation', 1) "
+                "ON CONFLICT (key) DO UPDATE SET value = value + 1"
+            )
+    finally:
+        connection.close()
+
+    return {language: len(signs) for language, signs in signs_by_language.items()}
+
+
+def _build_fts_query(keywords: List[str], match_all: bool) -> Optional[str]:
+    """
+    Construye la consulta FTS5 equivalente a la del índice en memoria.
+
+    Cada término de una palabra clave se busca como prefijo y todos los
+    términos de una misma palabra clave deben aparecer.
+
+    Args:
+        keywords: Palabras clave normalizadas
+        match_all: True para exigir todas las palabras clave (AND)
+
+    Returns:
+        Consulta FTS5 o None si ninguna entrada puede coincidir
+    """
+    clauses = []
+    for keyword in keywords:
+        terms = tokenize(keyword)
+        if not terms:
+            if match_all:
+                return None
+            continue
+        clauses.append("(" + " AND ".join(f'"{term}"*' for term in terms) + ")")
+
+    if not clauses:
+        return None
+
+    return (" AND " if match_all else " OR ").join(clauses)
+
+
+class SQLiteSignsDatabase(SignsBackend):
+    """
+    Backend de señas sobre un archivo SQLite compartido.
+
+    Cada hilo abre su propia conexión de solo lectura. Para la búsqueda
+    difusa se mantienen en memoria únicamente las claves de cada idioma,
+    que se descartan cuando el importador publica una nueva generación.
+    """
+
+    def __init__(self, sqlite_path: Optional[str] = None,
+                 fuzzy_index_factory: Optional[Callable[[], FuzzyIndex]] = None) -> None:
+        """
+        Inicializa el backend sobre un archivo SQLite ya importado.
+
+        Args:
+            sqlite_path: Ruta del archivo SQLite (por defecto en el directorio de datos)
+            fuzzy_index_factory: Fábrica del índice de búsqueda difusa por idioma
+
+        Raises:
+            FileNotFoundError: Si el archivo SQLite no existe
+        """
+        self.sqlite_path = Path(sqlite_path or get_default_sqlite_path()).resolve()
+        if not self.sqlite_path.exists():
+            raise FileNotFoundError(f"Base de datos SQLite no encontrada: {self.sqlite_path}")
+
+        self._fuzzy_index_factory = fuzzy_index_factory or DEFAULT_FUZZY_INDEX
+        self._local = threading.local()
+        self._cache_lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self._languages: List[str] = []
+        self._has_trigram_index = False
+        self._fuzzy_indexes: Dict[str, FuzzyIndex] = {}
+        self._phrase_indexes: Dict[str, PhraseIndex] = {}
+        self._lemma_indexes: Dict[str, LemmaIndex] = {}
+
+    def _connection(self) -> sqlite3.Connection:
+        """Obtiene la conexión de solo lectura del hilo actual."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(f"{self.sqlite_path.as_uri()}?mode=ro", uri=True)
+            self._local.connection = connection
+        return connection
+
+    def _query(self, sql: str, parameters: Tuple = ()) -> List[Tuple]:
+        """Ejecuta una consulta y retorna todas sus filas."""
+        return self._connection().execute(sql, parameters).fetchall()
+
+    def _refresh(self) -> None:
+        """Descarta las cachés en memoria si el archivo fue reimportado."""
+        rows = self._query("SELECT value FROM metadata WHERE key = 'generation'")
+        generation = rows[0][0] if rows else 0
+        if generation == self._generation:
+            return
+
+        with self._cache_lock:
+            if generation != self._generation:
+                self._languages = [row[0] for row in self._query(
+                    "SELECT name FROM languages ORDER BY position")]
+                self._has_trigram_index = bool(self._query(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'signs_keys'"))
+                self._fuzzy_indexes = {}
+                self._phrase_indexes = {}
+                self._lemma_indexes = {}
+                self._generation = generation
+
+    def _get_keys(self, language: str) -> List[str]:
+        """Obtiene las claves de un idioma en orden de importación."""
+        return [row[0] for row in self._query(
+            "SELECT word_key FROM signs WHERE language = ? ORDER BY id", (language,))]
+
+    def _get_index(self, indexes: Dict[str, T], language: str, build: Callable[[List[str]], T]) -> T:
+        """
+        Obtiene (construyéndolo una sola vez bajo el candado) un índice por idioma.
+
+        Args:
+            indexes: Diccionario de índices de la generación actual
+            language: Idioma del índice
+            build: Construye el índice a partir de las claves del idioma
+
+        Returns:
+            Índice del idioma
+        """
+        index = indexes.get(language)
+        if index is None:
+            with self._cache_lock:
+                index = indexes.get(language)
+                if index is None:
+                    index = build(self._get_keys(language))
+                    indexes[language] = index
+        return index
+
+    def _get_fuzzy_index(self, language: str) -> FuzzyIndex:
+        """Obtiene (construyéndolo si hace falta) el índice difuso de un idioma."""
+        def build(keys: List[str]) -> FuzzyIndex:
+            fuzzy_index = self._fuzzy_index_factory()
+            fuzzy_index.build(keys)
+            fuzzy_index.prepare()
+            return fuzzy_index
+
+        return self._get_index(self._fuzzy_indexes, language, build)
+
+    def _get_phrase_index(self, language: str) -> PhraseIndex:
+        """Obtiene (construyéndolo si hace falta) el índice de frases de un idioma."""
+        def build(keys: List[str]) -> PhraseIndex:
+            phrase_index = PhraseIndex()
+            phrase_index.build(keys)
+            return phrase_index
+
+        return self._get_index(self._phrase_indexes, language, build)
+
+    def _get_lemma_index(self, language: str) -> LemmaIndex:
+        """Obtiene (construyéndolo si hace falta) el índice de lemas de un idioma."""
+        def build(keys: List[str]) -> LemmaIndex:
+            lemma_index = LemmaIndex()
+            lemma_index.build(keys)
+            return lemma_index
+
+        return self._get_index(self._lemma_indexes, language, build)
+
+    @staticmethod
+    def _to_entries(rows: List[Tuple]) -> List[SignEntry]:
+        """Convierte filas (palabra, instrucciones, categoría, idioma) en entradas."""
+        return [
+            SignEntry(word=word, instructions=instructions, category=category, language=language)
+            for word, instructions, category, language, *_ in rows
+        ]
+
+    def get_languages(self) -> List[str]:
+        """Obtiene los idiomas importados en el orden de configuración."""
+        self._refresh()
+        return list(self._languages)
+
+    def search_exact(self, word: str, language: str = "ecuatoriano") -> Optional[SignEntry]:
+        """Busca una seña exacta por la columna indexada de palabra normalizada."""
+        if not word or not word.strip():
+            return None
+
+        search_key = word.lower().strip()
+        rows = self._query(
+            f"SELECT {ENTRY_COLUMNS} FROM signs WHERE language = ? AND word_key = ?",
+            (language, search_key)
+        )
+        if rows:
+            return self._to_entries(rows)[0]
+
+        # Respaldo insensible a acentos, prefiriendo la variante pedida
+        folded_base, variant = fold_key(search_key)
+        rows = self._query(
+            f"SELECT {ENTRY_COLUMNS}, variant FROM signs WHERE language = ? AND folded_key = ? ORDER BY id",
+            (language, folded_base)
+        )
+        if not rows:
+            return None
+
+        if variant:
+            for row in rows:
+                if row[-1] == variant:
+                    return self._to_entries([row])[0]
+
+        return self._to_entries(rows[:1])[0]
+
+    def search_variants(self, word: str, language: str = "ecuatoriano") -> List[SignEntry]:
+        """Busca la seña y sus variantes regionales con una sola consulta por palabra base."""
+        if not word or not word.strip():
+            return []
+
+        search_key = word.lower().strip()
+        folded_base, variant = fold_key(search_key)
+        rows = self._query(
+            f"SELECT {ENTRY_COLUMNS}, word_key, variant FROM signs "
+            "WHERE language = ? AND (word_key = ? OR folded_key = ?) ORDER BY id",
+            (language, search_key, folded_base)
+        )
+        if not rows:
+            return []
+
+        # Misma prioridad que search_exact: clave exacta, variante pedida y primera cargada
+        exact_row = next((row for row in rows if row[-2] == search_key), None)
+        if exact_row is None and variant:
+            exact_row = next((row for row in rows if row[-1] == variant), None)
+        if exact_row is None:
+            exact_row = rows[0]
+        if variant:
+            return self._to_entries([exact_row])
+
+        variant_rows = [row for row in rows if row[-1] and row is not exact_row]
+        return self._to_entries([exact_row] + variant_rows)
+
+    def _fetch_by_column(self, column: str, language: str, values: List[str]) -> List[Tuple]:
+        """Obtiene las filas del idioma cuya columna está en ``values`` (en bloques)."""
+        rows: List[Tuple] = []
+        for start in range(0, len(values), BATCH_SIZE):
+            batch = values[start:start + BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            rows.extend(self._query(
+                f"SELECT {ENTRY_COLUMNS}, {column}, variant FROM signs "
+                f"WHERE language = ? AND {column} IN ({placeholders}) ORDER BY id",
+                (language, *batch)
+            ))
+        return rows
+
+    def search_many(self, words: Sequence[str],
+                    languages: Optional[Sequence[str]] = None) -> SignLookupTable:
+        """
+        Busca exactamente varias palabras en varios idiomas a la vez.
+
+        Por idioma se resuelven todas las claves con una consulta ``IN`` sobre
+        la columna indexada y las que faltan con otra sobre la forma plegada.
+
+        Args:
+            words: Palabras a buscar
+            languages: Idiomas en los que buscar (por defecto, todos)
+
+        Returns:
+            Tabla densa palabra × idioma; cada celda equivale a ``search_exact``
+        """
+        words = list(words)
+        languages = list(languages) if languages is not None else self.get_languages()
+        keys = [word.lower().strip() if word else "" for word in words]
+        unique_keys = list(dict.fromkeys(key for key in keys if key))
+        folded = {key: fold_key(key) for key in unique_keys}
+        rows: List[List[Optional[SignEntry]]] = [[None] * len(languages) for _ in words]
+
+        for column, language in enumerate(languages):
+            exact = {row[4]: self._to_entries([row])[0]
+                     for row in self._fetch_by_column("word_key", language, unique_keys)}
+
+            missing = [key for key in unique_keys if key not in exact]
+            candidates: Dict[str, List[Tuple]] = {}
+            if missing:
+                folded_bases = list(dict.fromkeys(folded[key][0] for key in missing))
+                for row in self._fetch_by_column("folded_key", language, folded_bases):
+                    candidates.setdefault(row[4], []).append(row)
+
+            resolved: Dict[str, Optional[SignEntry]] = dict(exact)
+            for key in missing:
+                folded_base, variant = folded[key]
+                options = candidates.get(folded_base)
+                if not options:
+                    resolved[key] = None
+                    continue
+                chosen = next((row for row in options if variant and row[5] == variant), options[0])
+                resolved[key] = self._to_entries([chosen])[0]
+
+            for row_index, key in enumerate(keys):
+                if key:
+                    rows[row_index][column] = resolved[key]
+
+        return SignLookupTable(words=words, languages=languages, rows=rows)
+
+    def search_fuzzy(self, word: str, max_results: int = 5, min_similarity: float = 0.3,
+                     language: str = "ecuatoriano") -> List[Tuple[SignEntry, float]]:
+        """Busca señas similares sobre las claves del idioma cacheadas en memoria."""
+        if not word or not word.strip() or max_results <= 0:
+            return []
+
+        if language not in self.get_languages():
+            return []
+
+        matches = self._get_fuzzy_index(language).top_matches(word.lower().strip(), max_results, min_similarity)
+        if not matches:
+            return []
+
+        keys = [key for key, _ in matches]
+        placeholders = ", ".join("?" for _ in keys)
+        rows = self._query(
+            f"SELECT {ENTRY_COLUMNS}, word_key FROM signs WHERE language = ? AND word_key IN ({placeholders})",
+            (language, *keys)
+        )
+        entries = {row[-1]: entry for row, entry in zip(rows, self._to_entries(rows))}
+        return [(entries[key], similarity) for key, similarity in matches if key in entries]
+
+    def segment_phrase(self, text: str,
+                       language: str = "ecuatoriano") -> List[Tuple[str, Optional[SignEntry]]]:
+        """Divide una frase en glosas con el índice de frases cacheado en memoria."""
+        if not text or not text.strip() or language not in self.get_languages():
+            return []
+
+        segments = self._get_phrase_index(language).segment(text)
+        keys = list(dict.fromkeys(key for _, key in segments if key is not None))
+        if not keys:
+            return [(segment, None) for segment, _ in segments]
+
+        placeholders = ", ".join("?" for _ in keys)
+        rows = self._query(
+            f"SELECT {ENTRY_COLUMNS}, word_key FROM signs WHERE language = ? AND word_key IN ({placeholders})",
+            (language, *keys)
+        )
+        entries = {row[-1]: entry for row, entry in zip(rows, self._to_entries(rows))}
+        return [(segment, entries.get(key) if key is not None else None) for segment, key in segments]
+
+    def search_rewritten(self, word: str,
+                         language: str = "ecuatoriano") -> Optional[Tuple[SignEntry, QueryRewrite]]:
+        """Reescribe la consulta con el índice de lemas cacheado en memoria."""
+        if not word or not word.strip() or language not in self.get_languages():
+            return None
+
+        rewrite = self._get_lemma_index(language).lookup(word)
+        if rewrite is None:
+            return None
+
+        rows = self._query(
+            f"SELECT {ENTRY_COLUMNS} FROM signs WHERE language = ? AND word_key = ?",
+            (language, rewrite.target)
+        )
+        if not rows:
+            return None
+        return self._to_entries(rows)[0], rewrite
+
+    def search_partial(self, partial_word: str, max_results: int = 10,
+                       language: str = "ecuatoriano") -> List[SignEntry]:
+        """
+        Busca señas cuya palabra normalizada contiene la subcadena.
+
+        Con tres o más caracteres los candidatos salen del índice de
+        trigramas ``signs_keys``; las subcadenas más cortas (o un archivo
+        importado sin ese índice) recorren las palabras del idioma.
+        """
+        if not partial_word or not partial_word.strip() or max_results <= 0:
+            return []
+
+        self._refresh()
+        partial_word = partial_word.lower().strip()
+        if self._has_trigram_index and len(partial_word) >= TRIGRAM_MIN_LENGTH:
+            phrase = '"' + partial_word.replace('"', '""') + '"'
+            rows = self._query(
+                f"SELECT {ENTRY_COLUMNS} FROM signs WHERE id IN "
+                "(SELECT rowid FROM signs_keys WHERE signs_keys MATCH ?) "
+                "AND language = ? AND instr(word_key, ?) > 0 ORDER BY id LIMIT ?",
+                (phrase, language, partial_word, max_results)
+            )
+        else:
+            rows = self._query(
+                f"SELECT {ENTRY_COLUMNS} FROM signs WHERE language = ? AND instr(word_key, ?) > 0 "
+                "ORDER BY id LIMIT ?",
+                (language, partial_word, max_results)
+            )
+        return self._to_entries(rows)
+
+    def autocomplete(self, prefix: str, language: str = "ecuatoriano", k: int = 10) -> List[SignEntry]:
+        """Sugiere señas con un recorrido por rango del índice de palabras."""
+        if not prefix or not prefix.strip() or k <= 0:
+            return []
+
+        prefix = prefix.lower().lstrip()
+        rows = self._query(
+            f"SELECT {ENTRY_COLUMNS} FROM signs WHERE language = ? AND word_key >= ? AND word_key < ? "
+            "ORDER BY word_key LIMIT ?",
+            (language, prefix, prefix + "\U0010ffff", k)
+        )
+        return self._to_entries(rows)
+
+    def search_by_category(self, category: str, language: str = "ecuatoriano",
+                           max_results: int = 20) -> List[SignEntry]:
+        """Busca señas de las categorías que contienen el texto dado."""
+        if not category or not category.strip():
+            return []
+
+        category = category.lower().strip()
+        matches: List[SignEntry] = []
+
+        for category_name in self.get_all_categories(language):
+            if category not in category_name.lower():
+                continue
+            rows = self._query(
+                f"SELECT {ENTRY_COLUMNS} FROM signs WHERE language = ? AND category = ? ORDER BY id LIMIT ?",
+                (language, category_name, max_results - len(matches))
+            )
+            matches.extend(self._to_entries(rows))
+            if len(matches) >= max_results:
+                break
+
+        return matches
+
+    def get_all_categories(self, language: str = "ecuatoriano") -> List[str]:
+        """Obtiene las categorías no vacías del idioma ordenadas alfabéticamente."""
+        rows = self._query(
+            "SELECT DISTINCT category FROM signs WHERE language = ? AND category != ''",
+            (language,)
+        )
+        return sorted(row[0] for row in rows)
+
+    def get_random_signs(self, count: int = 5, language: str = "ecuatoriano") -> List[SignEntry]:
+        """Obtiene señas aleatorias del idioma."""
+        if count <= 0:
+            return []
+
+        rows = self._query(
+            f"SELECT {ENTRY_COLUMNS} FROM signs WHERE language = ? ORDER BY random() LIMIT ?",
+            (language, count)
+        )
+        return self._to_entries(rows)
+
+    def get_signs_by_keywords(self, keywords: List[str], language: str = "ecuatoriano",
+                              max_results: int = 15, match_all: bool = False) -> List[SignEntry]:
+        """Busca señas por palabras clave con FTS5, ordenadas por BM25."""
+        if not keywords or max_results <= 0:
+            return []
+
+        keywords = [kw.lower().strip() for kw in keywords if kw.strip()]
+        fts_query = _build_fts_query(keywords, match_all)
+        if fts_query is None:
+            return []
+
+        rows = self._query(
+            "SELECT s.word, s.instructions, s.category, s.language FROM signs_fts "
+            "JOIN signs AS s ON s.id = signs_fts.rowid "
+            "WHERE signs_fts MATCH ? AND s.language = ? "
+            "ORDER BY bm25(signs_fts), s.word_key LIMIT ?",
+            (fts_query, language, max_results)
+        )
+        return self._to_entries(rows)
+
+    def get_database_stats(self) -> Dict[str, Dict[str, int]]:
+        """Obtiene el número de señas y categorías por idioma."""
+        rows = self._query(
+            "SELECT l.name, COUNT(s.id), COUNT(DISTINCT NULLIF(s.category, '')) "
+            "FROM languages AS l LEFT JOIN signs AS s ON s.language = l.name "
+            "GROUP BY l.name ORDER BY l.position"
+        )
+        return {
+            language: {"total_signs": total_signs, "total_categories": total_categories}
+            for language, total_signs, total_categories in rows
+        }
+
+    def get_common_words(self) -> List[str]:
+        """Obtiene las claves presentes en todos los idiomas."""
+        rows = self._query(
+            "SELECT word_key FROM signs GROUP BY word_key "
+            "HAVING COUNT(*) = (SELECT COUNT(*) FROM languages)"
+        )
+        return sorted(row[0] for row in rows)
+
+    def get_generation(self) -> int:
+        """Obtiene la generación de importación del archivo SQLite."""
+        self._refresh()
+        return self._generation
+
+    def close(self) -> None:
+        """Cierra la conexión del hilo actual."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __len__(self) -> int:
+        """Retorna el número total de señas en todos los idiomas."""
+        return self._query("SELECT COUNT(*) FROM signs")[0][0]
+
+    def __contains__(self, word: str) -> bool:
+        """Verifica si una palabra existe en algún idioma."""
+        rows = self._query("SELECT 1 FROM signs WHERE word_key = ? LIMIT 1", (word.lower().strip(),))
+        return bool(rows)
+
+    def __getitem__(self, word: str) -> Optional[SignEntry]:
+        """Obtiene una seña por palabra (busca en ecuatoriano por defecto)."""
+        return self.search_exact(word, "ecuatoriano")
+
+
+def open_sqlite_database(sqlite_path: Optional[str] = None,
+                         csv_files: Optional[Dict[str, str]] = None,
+                         fuzzy_index_factory: Optional[Callable[[], FuzzyIndex]] = None) -> SQLiteSignsDatabase:
+    """
+    Abre el backend SQLite, importando los CSV si el archivo aún no existe.
+
+    Args:
+        sqlite_path: Ruta del archivo SQLite (por defecto en el directorio de datos)
+        csv_files: CSV a importar si el archivo no existe (por defecto, los del proyecto)
+        fuzzy_index_factory: Fábrica del índice de búsqueda difusa por idioma
+
+    Returns:
+        Instancia de SQLiteSignsDatabase
+    """
+    sqlite_path = Path(sqlite_path or get_default_sqlite_path())
+    if not sqlite_path.exists():
+        print(f"📊 Importando señas a {sqlite_path}...")
+        counts = import_csv_files(str(sqlite_path), csv_files)
+        print(f"✅ Total: {sum(counts.values())} señas importadas de {len(counts)} idiomas")
+
+    return SQLiteSignsDatabase(str(sqlite_path), fuzzy_index_factory)
+
+
+if __name__ == "__main__":
+    target_path = sys.argv[1] if len(sys.argv) > 1 else None
+    imported = import_csv_files(target_path)
+    for imported_language, imported_count in imported.items():
+        print(f"✅ {imported_language.capitalize()}: {imported_count} señas importadas")
@@ -0,0 +1,346 @@
+"""
+Interfaz de Backends de Almacenamiento de Señas.
+
+Define las operaciones de consulta que el resto de la aplicación usa sobre
+la base de datos de señas. ``SignsDatabase`` (CSV cargado en memoria) y
+``SQLiteSignsDatabase`` (archivo SQLite compartido entre procesos) son las
+implementaciones disponibles.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from database.lemma_index import QueryRewrite
+    from database.signs_database import SignEntry
+
+# Backends disponibles para DatabaseConfig.backend
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+AVAILABLE_BACKENDS = (BACKEND_MEMORY, BACKEND_SQLITE)
+
+
+@dataclass
+class SignLookupTable:
+    """
+    Tabla densa palabra × idioma con el resultado de ``search_many``.
+
+    Attributes:
+        words: Palabras consultadas, en el orden recibido
+        languages: Idiomas consultados, en el orden recibido
+        rows: Una fila por palabra con una celda por idioma (None si no hay seña)
+    """
+    words: List[str]
+    languages: List[str]
+    rows: List[List[Optional["SignEntry"]]]
+    _positions: Optional[Tuple[Dict[str, int], Dict[str, int]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def get(self, word: str, language: str) -> Optional["SignEntry"]:
+        """
+        Obtiene la celda de una palabra e idioma.
+
+        Args:
+            word: Palabra tal como se pasó a ``search_many``
+            language: Idioma consultado
+
+        Returns:
+            SignEntry encontrada o None
+        """
+        if self._positions is None:
+            # Primera aparición de cada palabra e idioma, como list.index
+            self._positions = (
+                {w: index for index, w in reversed(list(enumerate(self.words)))},
+                {l: index for index, l in reversed(list(enumerate(self.languages)))},
+            )
+        word_positions, language_positions = self._positions
+        if word not in word_positions or language not in language_positions:
+            return None
+        return self.rows[word_positions[word]][language_positions[language]]
+
+    def row_dict(self, index: int) -> Dict[str, Optional["SignEntry"]]:
+        """
+        Obtiene una fila como diccionario {idioma: SignEntry o None}.
+
+        Args:
+            index: Posición de la palabra en ``words``
+
+        Returns:
+            Diccionario por idioma
+        """
+        return dict(zip(self.languages, self.rows[index]))
+
+    def iter_hits(self) -> Iterator[Tuple[str, str, "SignEntry"]]:
+        """
+        Recorre las celdas con seña encontrada.
+
+        Returns:
+            Iterador de tuplas (palabra, idioma, SignEntry) por filas
+        """
+        for word, row in zip(self.words, self.rows):
+            for language, sign_entry in zip(self.languages, row):
+                if sign_entry is not None:
+                    yield word, language, sign_entry
+
+    def found_count(self) -> int:
+        """Retorna el número de celdas con seña encontrada."""
+        return sum(1 for row in self.rows for sign_entry in row if sign_entry is not None)
+
+
+class SignsBackend(ABC):
+    """
+    Interfaz común de los backends de la base de datos de señas.
+
+    Las claves de las señas son la palabra en minúsculas y sin espacios en
+    los extremos; todas las búsquedas reciben el idioma como parámetro.
+    """
+
+    @abstractmethod
+    def get_languages(self) -> List[str]:
+        """
+        Obtiene los idiomas disponibles en el orden de configuración.
+
+        Returns:
+            Lista de idiomas
+        """
+
+    @abstractmethod
+    def search_exact(self, word: str, language: str = "ecuatoriano") -> Optional["SignEntry"]:
+        """
+        Busca una seña exacta (con respaldo insensible a acentos).
+
+        Args:
+            word: Palabra a buscar
+            language: Idioma en el que buscar
+
+        Returns:
+            SignEntry si se encuentra, None si no existe
+        """
+
+    @abstractmethod
+    def search_fuzzy(self, word: str, max_results: int = 5, min_similarity: float = 0.3,
+                     language: str = "ecuatoriano") -> List[Tuple["SignEntry", float]]:
+        """
+        Busca señas similares usando coincidencia difusa.
+
+        Args:
+            word: Palabra a buscar
+            max_results: Número máximo de resultados
+            min_similarity: Umbral mínimo de similitud (0.0 - 1.0)
+            language: Idioma en el que buscar
+
+        Returns:
+            Lista de tuplas (SignEntry, similitud) ordenada por similitud
+        """
+
+    @abstractmethod
+    def segment_phrase(self, text: str,
+                       language: str = "ecuatoriano") -> List[Tuple[str, Optional["SignEntry"]]]:
+        """
+        Divide una frase en la secuencia de glosas conocidas más largas.
+
+        Args:
+            text: Frase a segmentar (por ejemplo, una transcripción de voz)
+            language: Idioma en el que buscar
+
+        Returns:
+            Lista ordenada de tuplas (términos plegados del segmento, SignEntry o
+            None si los términos no forman ninguna glosa)
+        """
+
+    @abstractmethod
+    def search_variants(self, word: str, language: str = "ecuatoriano") -> List["SignEntry"]:
+        """
+        Busca una seña exacta junto con sus variantes regionales.
+
+        Args:
+            word: Palabra a buscar ("mayo" retorna "Mayo (Costa)" y "Mayo (Sierra)")
+            language: Idioma en el que buscar
+
+        Returns:
+            Lista cuyo primer elemento equivale a ``search_exact`` seguido de las
+            demás variantes regionales en orden de carga (vacía si no existe; solo
+            la variante pedida si la consulta indica una)
+        """
+
+    @abstractmethod
+    def search_rewritten(self, word: str,
+                         language: str = "ecuatoriano") -> Optional[Tuple["SignEntry", "QueryRewrite"]]:
+        """
+        Busca una seña reescribiendo la consulta por lema o sinónimo.
+
+        Se usa cuando ``search_exact`` no encuentra la palabra
+        ("necesitando" -> "necesitar", "papá" -> "padre").
+
+        Args:
+            word: Palabra a buscar
+            language: Idioma en el que buscar
+
+        Returns:
+            Tupla (SignEntry, reescritura aplicada) o None si no hay reescritura
+        """
+
+    @abstractmethod
+    def search_partial(self, partial_word: str, max_results: int = 10,
+                       language: str = "ecuatoriano") -> List["SignEntry"]:
+        """
+        Busca señas cuya palabra contiene una subcadena.
+
+        Args:
+            partial_word: Parte de la palabra a buscar
+            max_results: Número máximo de resultados
+            language: Idioma en el que buscar
+
+        Returns:
+            Lista de SignEntry en orden de carga
+        """
+
+    @abstractmethod
+    def autocomplete(self, prefix: str, language: str = "ecuatoriano", k: int = 10) -> List["SignEntry"]:
+        """
+        Sugiere señas cuya palabra comienza con un prefijo.
+
+        Args:
+            prefix: Prefijo escrito por el usuario
+            language: Idioma en el que buscar
+            k: Número máximo de sugerencias
+
+        Returns:
+            Lista de SignEntry en orden alfabético
+        """
+
+    @abstractmethod
+    def search_by_category(self, category: str, language: str = "ecuatoriano",
+                           max_results: int = 20) -> List["SignEntry"]:
+        """
+        Busca señas cuya categoría contiene el texto dado.
+
+        Args:
+            category: Categoría a buscar
+            language: Idioma en el que buscar
+            max_results: Número máximo de resultados
+
+        Returns:
+            Lista de SignEntry de la categoría
+        """
+
+    @abstractmethod
+    def get_all_categories(self, language: str = "ecuatoriano") -> List[str]:
+        """
+        Obtiene las categorías de un idioma ordenadas alfabéticamente.
+
+        Args:
+            language: Idioma del que obtener las categorías
+
+        Returns:
+            Lista de categorías
+        """
+
+    @abstractmethod
+    def get_random_signs(self, count: int = 5, language: str = "ecuatoriano") -> List["SignEntry"]:
+        """
+        Obtiene señas aleatorias.
+
+        Args:
+            count: Número de señas a obtener
+            language: Idioma del que obtener las señas
+
+        Returns:
+            Lista de SignEntry aleatorias
+        """
+
+    @abstractmethod
+    def get_signs_by_keywords(self, keywords: List[str], language: str = "ecuatoriano",
+                              max_results: int = 15, match_all: bool = False) -> List["SignEntry"]:
+        """
+        Busca señas por palabras clave en la palabra, instrucciones y categoría.
+
+        Args:
+            keywords: Palabras clave a buscar
+            language: Idioma en el que buscar
+            max_results: Número máximo de resultados
+            match_all: True para exigir todas las palabras clave (AND)
+
+        Returns:
+            Lista de SignEntry ordenada por relevancia
+        """
+
+    @abstractmethod
+    def get_database_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Obtiene el número de señas y categorías por idioma.
+
+        Returns:
+            Diccionario {idioma: {"total_signs": n, "total_categories": m}}
+        """
+
+    @abstractmethod
+    def get_common_words(self) -> List[str]:
+        """
+        Obtiene las palabras presentes en todos los idiomas.
+
+        Returns:
+            Lista ordenada de claves comunes
+        """
+
+    @abstractmethod
+    def get_generation(self) -> int:
+        """
+        Obtiene la generación de los datos.
+
+        Cambia cada vez que se recarga o edita la base de datos, de modo que
+        las cachés construidas sobre ella puedan detectar que quedaron obsoletas.
+
+        Returns:
+            Número de generación actual
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Retorna el número total de señas en todos los idiomas."""
+
+    def search_many(self, words: Sequence[str],
+                    languages: Optional[Sequence[str]] = None) -> SignLookupTable:
+        """
+        Busca exactamente varias palabras en varios idiomas a la vez.
+
+        Cada celda equivale a ``search_exact(palabra, idioma)``. Esta versión
+        genérica recorre las celdas una a una; los backends la reemplazan por
+        una resolución en bloque.
+
+        Args:
+            words: Palabras a buscar
+            languages: Idiomas en los que buscar (por defecto, todos)
+
+        Returns:
+            Tabla densa palabra × idioma
+        """
+        words = list(words)
+        languages = list(languages) if languages is not None else self.get_languages()
+        rows = [[self.search_exact(word, language) for language in languages] for word in words]
+        return SignLookupTable(words=words, languages=languages, rows=rows)
+
+    def search_exact_all_languages(self, word: str) -> Dict[str, Optional["SignEntry"]]:
+        """
+        Busca una seña exacta en todos los idiomas disponibles.
+
+        Args:
+            word: Palabra a buscar
+
+        Returns:
+            Diccionario con idioma como clave y SignEntry como valor (None si no se encuentra)
+        """
+        return self.search_many([word]).row_dict(0)
+
+    def get_all_categories_all_languages(self) -> Dict[str, List[str]]:
+        """
+        Obtiene todas las categorías de todos los idiomas.
+
+        Returns:
+            Diccionario con idioma como clave y lista de categorías como valor
+        """
+        return {language: self.get_all_categories(language) for language in self.get_languages()}
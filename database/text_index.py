@@ -0,0 +1,176 @@
+"""
+Índice Invertido de Texto Completo para Señas.
+
+Indexa los términos de la palabra, las instrucciones y la categoría de cada
+seña en listas de publicación (término -> entradas) construidas al cargar
+la base de datos. Resuelve consultas por palabras clave con semántica AND/OR
+y ordena los resultados con BM25.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import math
+from bisect import bisect_left
+from typing import Dict, List, Set, Tuple
+
+from database.normalization import tokenize
+from database.top_k import top_k
+
+# Parámetros estándar de BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+class InvertedIndex:
+    """
+    Índice invertido con ranking BM25 sobre los textos de un idioma.
+
+    Cada término de una palabra clave se compara como prefijo contra el
+    vocabulario ordenado, de modo que "salud" encuentra "saludo" y "saludos"
+    como hacía la búsqueda por subcadenas original.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el índice vacío."""
+        self._postings: Dict[str, Dict[str, int]] = {}  # {término: {clave: frecuencia}}
+        self._document_terms: Dict[str, Dict[str, int]] = {}  # {clave: {término: frecuencia}}
+        self._document_lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    def add(self, key: str, text: str) -> None:
+        """
+        Agrega (o reemplaza) el texto de una entrada en el índice.
+
+        Args:
+            key: Clave de la seña
+            text: Texto a indexar (palabra, instrucciones y categoría)
+        """
+        if key in self._document_terms:
+            self.remove(key)
+
+        term_counts: Dict[str, int] = {}
+        for term in tokenize(text):
+            term_counts[term] = term_counts.get(term, 0) + 1
+
+        for term, count in term_counts.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = {}
+                self._vocabulary_dirty = True
+            posting[key] = count
+
+        length = sum(term_counts.values())
+        self._document_terms[key] = term_counts
+        self._document_lengths[key] = length
+        self._total_length += length
+
+    def remove(self, key: str) -> None:
+        """
+        Elimina una entrada del índice.
+
+        Args:
+            key: Clave de la seña
+        """
+        term_counts = self._document_terms.pop(key, None)
+        if term_counts is None:
+            return
+
+        for term in term_counts:
+            posting = self._postings[term]
+            del posting[key]
+            if not posting:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+
+        self._total_length -= self._document_lengths.pop(key)
+
+    def prepare(self) -> None:
+        """Ordena el vocabulario si hay términos nuevos o eliminados."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+
+    def _expand_term(self, term: str) -> List[str]:
+        """Obtiene los términos del vocabulario que comienzan con ``term``."""
+        self.prepare()
+
+        expanded = []
+        position = bisect_left(self._vocabulary, term)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(term):
+            expanded.append(self._vocabulary[position])
+            position += 1
+        return expanded
+
+    def _match_keyword(self, keyword: str) -> Tuple[Set[str], List[str]]:
+        """
+        Resuelve una palabra clave (posiblemente de varios términos).
+
+        Returns:
+            Tupla (claves que contienen todos sus términos, términos expandidos)
+        """
+        matched: Set[str] = set()
+        expanded_terms: List[str] = []
+
+        for position, term in enumerate(tokenize(keyword)):
+            term_matches: Set[str] = set()
+            for expanded in self._expand_term(term):
+                term_matches.update(self._postings[expanded])
+                expanded_terms.append(expanded)
+            matched = term_matches if position == 0 else matched & term_matches
+            if not matched:
+                return set(), []
+
+        return matched, expanded_terms
+
+    def search(self, keywords: List[str], match_all: bool = False,
+               limit: int = 15) -> List[Tuple[str, float]]:
+        """
+        Busca entradas por palabras clave y las ordena por BM25.
+
+        Args:
+            keywords: Palabras clave a buscar
+            match_all: True para exigir todas las palabras clave (AND),
+                       False para aceptar cualquiera (OR)
+            limit: Número máximo de resultados
+
+        Returns:
+            Lista de tuplas (clave, puntaje) ordenada por puntaje descendente
+        """
+        if not keywords or limit <= 0 or not self._document_terms:
+            return []
+
+        candidates: Set[str] = set()
+        query_terms: Set[str] = set()
+        for position, keyword in enumerate(keywords):
+            matched, expanded_terms = self._match_keyword(keyword)
+            query_terms.update(expanded_terms)
+            if match_all:
+                candidates = matched if position == 0 else candidates & matched
+                if not candidates:
+                    return []
+            else:
+                candidates |= matched
+
+        document_count = len(self._document_terms)
+        average_length = self._total_length / document_count or 1.0
+        scores: Dict[str, float] = {}
+
+        for term in query_terms:
+            posting = self._postings[term]
+            document_frequency = len(posting)
+            idf = math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            for key, frequency in posting.items():
+                if key not in candidates:
+                    continue
+                length_norm = 1 - BM25_B + BM25_B * self._document_lengths[key] / average_length
+                scores[key] = scores.get(key, 0.0) + idf * frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * length_norm)
+
+        return top_k(scores.items(), limit, key=lambda item: (-item[1], item[0]))
+
+    def __len__(self) -> int:
+        """Retorna el número de entradas indexadas."""
+        return len(self._document_terms)
@@ -0,0 +1,162 @@
+"""
+Selección Acotada de los Mejores Resultados (top-k).
+
+Utilidades compartidas por las APIs con resultados ordenados: en lugar de
+ordenar todos los candidatos para quedarse con unos pocos, mantienen un
+montículo de tamaño k (o usan ``argpartition`` sobre arreglos de NumPy) y
+permiten terminar anticipadamente cuando una cota superior demuestra que
+ningún candidato restante puede entrar en el top-k.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import heapq
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def top_k(items: Iterable[T], k: int, key: Optional[Callable[[T], Any]] = None,
+          reverse: bool = False) -> List[T]:
+    """
+    Obtiene los k primeros elementos de un orden sin ordenar todos.
+
+    Equivale a ``sorted(items, key=key, reverse=reverse)[:k]``, incluida la
+    estabilidad ante empates, pero con un montículo de tamaño k.
+
+    Args:
+        items: Elementos a seleccionar
+        k: Número máximo de elementos
+        key: Función de clave de ordenación (opcional)
+        reverse: True para seleccionar los mayores
+
+    Returns:
+        Lista con los k primeros elementos en orden
+    """
+    if k <= 0:
+        return []
+    if reverse:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+def iter_sorted(items: Iterable[T], key: Callable[[T], Any]) -> Iterator[T]:
+    """
+    Recorre elementos en orden ascendente de clave de forma perezosa.
+
+    Construye un montículo en O(n) y solo paga O(log n) por cada elemento
+    consumido, por lo que conviene cuando el consumidor suele detenerse
+    antes del final. Los empates conservan el orden de entrada.
+
+    Args:
+        items: Elementos a recorrer
+        key: Función de clave de ordenación
+
+    Returns:
+        Iterador de los elementos en orden
+    """
+    heap = [(key(item), position, item) for position, item in enumerate(items)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+class TopK(Generic[T]):
+    """
+    Acumulador acotado de los k elementos de mayor puntuación.
+
+    Ante igual puntuación gana el elemento con menor desempate (por ejemplo,
+    el orden de inserción). Si los candidatos llegan ordenados por una cota
+    superior de su puntuación, ``accepts`` indica cuándo detener el recorrido.
+    """
+
+    def __init__(self, k: int) -> None:
+        """
+        Inicializa el acumulador vacío.
+
+        Args:
+            k: Número máximo de elementos a conservar
+        """
+        self.k = k
+        # Montículo de mínimos: (puntuación, -desempate, elemento)
+        self._heap: List[Tuple[float, int, T]] = []
+
+    @property
+    def is_full(self) -> bool:
+        """Indica si ya se conservan k elementos."""
+        return len(self._heap) >= self.k
+
+    def accepts(self, score: float) -> bool:
+        """
+        Indica si un elemento con la puntuación dada podría entrar en el top-k.
+
+        Args:
+            score: Puntuación (o cota superior de la puntuación) del candidato
+
+        Returns:
+            True si el candidato podría entrar
+        """
+        if self.k <= 0:
+            return False
+        return not self.is_full or score >= self._heap[0][0]
+
+    def push(self, score: float, tiebreak: int, item: T) -> None:
+        """
+        Ofrece un elemento al acumulador.
+
+        Args:
+            score: Puntuación del elemento
+            tiebreak: Desempate ante igual puntuación (menor es mejor)
+            item: Elemento a conservar
+        """
+        if self.k <= 0:
+            return
+        entry = (score, -tiebreak, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def results(self) -> List[Tuple[T, float]]:
+        """
+        Obtiene los elementos conservados.
+
+        Returns:
+            Lista de tuplas (elemento, puntuación) de mayor a menor puntuación
+            (empates por desempate ascendente)
+        """
+        ranked = sorted(self._heap, key=lambda entry: (entry[0], entry[1]), reverse=True)
+        return [(item, score) for score, _, item in ranked]
+
+    def __len__(self) -> int:
+        """Retorna el número de elementos conservados."""
+        return len(self._heap)
+
+
+def top_k_indices(scores: Any, k: int, tiebreak: Any) -> Any:
+    """
+    Obtiene las posiciones de las k mayores puntuaciones de un arreglo de NumPy.
+
+    Usa ``argpartition`` para acotar los candidatos al umbral del k-ésimo
+    mejor (conservando los empatados con él) y solo ordena ese subconjunto.
+
+    Args:
+        scores: Arreglo de puntuaciones
+        k: Número máximo de posiciones
+        tiebreak: Arreglo de desempates ante igual puntuación (menor es mejor)
+
+    Returns:
+        Arreglo de posiciones de mayor a menor puntuación
+    """
+    import numpy as np
+
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    candidates = np.arange(len(scores))
+    if len(scores) > k:
+        partitioned = np.argpartition(-scores, k - 1)[:k]
+        candidates = np.flatnonzero(scores >= scores[partitioned].min())
+
+    return candidates[np.lexsort((tiebreak[candidates], -scores[candidates]))][:k]
@@ -0,0 +1,364 @@
+"""
+Puntuación Difusa Vectorizada con NumPy.
+
+Codifica todas las claves de un idioma una sola vez en matrices de puntos
+de código (una por longitud de clave, por lo que no hay relleno) y calcula
+la similitud de Levenshtein o de Jaro-Winkler de la consulta contra todas
+las filas a la vez. Las longitudes cuya cota de similitud no alcanza el
+umbral se omiten. El top-k se obtiene con ``argpartition`` y los empates se
+resuelven por orden de inserción, igual que en la ruta de difflib.
+
+Se selecciona con ``DatabaseConfig.fuzzy_scorer`` ("levenshtein" o
+"jaro_winkler"); "difflib" mantiene ``SequenceMatcher`` con el índice de
+caracteres.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from database.fuzzy_index import DEFAULT_FUZZY_INDEX, FuzzyIndex
+from database.top_k import top_k_indices
+
+# Escorers disponibles para DatabaseConfig.fuzzy_scorer
+SCORER_DIFFLIB = "difflib"
+SCORER_LEVENSHTEIN = "levenshtein"
+SCORER_JARO_WINKLER = "jaro_winkler"
+AVAILABLE_SCORERS = (SCORER_DIFFLIB, SCORER_LEVENSHTEIN, SCORER_JARO_WINKLER)
+
+# Parámetros estándar de Winkler
+WINKLER_PREFIX_SCALE = 0.1
+WINKLER_MAX_PREFIX = 4
+WINKLER_BOOST_THRESHOLD = 0.7
+
+
+def levenshtein_similarity(first: str, second: str) -> float:
+    """
+    Similitud de Levenshtein escalar (implementación de referencia).
+
+    Args:
+        first: Primera cadena
+        second: Segunda cadena
+
+    Returns:
+        ``1 - distancia / max(len)`` entre 0.0 y 1.0
+    """
+    if not first and not second:
+        return 1.0
+
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, start=1):
+        current = [i]
+        for j, second_char in enumerate(second, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (first_char != second_char)))
+        previous = current
+
+    return 1.0 - previous[-1] / max(len(first), len(second))
+
+
+def jaro_winkler_similarity(first: str, second: str) -> float:
+    """
+    Similitud de Jaro-Winkler escalar (implementación de referencia).
+
+    Args:
+        first: Cadena de la consulta
+        second: Cadena de la clave
+
+    Returns:
+        Similitud entre 0.0 y 1.0
+    """
+    if not first and not second:
+        return 1.0
+    if not first or not second:
+        return 0.0
+
+    window = max(max(len(first), len(second)) // 2 - 1, 0)
+    second_matched = [False] * len(second)
+    first_matches: List[str] = []
+
+    for i, char in enumerate(first):
+        for j in range(max(0, i - window), min(len(second), i + window + 1)):
+            if not second_matched[j] and second[j] == char:
+                second_matched[j] = True
+                first_matches.append(char)
+                break
+
+    matches = len(first_matches)
+    if matches == 0:
+        return 0.0
+
+    second_matches = [char for char, matched in zip(second, second_matched) if matched]
+    transpositions = sum(a != b for a, b in zip(first_matches, second_matches)) / 2
+    jaro = (matches / len(first) + matches / len(second) + (matches - transpositions) / matches) / 3
+
+    if jaro <= WINKLER_BOOST_THRESHOLD:
+        return jaro
+
+    prefix = 0
+    for a, b in zip(first[:WINKLER_MAX_PREFIX], second[:WINKLER_MAX_PREFIX]):
+        if a != b:
+            break
+        prefix += 1
+
+    return jaro + prefix * WINKLER_PREFIX_SCALE * (1.0 - jaro)
+
+
+def _levenshtein_batch(query: str, codes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Similitud de Levenshtein de la consulta contra todas las filas.
+
+    Recorre los caracteres de la consulta en Python y cada fila de la
+    programación dinámica se calcula para todas las claves a la vez: el
+    término de inserción (dependencia hacia la izquierda) se resuelve con un
+    mínimo acumulado, ``d[j] = min_k<=j (t[k] + j - k)``.
+    """
+    rows, width = codes.shape
+    positions = np.arange(width + 1, dtype=np.int32)
+    previous = np.broadcast_to(positions, (rows, width + 1)).copy()
+
+    for i, char in enumerate(query, start=1):
+        substitution = previous[:, :-1] + (codes != ord(char))
+        deletion = previous[:, 1:] + 1
+        partial = np.empty_like(previous)
+        partial[:, 0] = i
+        partial[:, 1:] = np.minimum(substitution, deletion)
+        previous = np.minimum.accumulate(partial - positions, axis=1) + positions
+
+    distances = previous[np.arange(rows), lengths]
+    longest = np.maximum(lengths, len(query))
+    return np.where(longest > 0, 1.0 - distances / np.maximum(longest, 1), 1.0)
+
+
+def _jaro_winkler_batch(query: str, codes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Similitud de Jaro-Winkler de la consulta contra todas las filas.
+
+    El emparejamiento voraz de Jaro recorre los caracteres de la consulta en
+    Python y, para todas las claves a la vez, toma la primera posición libre
+    dentro de la ventana con el mismo carácter.
+    """
+    rows, width = codes.shape
+    query_length = len(query)
+    if query_length == 0:
+        return np.where(lengths == 0, 1.0, 0.0)
+
+    positions = np.arange(width)
+    windows = np.maximum(np.maximum(lengths, query_length) // 2 - 1, 0)
+    key_matched = np.zeros((rows, width), dtype=bool)
+    query_matched = np.zeros((rows, query_length), dtype=bool)
+    row_index = np.arange(rows)
+
+    for i, char in enumerate(query):
+        candidates = ((codes == ord(char)) & ~key_matched
+                      & (np.abs(positions - i) <= windows[:, None]))
+        found = candidates.any(axis=1)
+        first = candidates.argmax(axis=1)
+        key_matched[row_index[found], first[found]] = True
+        query_matched[found, i] = True
+
+    matches = query_matched.sum(axis=1)
+
+    # Caracteres emparejados en orden en la consulta y en cada clave
+    query_codes = np.broadcast_to(np.array([ord(char) for char in query]), (rows, query_length))
+    query_sequence = np.take_along_axis(
+        query_codes, np.argsort(~query_matched, axis=1, kind="stable"), axis=1)
+    key_sequence = np.take_along_axis(
+        codes, np.argsort(~key_matched, axis=1, kind="stable"), axis=1)
+    compared = min(query_length, width)
+    in_sequence = np.arange(compared) < matches[:, None]
+    transpositions = ((query_sequence[:, :compared] != key_sequence[:, :compared]) & in_sequence).sum(axis=1) / 2
+
+    safe_matches = np.maximum(matches, 1)
+    jaro = (matches / query_length + matches / np.maximum(lengths, 1)
+            + (matches - transpositions) / safe_matches) / 3
+    jaro = np.where(matches > 0, jaro, 0.0)
+
+    prefix_width = min(WINKLER_MAX_PREFIX, query_length, width)
+    prefix_equal = codes[:, :prefix_width] == query_codes[:, :prefix_width]
+    prefix = np.cumprod(prefix_equal, axis=1).sum(axis=1) if prefix_width else np.zeros(rows)
+
+    boosted = jaro + prefix * WINKLER_PREFIX_SCALE * (1.0 - jaro)
+    return np.where(jaro > WINKLER_BOOST_THRESHOLD, boosted, jaro)
+
+
+def _levenshtein_bound(query_length: int, key_length: int) -> float:
+    """Cota superior de Levenshtein: la diferencia de longitudes son ediciones obligatorias."""
+    longest = max(query_length, key_length)
+    return 1.0 - abs(query_length - key_length) / longest if longest else 1.0
+
+
+def _jaro_winkler_bound(query_length: int, key_length: int) -> float:
+    """Cota superior de Jaro-Winkler: como máximo ``min(longitudes)`` coincidencias sin transponer."""
+    if not query_length or not key_length:
+        return 1.0 if query_length == key_length else 0.0
+    matches = min(query_length, key_length)
+    jaro = (matches / query_length + matches / key_length + 1.0) / 3
+    if jaro <= WINKLER_BOOST_THRESHOLD:
+        return jaro
+    return jaro + WINKLER_MAX_PREFIX * WINKLER_PREFIX_SCALE * (1.0 - jaro)
+
+
+# Kernels vectorizados por escorer
+BATCH_SCORERS: Dict[str, Callable[[str, np.ndarray, np.ndarray], np.ndarray]] = {
+    SCORER_LEVENSHTEIN: _levenshtein_batch,
+    SCORER_JARO_WINKLER: _jaro_winkler_batch,
+}
+
+# Cotas de similitud por longitudes (consulta, clave) por escorer
+LENGTH_BOUNDS: Dict[str, Callable[[int, int], float]] = {
+    SCORER_LEVENSHTEIN: _levenshtein_bound,
+    SCORER_JARO_WINKLER: _jaro_winkler_bound,
+}
+
+# Implementaciones escalares de referencia por escorer
+REFERENCE_SCORERS: Dict[str, Callable[[str, str], float]] = {
+    SCORER_LEVENSHTEIN: levenshtein_similarity,
+    SCORER_JARO_WINKLER: jaro_winkler_similarity,
+}
+
+
+class VectorizedFuzzyIndex(FuzzyIndex):
+    """
+    Índice difuso que puntúa todas las claves a la vez con NumPy.
+
+    Las claves se agrupan por longitud y cada grupo se codifica en una matriz
+    ``(n, longitud)`` de puntos de código. Las modificaciones marcan las
+    matrices como desactualizadas y se recodifican en la siguiente consulta.
+    """
+
+    scorer = SCORER_LEVENSHTEIN
+
+    def __init__(self) -> None:
+        """Inicializa el índice vacío."""
+        super().__init__()
+        self._keys: List[str] = []
+        self._orders = np.empty(0, dtype=np.int64)
+        self._groups: List[Tuple[int, np.ndarray, np.ndarray]] = []  # (longitud, filas, códigos)
+        self._dirty = False
+
+    def add(self, key: str) -> None:
+        """Agrega una clave y marca las matrices como desactualizadas."""
+        if key not in self._order:
+            super().add(key)
+            self._dirty = True
+
+    def remove(self, key: str) -> None:
+        """Elimina una clave y marca las matrices como desactualizadas."""
+        if key in self._order:
+            super().remove(key)
+            self._dirty = True
+
+    def prepare(self) -> None:
+        """Codifica las matrices si hay claves pendientes."""
+        if self._dirty:
+            self._encode()
+
+    def _encode(self) -> None:
+        """Codifica las claves en una matriz de puntos de código por longitud."""
+        self._keys = list(self._order)
+        self._orders = np.array([self._order[key] for key in self._keys], dtype=np.int64)
+
+        rows_by_length: Dict[int, List[int]] = {}
+        for row, key in enumerate(self._keys):
+            rows_by_length.setdefault(len(key), []).append(row)
+
+        self._groups = []
+        for length, rows in sorted(rows_by_length.items()):
+            codes = np.array([[ord(char) for char in self._keys[row]] for row in rows],
+                             dtype=np.int32).reshape(len(rows), length)
+            self._groups.append((length, np.array(rows, dtype=np.int64), codes))
+
+        self._dirty = False
+
+    def scores(self, query: str, min_similarity: float = 0.0) -> np.ndarray:
+        """
+        Calcula la similitud de la consulta contra todas las claves.
+
+        Args:
+            query: Consulta normalizada
+            min_similarity: Las longitudes de clave cuya cota no alcanza este
+                            umbral no se puntúan y quedan con -1.0
+
+        Returns:
+            Arreglo de similitudes alineado con las claves en orden de inserción
+        """
+        self.prepare()
+
+        scores = np.full(len(self._keys), -1.0)
+        kernel = BATCH_SCORERS[self.scorer]
+        bound = LENGTH_BOUNDS[self.scorer]
+        for length, rows, codes in self._groups:
+            if bound(len(query), length) < min_similarity:
+                continue
+            scores[rows] = kernel(query, codes, np.full(len(rows), length, dtype=np.int64))
+        return scores
+
+    def candidates(self, query: str, min_similarity: float = 0.0) -> Iterator[Tuple[str, float]]:
+        """Genera las claves con su similitud exacta como cota, de mayor a menor."""
+        for key, similarity in self.top_matches(query, len(self), min_similarity):
+            yield key, similarity
+
+    def top_matches(self, query: str, max_results: int = 5,
+                    min_similarity: float = 0.3) -> List[Tuple[str, float]]:
+        """
+        Obtiene las claves más similares con ``top_k_indices`` (``argpartition``).
+
+        Args:
+            query: Consulta normalizada
+            max_results: Número máximo de resultados
+            min_similarity: Umbral mínimo de similitud (0.0 - 1.0)
+
+        Returns:
+            Lista de tuplas (clave, similitud) ordenada por similitud descendente
+            (empates en orden de inserción)
+        """
+        if max_results <= 0:
+            return []
+
+        scores = self.scores(query, min_similarity)
+        eligible = np.flatnonzero(scores >= min_similarity)
+        ranked = eligible[top_k_indices(scores[eligible], max_results, self._orders[eligible])]
+        return [(self._keys[row], float(scores[row])) for row in ranked]
+
+
+class LevenshteinFuzzyIndex(VectorizedFuzzyIndex):
+    """Índice vectorizado con similitud de Levenshtein normalizada."""
+
+    scorer = SCORER_LEVENSHTEIN
+
+
+class JaroWinklerFuzzyIndex(VectorizedFuzzyIndex):
+    """Índice vectorizado con similitud de Jaro-Winkler."""
+
+    scorer = SCORER_JARO_WINKLER
+
+
+# Índice difuso por escorer
+FUZZY_INDEXES_BY_SCORER: Dict[str, Callable[[], FuzzyIndex]] = {
+    SCORER_DIFFLIB: DEFAULT_FUZZY_INDEX,
+    SCORER_LEVENSHTEIN: LevenshteinFuzzyIndex,
+    SCORER_JARO_WINKLER: JaroWinklerFuzzyIndex,
+}
+
+
+def get_fuzzy_index_factory(scorer: Optional[str] = None) -> Callable[[], FuzzyIndex]:
+    """
+    Obtiene la fábrica del índice difuso para un escorer.
+
+    Args:
+        scorer: Nombre del escorer (por defecto, difflib)
+
+    Returns:
+        Clase del índice difuso
+
+    Raises:
+        ValueError: Si el escorer no existe
+    """
+    scorer = scorer or SCORER_DIFFLIB
+    if scorer not in FUZZY_INDEXES_BY_SCORER:
+        raise ValueError(f"Escorer difuso desconocido: {scorer}. Disponibles: {list(AVAILABLE_SCORERS)}")
+    return FUZZY_INDEXES_BY_SCORER[scorer]
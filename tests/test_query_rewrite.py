@@ -0,0 +1,67 @@
+"""
+Pruebas de la Reescritura de Consultas por Lemas y Sinónimos.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import pytest
+
+from core.benchmarks import NullSpeechEngine, NullVoiceRecognition
+from core.sign_processor import SharedResources, SignProcessor
+from database.lemma_index import get_lemma_terms, stem_term
+from database.signs_database import SignsDatabase
+
+
+@pytest.fixture(scope="module")
+def processor() -> SignProcessor:
+    """Procesador sobre la base de datos del proyecto, sin motores de voz."""
+    shared = SharedResources(SignsDatabase(), NullSpeechEngine(), NullVoiceRecognition())
+    return SignProcessor(shared)
+
+
+@pytest.mark.parametrize("query", [
+    "sol", "luna", "libro", "meta", "mesa", "mesas", "sena", "mar", "mares",
+])
+def test_unrelated_words_are_not_promoted_to_exact_match(processor: SignProcessor, query: str) -> None:
+    """Palabras que solo comparten letras con una seña no se reescriben a ella."""
+    result = processor.search_sign(query, include_similar=True)
+
+    assert not result.found
+    assert result.exact_match is None
+    assert result.rewrites == []
+
+
+@pytest.mark.parametrize("query, expected, kind", [
+    ("necesitando", "Necesitar", "lema"),
+    ("trabajadores", "Trabajador", "lema"),
+    ("hermanos", "Hermano", "lema"),
+    ("seña", "Señas", "lema"),
+    ("papá", "Padre", "sinónimo"),
+    ("maridos", "Esposo", "sinónimo"),
+])
+def test_inflections_and_synonyms_are_rewritten(processor: SignProcessor, query: str,
+                                                expected: str, kind: str) -> None:
+    """Las formas flexionadas y los sinónimos encuentran la seña."""
+    result = processor.search_sign(query, include_similar=True)
+
+    assert result.found
+    assert result.exact_match.word == expected
+    assert [rewrite.kind for rewrite in result.rewrites] == [kind]
+
+
+def test_exact_only_search_does_not_rewrite(processor: SignProcessor) -> None:
+    """Con include_similar=False solo cuenta la coincidencia exacta."""
+    result = processor.search_sign("necesitando", include_similar=False)
+
+    assert not result.found
+    assert result.rewrites == []
+
+
+def test_stemmer_keeps_short_stems_and_ene() -> None:
+    """El lematizador no deja raíces cortas ni pliega la ñ."""
+    assert stem_term("sol") == "sol"
+    assert stem_term("meter") == "meter"
+    assert stem_term("marido") == "marido"
+    assert stem_term("necesitando") == "necesit"
+    assert get_lemma_terms("¿Señas (Costa)?") == ["señas"]
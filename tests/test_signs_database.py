@@ -0,0 +1,77 @@
+"""
+Pruebas de la Base de Datos de Señas en Memoria.
+
+Autor: Signify Team
+Versión: 2.0.0
+"""
+
+import threading
+from typing import List
+
+import pytest
+
+from database.signs_database import SignsDatabase
+
+
+@pytest.fixture
+def database() -> SignsDatabase:
+    """Base de datos cargada desde los CSV del proyecto."""
+    return SignsDatabase()
+
+
+def test_update_keeps_position_in_category(database: SignsDatabase) -> None:
+    """Actualizar una seña sin cambiar de categoría no la mueve dentro de ella."""
+    before = [sign.word for sign in database.search_by_category("General", max_results=100)]
+    assert len(before) >= 3
+
+    first = database.search_exact(before[0])
+    database.add_sign(first.word, first.instructions + " (editada)", first.category)
+
+    after = [sign.word for sign in database.search_by_category("General", max_results=100)]
+    assert after == before
+
+
+def test_update_moves_sign_to_new_category(database: SignsDatabase) -> None:
+    """Cambiar la categoría de una seña la saca de la anterior."""
+    word = database.search_by_category("General", max_results=1)[0].word
+    database.add_sign(word, "Instrucciones nuevas", "Pruebas")
+
+    assert word not in [sign.word for sign in database.search_by_category("General", max_results=500)]
+    assert [sign.word for sign in database.search_by_category("Pruebas")] == [word]
+
+
+def test_concurrent_reads_during_edits(database: SignsDatabase) -> None:
+    """Las lecturas sin candado no fallan mientras otro hilo inserta y elimina señas."""
+    errors: List[BaseException] = []
+    stop = threading.Event()
+
+    def read(operation) -> None:
+        while not stop.is_set():
+            try:
+                operation()
+            except Exception as e:  # pragma: no cover - se reporta abajo
+                errors.append(e)
+
+    readers = [
+        threading.Thread(target=read, args=(lambda: database.search_fuzzy("palabra1"),)),
+        threading.Thread(target=read, args=(lambda: database.search_partial("alabra"),)),
+        threading.Thread(target=read, args=(lambda: database.autocomplete("pal"),)),
+        threading.Thread(target=read, args=(lambda: database.get_signs_by_keywords(["palabra", "mano"]),)),
+        threading.Thread(target=read, args=(database.get_common_words,)),
+    ]
+    for reader in readers:
+        reader.start()
+
+    for index in range(12):
+        database.add_sign(f"Palabra{index}", f"Instrucción de prueba {index}", "Pruebas")
+        if index >= 5:
+            assert database.remove_sign(f"Palabra{index - 5}")
+
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert not errors, f"{len(errors)} errores de lectura, el primero: {errors[0]!r}"
+    assert [sign.word for sign in database.search_by_category("Pruebas")] == [
+        f"Palabra{index}" for index in range(7, 12)
+    ]
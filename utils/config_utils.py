@@ -45,6 +45,11 @@ class AudioConfig:
         tts_volume: Volumen de síntesis de voz
         whisper_model: Modelo de Whisper a usar
         audio_device_index: Índice del dispositivo de audio
+        tts_cache_enabled: Si guardar en disco el audio sintetizado para reutilizarlo
+        tts_cache_max_mb: Tamaño máximo de la caché de audio en MB
+        tts_cache_max_age_days: Días sin uso tras los que caduca un audio (0 sin caducidad)
+        tts_backend: Motor de síntesis de voz (gtts, pyttsx3 o stub)
+        speech_queue_timeout: Segundos que un enunciado espera sitio en la cola de voz llena
     """
     tts_enabled: bool = True
     voice_recognition_enabled: bool = True
@@ -57,6 +62,11 @@ class AudioConfig:
     tts_volume: float = DEFAULT_TTS_VOLUME
     whisper_model: str = "base"
     audio_device_index: Optional[int] = None
+    tts_cache_enabled: bool = True
+    tts_cache_max_mb: int = 200
+    tts_cache_max_age_days: int = 30
+    tts_backend: str = "gtts"
+    speech_queue_timeout: float = 1.0
     
     def __post_init__(self) -> None:
         """Valida la configuración después de la inicialización."""
@@ -88,6 +98,19 @@ class AudioConfig:
         valid_models = ["tiny", "base", "small", "medium", "large"]
         if self.whisper_model not in valid_models:
             raise ValueError(f"whisper_model debe ser uno de {valid_models}, recibido: {self.whisper_model}")
+        
+        if not 1 <= self.tts_cache_max_mb <= 10000:
+            raise ValueError(f"tts_cache_max_mb debe estar entre 1 y 10000, recibido: {self.tts_cache_max_mb}")
+        
+        if not 0 <= self.tts_cache_max_age_days <= 3650:
+            raise ValueError(f"tts_cache_max_age_days debe estar entre 0 y 3650, recibido: {self.tts_cache_max_age_days}")
+        
+        valid_tts_backends = ["gtts", "pyttsx3", "stub"]
+        if self.tts_backend not in valid_tts_backends:
+            raise ValueError(f"tts_backend debe ser uno de {valid_tts_backends}, recibido: {self.tts_backend}")
+        
+        if not 0.0 <= self.speech_queue_timeout <= 30.0:
+            raise ValueError(f"speech_queue_timeout debe estar entre 0.0 y 30.0, recibido: {self.speech_queue_timeout}")
 
 
 @dataclass
@@ -141,18 +164,30 @@ class DatabaseConfig:
         csv_file_path: Ruta del archivo CSV
         auto_reload: Si recargar automáticamente la base de datos
         cache_enabled: Si habilitar caché de búsquedas
+        cache_max_entries: Número máximo de búsquedas en caché (LRU)
+        cache_ttl: Segundos de vigencia de una búsqueda en caché (0 sin caducidad)
+        search_history_size: Número máximo de búsquedas conservadas en el historial
         fuzzy_search_threshold: Umbral para búsqueda difusa
         max_search_results: Número máximo de resultados de búsqueda
         enable_partial_search: Si habilitar búsqueda parcial
         search_timeout: Tiempo límite para búsquedas
+        backend: Backend de almacenamiento ("memory" o "sqlite")
+        sqlite_path: Ruta del archivo SQLite (por defecto en el directorio de datos)
+        fuzzy_scorer: Puntuación difusa ("difflib", "levenshtein" o "jaro_winkler")
     """
     csv_file_path: Optional[str] = None
     auto_reload: bool = True
     cache_enabled: bool = True
+    cache_max_entries: int = 512
+    cache_ttl: float = 300.0
+    search_history_size: int = 1000
     fuzzy_search_threshold: float = 0.6
     max_search_results: int = 50
     enable_partial_search: bool = True
     search_timeout: float = 5.0
+    backend: str = "memory"
+    sqlite_path: Optional[str] = None
+    fuzzy_scorer: str = "difflib"
     
     def __post_init__(self) -> None:
         """Valida la configuración después de la inicialización."""
@@ -168,6 +203,23 @@ class DatabaseConfig:
         
         if not 0.1 <= self.search_timeout <= 60.0:
             raise ValueError(f"search_timeout debe estar entre 0.1 y 60.0, recibido: {self.search_timeout}")
+        
+        if not 1 <= self.cache_max_entries <= 100000:
+            raise ValueError(f"cache_max_entries debe estar entre 1 y 100000, recibido: {self.cache_max_entries}")
+        
+        if self.cache_ttl < 0.0:
+            raise ValueError(f"cache_ttl no puede ser negativo, recibido: {self.cache_ttl}")
+        
+        if not 1 <= self.search_history_size <= 1000000:
+            raise ValueError(f"search_history_size debe estar entre 1 y 1000000, recibido: {self.search_history_size}")
+        
+        valid_backends = ["memory", "sqlite"]
+        if self.backend not in valid_backends:
+            raise ValueError(f"backend debe ser uno de {valid_backends}, recibido: {self.backend}")
+        
+        valid_scorers = ["difflib", "levenshtein", "jaro_winkler"]
+        if self.fuzzy_scorer not in valid_scorers:
+            raise ValueError(f"fuzzy_scorer debe ser uno de {valid_scorers}, recibido: {self.fuzzy_scorer}")
 
 
 @dataclass
@@ -183,6 +235,8 @@ class SystemConfig:
         enable_telemetry: Si habilitar telemetría
         auto_update_check: Si verificar actualizaciones automáticamente
         performance_monitoring: Si habilitar monitoreo de rendimiento
+        trace_exporter: Exportador de latencias con monitoreo activo ("jsonl" o "prometheus")
+        trace_export_path: Ruta del archivo exportado (por defecto en el directorio de logs)
     """
     debug_mode: bool = False
     log_level: str = "INFO"
@@ -191,6 +245,8 @@ class SystemConfig:
     enable_telemetry: bool = False
     auto_update_check: bool = True
     performance_monitoring: bool = False
+    trace_exporter: str = "jsonl"
+    trace_export_path: Optional[str] = None
     
     def __post_init__(self) -> None:
         """Valida la configuración después de la inicialización."""
@@ -207,6 +263,10 @@ class SystemConfig:
         
         if not 64 <= self.max_memory_usage_mb <= 4096:
             raise ValueError(f"max_memory_usage_mb debe estar entre 64 y 4096, recibido: {self.max_memory_usage_mb}")
+        
+        valid_exporters = ["jsonl", "prometheus"]
+        if self.trace_exporter not in valid_exporters:
+            raise ValueError(f"trace_exporter debe ser uno de {valid_exporters}, recibido: {self.trace_exporter}")
 
 
 @dataclass
@@ -472,7 +532,10 @@ def create_sample_config(output_path: Optional[Union[str, Path]] = None) -> Path
         'audio': {
             'whisper_model': 'Opciones: tiny, base, small, medium, large',
             'sample_rate': 'Frecuencia de muestreo en Hz (8000-48000)',
-            'tts_rate': 'Velocidad de síntesis de voz (50-400 palabras por minuto)'
+            'tts_rate': 'Velocidad de síntesis de voz (50-400 palabras por minuto)',
+            'tts_cache_max_mb': 'Tamaño máximo de la caché de audio sintetizado en MB (1-10000)',
+            'tts_backend': 'Opciones: gtts (requiere red), pyttsx3 (local), stub (tono de prueba)',
+            'speech_queue_timeout': 'Segundos de espera con la cola de voz llena antes de descartar (0.0-30.0)'
         },
         'ui': {
             'theme': 'Opciones: light, dark, auto',